@@ -10,6 +10,45 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Páginas da aplicação, endereçáveis pela URL com ?page=<slug>
+PAGES = {
+    "home": "🏠 Home",
+    "sobre": "👤 Sobre",
+    "projetos": "💼 Projetos",
+    "contato": "📧 Contato"
+}
+
+TECH_OPTIONS = ["Python", "Streamlit", "Machine Learning", "Web Development"]
+YEAR_OPTIONS = ["Todos", "2024", "2023", "2022"]
+
+def init_state_from_query_params():
+    """Aplica página e filtros vindos da URL (deep link) antes de criar os widgets"""
+    params = st.query_params
+    
+    page = PAGES.get(params.get("page", ""))
+    if page and "navigation_select" not in st.session_state:
+        st.session_state.navigation_select = page
+    
+    if page != PAGES["projetos"]:
+        return
+    
+    tech = [t for t in params.get_all("tech") if t in TECH_OPTIONS]
+    if tech and "tech_filter" not in st.session_state:
+        st.session_state.tech_filter = tech
+    
+    year = params.get("year")
+    if year in YEAR_OPTIONS and "year_filter" not in st.session_state:
+        st.session_state.year_filter = year
+
+def sync_query_params(**values):
+    """Mantém a URL em sincronia com o estado; None remove o parâmetro"""
+    for key, value in values.items():
+        if value in (None, [], "Todos"):
+            if key in st.query_params:
+                del st.query_params[key]
+        elif st.query_params.get_all(key) != (value if isinstance(value, list) else [value]):
+            st.query_params[key] = value
+
 def load_css():
     """Carrega CSS personalizado"""
     st.markdown("""
@@ -37,15 +76,22 @@ def load_css():
 
 def main():
     load_css()
+    init_state_from_query_params()
     
     # Sidebar para navegação
     st.sidebar.title("Navegação")
     page = st.sidebar.selectbox(
         "Selecione uma página:",
-        ["🏠 Home", "👤 Sobre", "💼 Projetos", "📧 Contato"],
+        list(PAGES.values()),
         key="navigation_select"
     )
     
+    slug = next(slug for slug, label in PAGES.items() if label == page)
+    if page == PAGES["projetos"]:
+        sync_query_params(page=slug)
+    else:
+        sync_query_params(page=slug, tech=None, year=None)
+    
     # Roteamento de páginas
     if page == "🏠 Home":
         show_home()
@@ -135,17 +181,19 @@ def show_projects():
     with col1:
         tech_filter = st.multiselect(
             "Filtrar por tecnologia:",
-            ["Python", "Streamlit", "Machine Learning", "Web Development"],
+            TECH_OPTIONS,
             key="tech_filter"
         )
     
     with col2:
         year_filter = st.selectbox(
             "Filtrar por ano:",
-            ["Todos", "2024", "2023", "2022"],
+            YEAR_OPTIONS,
             key="year_filter"
         )
     
+    sync_query_params(tech=tech_filter, year=year_filter)
+    
     # Projetos
     projects = [
         {
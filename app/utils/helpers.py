@@ -1,24 +1,166 @@
 """Utilitários auxiliares para os testes E2E"""
 
-import time
-import os
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+from app.utils.screenshots import get_screenshot_writer
+
+# Observador injetado na página: acompanha o atributo data-test-script-state
+# do stApp e resolve o execute_async_script quando o rerun termina, sem
+# polling pelo WebDriver.
+RERUN_WAIT_SCRIPT = """
+const [since, selector, timeoutMs, graceMs] = arguments;
+const done = arguments[arguments.length - 1];
+const IDLE = ["notRunning", "compilationError"];
+
+function appIdle() {
+    const app = document.querySelector("[data-testid='stApp']");
+    if (!app || !IDLE.includes(app.getAttribute("data-test-script-state"))) return false;
+    const connection = app.getAttribute("data-test-connection-state");
+    if (connection && connection !== "CONNECTED") return false;
+    if (document.querySelector("[data-testid='stSpinner'], .stSpinner, [data-stale='true']")) return false;
+    return true;
+}
+
+let state = window.__e2eRerun;
+if (!state) {
+    state = window.__e2eRerun = {runs: 0, waiters: new Set()};
+    state.observer = new MutationObserver((records) => {
+        for (const record of records) {
+            if (record.attributeName === "data-test-script-state"
+                    && !IDLE.includes(record.oldValue)
+                    && IDLE.includes(record.target.getAttribute("data-test-script-state"))) {
+                state.runs += 1;
+            }
+        }
+        state.waiters.forEach((check) => check());
+    });
+    state.observer.observe(document.documentElement, {
+        subtree: true, childList: true, attributes: true, attributeOldValue: true,
+        attributeFilter: ["data-test-script-state", "data-test-connection-state", "data-stale", "class"]
+    });
+}
+
+let timer = null;
+let graceTimer = null;
+function finish(idle) {
+    state.waiters.delete(onMutation);
+    clearTimeout(timer);
+    clearTimeout(graceTimer);
+    done({idle: idle, runs: state.runs});
+}
+function check(quiet) {
+    if (!appIdle() || (selector && !document.querySelector(selector))) return;
+    if (since === null || state.runs > since || quiet) finish(true);
+}
+function onMutation() {
+    // A janela de graça (opcional) só começa quando a página reage à interação
+    // e recomeça a cada mudança; o início do rerun também é uma mudança
+    if (graceMs !== null && since !== null && state.runs <= since) {
+        clearTimeout(graceTimer);
+        graceTimer = setTimeout(() => check(true), graceMs);
+    }
+    check(false);
+}
+
+state.waiters.add(onMutation);
+timer = setTimeout(() => finish(false), timeoutMs);
+check(false);
+"""
+
+RERUN_COUNT_SCRIPT = "return window.__e2eRerun ? window.__e2eRerun.runs : 0;"
+
+# Coleta visibilidade, retângulo, texto e atributos de vários seletores de uma
+# só vez; cada entrada da spec pode ter "children" avaliados dentro de cada
+# elemento encontrado.
+DOM_SNAPSHOT_SCRIPT = """
+function visible(el) {
+    if (el.checkVisibility) {
+        return el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true});
+    }
+    const style = window.getComputedStyle(el);
+    const rect = el.getBoundingClientRect();
+    return style.display !== "none" && style.visibility !== "hidden"
+        && style.opacity !== "0" && rect.width > 0 && rect.height > 0;
+}
+
+function describe(el, spec) {
+    const info = {};
+    if (spec.visible) info.visible = visible(el);
+    if (spec.rect) {
+        const r = el.getBoundingClientRect();
+        info.rect = {x: r.x, y: r.y, width: r.width, height: r.height};
+    }
+    if (spec.text) info.text = el.innerText;
+    if (spec.attributes.length) {
+        info.attributes = {};
+        for (const name of spec.attributes) info.attributes[name] = el.getAttribute(name);
+    }
+    if (spec.children) info.children = collect(el, spec.children);
+    return info;
+}
+
+function collect(root, specs) {
+    const result = {};
+    for (const [name, spec] of Object.entries(specs)) {
+        result[name] = Array.from(root.querySelectorAll(spec.selector), (el) => describe(el, spec));
+    }
+    return result;
+}
+
+return collect(document, arguments[0]);
+"""
+
+SNAPSHOT_PROPERTIES = ("visible", "rect", "text")
+
 class TestUtils:
     """Classe com utilitários para testes"""
     
     @staticmethod
     def take_screenshot(driver, name):
-        """Captura screenshot para debugging"""
-        if not os.path.exists("screenshots"):
-            os.makedirs("screenshots")
+        """Captura screenshot para debugging
         
-        timestamp = int(time.time())
-        filename = f"screenshots/{name}_{timestamp}.png"
-        driver.save_screenshot(filename)
-        return filename
+        Só a captura acontece na thread do teste; compressão e gravação ficam
+        com o ScreenshotWriter em segundo plano. Retorna o caminho do arquivo:
+        o já gravado, se a página for idêntica a uma captura recente, e None
+        se a fila estiver cheia.
+        """
+        return get_screenshot_writer().submit(name, driver.get_screenshot_as_png())
+    
+    @staticmethod
+    def dom_snapshot(driver, selectors, properties=SNAPSHOT_PROPERTIES, attributes=()):
+        """Inspeciona vários seletores com um único execute_script
+        
+        `selectors` mapeia nome -> seletor CSS, ou nome -> dict com "selector" e,
+        opcionalmente, "properties", "attributes" e "children" (mesmo formato,
+        avaliado dentro de cada elemento). Retorna nome -> lista de dicts com
+        visible, rect, text e attributes.
+        """
+        return driver.execute_script(
+            DOM_SNAPSHOT_SCRIPT, TestUtils._snapshot_spec(selectors, properties, attributes)
+        )
+    
+    @staticmethod
+    def _snapshot_spec(selectors, properties, attributes):
+        """Normaliza a spec do dom_snapshot para o formato esperado pelo script"""
+        spec = {}
+        for name, entry in selectors.items():
+            if isinstance(entry, str):
+                entry = {"selector": entry}
+            entry_properties = entry.get("properties", properties)
+            spec[name] = {
+                "selector": entry["selector"],
+                "visible": "visible" in entry_properties,
+                "rect": "rect" in entry_properties,
+                "text": "text" in entry_properties,
+                "attributes": list(entry.get("attributes", attributes)),
+            }
+            if entry.get("children"):
+                spec[name]["children"] = TestUtils._snapshot_spec(
+                    entry["children"], properties, attributes
+                )
+        return spec
     
     @staticmethod
     def wait_for_element_text(driver, locator, expected_text, timeout=10):
@@ -35,12 +177,23 @@ class TestUtils:
     @staticmethod
     def scroll_to_element(driver, element):
         """Faz scroll até o elemento"""
-        driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)  # Pequena pausa para o scroll
+        # Scroll instantâneo; o callback só roda após o próximo frame renderizado
+        driver.execute_async_script(
+            "arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});"
+            "requestAnimationFrame(() => arguments[arguments.length - 1]());",
+            element
+        )
     
     @staticmethod
     def get_console_logs(driver):
-        """Obtém logs do console do browser"""
+        """Obtém logs do console do browser
+        
+        Usa o buffer alimentado por eventos quando a captura contínua está ativa
+        (sem round trip ao WebDriver); caso contrário, drena o log do Chrome.
+        """
+        buffer = getattr(driver, "console_buffer", None)
+        if buffer is not None:
+            return buffer.snapshot()
         return driver.get_log('browser')
     
     @staticmethod
@@ -49,15 +202,28 @@ class TestUtils:
         error_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='stException']")
         return len(error_elements) == 0
     
+    @staticmethod
+    def arm_rerun(driver):
+        """Retorna o contador de reruns atual, para usar antes de uma interação"""
+        return driver.execute_script(RERUN_COUNT_SCRIPT)
+    
+    @staticmethod
+    def wait_for_rerun(driver, since=None, selector=None, timeout=10, grace=None):
+        """Bloqueia em um único execute_async_script até o rerun do Streamlit terminar
+        
+        Com `since` (valor de arm_rerun), aguarda um rerun posterior à interação.
+        Para interações que podem não disparar rerun, `grace` (segundos) encerra a
+        espera quando a página reage e fica esse tempo sem mudanças nem rerun.
+        """
+        grace_ms = int(grace * 1000) if grace is not None else None
+        result = driver.execute_async_script(
+            RERUN_WAIT_SCRIPT, since, selector, int(timeout * 1000), grace_ms
+        )
+        if not result or not result["idle"]:
+            raise TimeoutException(f"Streamlit não concluiu o rerun em {timeout}s")
+        return result["runs"]
+    
     @staticmethod
     def wait_for_stable_page(driver, timeout=10):
         """Aguarda página estabilizar (útil para Streamlit)"""
-        from selenium.webdriver.support.ui import WebDriverWait
-        
-        def page_stable(driver):
-            # Verifica se não há elementos de loading
-            loading_elements = driver.find_elements(By.CSS_SELECTOR, ".stSpinner")
-            return len(loading_elements) == 0
-        
-        wait = WebDriverWait(driver, timeout)
-        return wait.until(page_stable)
\ No newline at end of file
+        return TestUtils.wait_for_rerun(driver, timeout=timeout)
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""Gravação assíncrona de screenshots com descarte de quadros repetidos"""
+
+import atexit
+import hashlib
+import io
+import itertools
+import os
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from PIL import Image
+
+DEFAULT_DIRECTORY = "screenshots"
+
+
+def safe_name(text):
+    """Converte um nodeid do pytest em um nome de arquivo seguro"""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", text).strip("_")
+
+
+class ScreenshotWriter:
+    """Comprime e grava screenshots em uma thread de fundo
+
+    A fila é limitada: se estiver cheia, o quadro é descartado em vez de
+    bloquear o teste. Um quadro idêntico (mesmo SHA-256 do PNG) a um dos
+    últimos enfileirados não é gravado de novo: submit() já retorna o caminho
+    do arquivo existente, que é o que vai para o relatório.
+    """
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_queue=32, history=16, compress_level=6):
+        self.directory = directory
+        self.history = history
+        self.compress_level = compress_level
+        self.written = 0
+        self.duplicates = 0
+        self.dropped = 0
+        self.errors = 0
+        self._recent = OrderedDict()
+        self._counter = itertools.count()
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, name, png_bytes):
+        """Enfileira o PNG e retorna o caminho onde ele será gravado
+
+        Para um quadro repetido, retorna o caminho do arquivo já gravado (ou
+        enfileirado) com o mesmo conteúdo.
+        """
+        self._ensure_started()
+        digest = hashlib.sha256(png_bytes).digest()
+        with self._lock:
+            previous = self._recent.get(digest)
+            if previous is not None:
+                self._recent.move_to_end(digest)
+                self.duplicates += 1
+                return previous
+            filename = os.path.join(
+                self.directory, f"{name}_{time.strftime('%Y%m%d_%H%M%S')}_{next(self._counter)}.png"
+            )
+            try:
+                self._queue.put_nowait((filename, png_bytes, digest))
+            except queue.Full:
+                self.dropped += 1
+                return None
+            self._recent[digest] = filename
+            while len(self._recent) > self.history:
+                self._recent.popitem(last=False)
+        return filename
+
+    def flush(self):
+        """Aguarda a fila esvaziar"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Esvazia a fila e encerra a thread de gravação"""
+        if self._thread is None:
+            return
+        self._queue.put((None, None, None))
+        self._thread.join()
+        self._thread = None
+
+    def stats(self):
+        return {
+            "written": self.written,
+            "duplicates": self.duplicates,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._thread = threading.Thread(
+                    target=self._run, name="screenshot-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            filename, png_bytes, digest = self._queue.get()
+            try:
+                if filename is None:
+                    return
+                self._write(filename, png_bytes)
+            except OSError:
+                # PNG inválido ou falha de disco: não derruba a thread nem serve de destino para repetidos
+                self.errors += 1
+                with self._lock:
+                    if self._recent.get(digest) == filename:
+                        del self._recent[digest]
+            finally:
+                self._queue.task_done()
+
+    def _write(self, filename, png_bytes):
+        image = Image.open(io.BytesIO(png_bytes))
+        image.load()
+        image.save(filename, format="PNG", compress_level=self.compress_level)
+        self.written += 1
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_screenshot_writer(create=True):
+    """Writer compartilhado pelo processo, encerrado automaticamente na saída"""
+    global _writer
+    with _writer_lock:
+        if _writer is None and create:
+            _writer = ScreenshotWriter()
+            atexit.register(_writer.close)
+        return _writer
@@ -0,0 +1 @@
+"""Componentes do dashboard de testes (streamlit_app.py)"""
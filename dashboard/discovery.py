@@ -0,0 +1,295 @@
+"""Descoberta dos testes por AST, sem importar os módulos nem rodar a coleta do pytest
+
+Os casos de `pytest.mark.parametrize` são expandidos avaliando as listas de
+parâmetros: literais, constantes do próprio módulo ou importadas de outro
+módulo do repositório e list comprehensions simples sobre elas. O resultado
+de cada arquivo fica em cache, chaveado por mtime e hash do arquivo e dos
+módulos de onde vieram as constantes.
+"""
+
+import ast
+import hashlib
+import itertools
+import json
+import os
+import threading
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_TEST_DIR = "tests/test_e2e"
+DEFAULT_CACHE_PATH = REPO_ROOT / ".pytest_cache" / "d" / "e2e-discovery.json"
+CACHE_VERSION = 1
+
+
+class Unresolved(Exception):
+    """Expressão que a avaliação estática não cobre"""
+
+
+def file_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _is_parametrize(node):
+    """`@pytest.mark.parametrize(...)` ou `@mark.parametrize(...)`"""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "parametrize"
+    )
+
+
+def _is_param(node):
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "param"
+    )
+
+
+class _Evaluator:
+    """Avaliação restrita de expressões com as constantes conhecidas"""
+
+    def __init__(self, names):
+        self.names = names
+
+    def __call__(self, node, scope=None):
+        scope = scope or {}
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            if node.id in scope:
+                return scope[node.id]
+            if node.id in self.names:
+                return self.names[node.id]
+            raise Unresolved(node.id)
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            return [self(element, scope) for element in node.elts]
+        if isinstance(node, ast.Dict):
+            return {self(k, scope): self(v, scope) for k, v in zip(node.keys, node.values)}
+        if isinstance(node, ast.Subscript):
+            return self(node.value, scope)[self(node.slice, scope)]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return -self(node.operand, scope)
+        if isinstance(node, (ast.ListComp, ast.GeneratorExp)) and len(node.generators) == 1:
+            generator = node.generators[0]
+            if not isinstance(generator.target, ast.Name):
+                raise Unresolved("comprehension")
+            values = []
+            for item in self(generator.iter, scope):
+                inner = {**scope, generator.target.id: item}
+                if all(self(condition, inner) for condition in generator.ifs):
+                    values.append(self(node.elt, inner))
+            return values
+        if isinstance(node, ast.Compare) and len(node.ops) == 1:
+            left, right = self(node.left, scope), self(node.comparators[0], scope)
+            operations = {ast.Eq: left == right, ast.NotEq: left != right}
+            if type(node.ops[0]) in operations:
+                return operations[type(node.ops[0])]
+        if _is_param(node):
+            # pytest.param(*valores, id=...): valor marcado com o id explícito
+            values = [self(arg, scope) for arg in node.args]
+            ids = {kw.arg: self(kw.value, scope) for kw in node.keywords if kw.arg == "id"}
+            return _Param(values, ids.get("id"))
+        raise Unresolved(type(node).__name__)
+
+
+class _Param:
+    def __init__(self, values, id):
+        self.values = values
+        self.id = id
+
+
+def _default_id(value, argname, index):
+    """Mesma regra do pytest para ids não informados"""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return str(value)
+    return f"{argname}{index}"
+
+
+def parametrize_ids(call, evaluate):
+    """Ids dos casos de um decorator parametrize; None se não der para avaliar"""
+    args = {index: arg for index, arg in enumerate(call.args)}
+    keywords = {kw.arg: kw.value for kw in call.keywords}
+    try:
+        argnames = evaluate(args.get(0, keywords.get("argnames")))
+        argvalues = evaluate(args.get(1, keywords.get("argvalues")))
+    except (Unresolved, KeyError, IndexError, TypeError):
+        return None
+    if isinstance(argnames, str):
+        argnames = [name.strip() for name in argnames.split(",") if name.strip()]
+
+    explicit = None
+    if "ids" in keywords:
+        try:
+            explicit = evaluate(keywords["ids"])
+        except (Unresolved, KeyError, IndexError, TypeError):
+            explicit = None  # ex.: função geradora de ids
+
+    ids = []
+    for index, value in enumerate(argvalues):
+        if isinstance(value, _Param):
+            if value.id is not None:
+                ids.append(str(value.id))
+                continue
+            value = value.values if len(argnames) > 1 else value.values[0]
+        if explicit is not None and index < len(explicit) and explicit[index] is not None:
+            ids.append(str(explicit[index]))
+        elif len(argnames) == 1:
+            ids.append(_default_id(value, argnames[0], index))
+        else:
+            ids.append("-".join(
+                _default_id(element, name, index) for element, name in zip(value, argnames)
+            ))
+    return ids
+
+
+def expand(name, decorators, evaluate):
+    """Nomes dos casos; o parametrize mais próximo da função vem primeiro no id"""
+    cases = []
+    for decorator in reversed(decorators):
+        if _is_parametrize(decorator):
+            ids = parametrize_ids(decorator, evaluate)
+            if ids is None:
+                return [f"{name}[?]"]
+            cases.append(ids)
+    if not cases:
+        return [name]
+    return [f"{name}[{'-'.join(combination)}]" for combination in itertools.product(*cases)]
+
+
+class SuiteDiscovery:
+    """Estrutura dos testes de um diretório, reprocessando só os arquivos alterados"""
+
+    def __init__(self, root=REPO_ROOT, cache_path=DEFAULT_CACHE_PATH):
+        self.root = Path(root)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.entries = self._load_cache()
+        self.parsed = 0
+        self._lock = threading.Lock()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+            return cache["files"] if cache.get("version") == CACHE_VERSION else {}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "files": self.entries}), encoding="utf-8")
+        os.replace(tmp, self.cache_path)
+
+    def _fresh(self, fingerprints):
+        """Arquivos inalterados: mesmo mtime ou, se o mtime mudou, mesmo hash"""
+        for relative, (mtime, digest) in fingerprints.items():
+            path = self.root / relative
+            try:
+                current = path.stat().st_mtime_ns
+            except OSError:
+                return False
+            if current == mtime:
+                continue
+            if file_hash(path) != digest:
+                return False
+            fingerprints[relative] = [current, digest]
+        return True
+
+    def _fingerprint(self, relative):
+        path = self.root / relative
+        return [path.stat().st_mtime_ns, file_hash(path)]
+
+    def discover(self, test_dir=DEFAULT_TEST_DIR):
+        """{arquivo: {"description", "tests"}} dos test_*.py de `test_dir`"""
+        with self._lock:
+            return self._discover(test_dir)
+
+    def _discover(self, test_dir):
+        structure = {}
+        changed = False
+        for path in sorted((self.root / test_dir).glob("test_*.py")):
+            relative = path.relative_to(self.root).as_posix()
+            entry = self.entries.get(relative)
+            if entry is None or not self._fresh(entry["files"]):
+                entry = self._parse(relative)
+                self.entries[relative] = entry
+                changed = True
+            structure[path.name] = {"description": entry["description"], "tests": entry["tests"]}
+        if changed:
+            self._save_cache()
+        return structure
+
+    def _module_constants(self, tree):
+        names = {}
+        evaluate = _Evaluator(names)
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 \
+                    and isinstance(node.targets[0], ast.Name):
+                try:
+                    names[node.targets[0].id] = evaluate(node.value)
+                except (Unresolved, KeyError, IndexError, TypeError):
+                    pass
+        return names
+
+    def _imported_constants(self, tree, files):
+        """Constantes importadas de módulos do repositório (`from x.y import NOME`)"""
+        names = {}
+        for node in tree.body:
+            if not isinstance(node, ast.ImportFrom) or not node.module or node.level:
+                continue
+            relative = node.module.replace(".", "/") + ".py"
+            if not (self.root / relative).is_file():
+                continue
+            try:
+                constants = self._module_constants(
+                    ast.parse((self.root / relative).read_text(encoding="utf-8"))
+                )
+            except SyntaxError:
+                continue
+            imported = {
+                alias.asname or alias.name: constants[alias.name]
+                for alias in node.names if alias.name in constants
+            }
+            if imported:
+                names.update(imported)
+                files[relative] = self._fingerprint(relative)
+        return names
+
+    def _parse(self, relative):
+        self.parsed += 1
+        files = {relative: self._fingerprint(relative)}
+        try:
+            tree = ast.parse((self.root / relative).read_text(encoding="utf-8"))
+        except SyntaxError as e:
+            return {"files": files, "description": f"Erro de sintaxe: {e}", "tests": []}
+
+        names = self._imported_constants(tree, files)
+        evaluate = _Evaluator(names)
+        # Constantes do módulo podem depender das importadas
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 \
+                    and isinstance(node.targets[0], ast.Name):
+                try:
+                    names[node.targets[0].id] = evaluate(node.value)
+                except (Unresolved, KeyError, IndexError, TypeError, StopIteration):
+                    pass
+
+        description = ast.get_docstring(tree)
+        tests = []
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+                description = description or ast.get_docstring(node)
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) \
+                            and item.name.startswith("test"):
+                        # Parametrize da classe vale para todos os métodos, depois dos do método
+                        decorators = node.decorator_list + item.decorator_list
+                        tests += [f"{node.name}::{case}" for case in expand(item.name, decorators, evaluate)]
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+                tests += expand(node.name, node.decorator_list, evaluate)
+
+        description = (description or "").strip().splitlines()[0] if description else ""
+        return {"files": files, "description": description, "tests": tests}
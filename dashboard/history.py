@@ -0,0 +1,290 @@
+"""Histórico de execuções e resultados em SQLite, consultado pela aba Relatórios"""
+
+import argparse
+import gzip
+import json
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from dashboard.results import RESULTS_PATTERN, RUNS_DIR, ResultSummary
+from tests.support.perf_baseline import current_commit
+
+DEFAULT_HISTORY_PATH = "reports/run_history.db"
+BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL UNIQUE,
+    started TEXT NOT NULL,
+    selection TEXT NOT NULL,
+    command TEXT,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    duration REAL,
+    commit_sha TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs (started);
+CREATE TABLE IF NOT EXISTS results (
+    run INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    nodeid TEXT NOT NULL,
+    module TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL,
+    worker TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results (run, outcome, module);
+CREATE INDEX IF NOT EXISTS idx_results_module ON results (module);
+"""
+
+RUN_COLUMNS = (
+    "run_id", "started", "selection", "status", "total", "passed", "failed", "skipped",
+    "duration", "commit_sha",
+)
+RESULT_COLUMNS = ("nodeid", "phase", "outcome", "duration", "worker", "error")
+
+
+def module_of(nodeid):
+    return nodeid.split("::")[0]
+
+
+def read_records(path):
+    """Registros de um arquivo de resultados (`.jsonl` ou `.jsonl.gz`), linha a linha"""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+        except (EOFError, OSError):
+            return  # gzip truncado: execução interrompida antes de fechar o arquivo
+
+
+def run_status(summary):
+    if summary.exitstatus is None:
+        return "error"
+    return {0: "passed", 1: "failed", 5: "empty"}.get(summary.exitstatus, "error")
+
+
+class RunHistory:
+    """Uma conexão por instância, compartilhável entre as threads do Streamlit
+
+    WAL: a aba Relatórios lê enquanto uma execução que terminou é gravada.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def version(self):
+        """Muda a cada execução gravada: chave dos agregados em cache"""
+        with self._lock:
+            return self.connection.execute("SELECT MAX(id) FROM runs").fetchone()[0] or 0
+
+    def ingest(self, results_path, run_id=None, selection="Todos", command=None,
+               status=None, started=None):
+        """Grava uma execução a partir do seu arquivo de resultados, em lotes"""
+        run_id = run_id or Path(results_path).parent.name
+        started = started or datetime.fromtimestamp(os.path.getmtime(results_path))
+        summary = ResultSummary()
+        with self._lock, self.connection:
+            cursor = self.connection.execute(
+                """INSERT INTO runs (run_id, started, selection, command, status,
+                                     total, passed, failed, skipped)
+                   VALUES (?, ?, ?, ?, 'running', 0, 0, 0, 0)""",
+                (run_id, started.isoformat(timespec="seconds"), selection, command)
+            )
+            run = cursor.lastrowid
+            batch = []
+            for record in read_records(results_path):
+                summary.add(record)
+                if record.get("event") != "test":
+                    continue
+                batch.append((
+                    run, record["nodeid"], module_of(record["nodeid"]), record["phase"],
+                    record["outcome"], record.get("duration"), record.get("worker"),
+                    record.get("error"),
+                ))
+                if len(batch) >= BATCH_SIZE:
+                    self._insert_results(batch)
+                    batch = []
+            self._insert_results(batch)
+
+            headline = summary.headline()
+            self.connection.execute(
+                """UPDATE runs SET status = ?, total = ?, passed = ?, failed = ?, skipped = ?,
+                                   duration = ?, commit_sha = ?
+                   WHERE id = ?""",
+                (status or run_status(summary), summary.done, headline["passed"],
+                 headline["failed"], headline["skipped"], summary.duration,
+                 current_commit(), run)
+            )
+        return run
+
+    def _insert_results(self, batch):
+        if batch:
+            self.connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch
+            )
+
+    def run(self, run_id):
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT {', '.join(RUN_COLUMNS)}, command FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return dict(zip((*RUN_COLUMNS, "command"), row)) if row else None
+
+    def has_run(self, run_id):
+        with self._lock:
+            return self.connection.execute(
+                "SELECT 1 FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone() is not None
+
+    @staticmethod
+    def _run_filters(start=None, end=None, module=None, outcome=None):
+        clauses, params = [], []
+        if start:
+            clauses.append("started >= ?")
+            params.append(start.isoformat())
+        if end:
+            clauses.append("started < ?")
+            params.append(end.isoformat())
+        if module or outcome:
+            # Sonda o índice (run, outcome, module) de cada execução candidata
+            condition = "r.run = runs.id"
+            if module:
+                condition += " AND r.module = ?"
+                params.append(module)
+            if outcome:
+                condition += " AND r.outcome = ?"
+                params.append(outcome)
+            clauses.append(f"EXISTS (SELECT 1 FROM results r WHERE {condition})")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count_runs(self, **filters):
+        where, params = self._run_filters(**filters)
+        with self._lock:
+            return self.connection.execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0]
+
+    def runs(self, limit=25, offset=0, **filters):
+        """Uma página de execuções, da mais recente para a mais antiga"""
+        where, params = self._run_filters(**filters)
+        with self._lock:
+            rows = self.connection.execute(
+                f"""SELECT {", ".join(RUN_COLUMNS)} FROM runs{where}
+                    ORDER BY started DESC, id DESC LIMIT ? OFFSET ?""",
+                (*params, limit, offset)
+            ).fetchall()
+        return [dict(zip(RUN_COLUMNS, row)) for row in rows]
+
+    def results(self, run_id, module=None, outcome=None, limit=100, offset=0):
+        clauses, params = ["run = (SELECT id FROM runs WHERE run_id = ?)"], [run_id]
+        if module:
+            clauses.append("module = ?")
+            params.append(module)
+        if outcome:
+            clauses.append("outcome = ?")
+            params.append(outcome)
+        with self._lock:
+            rows = self.connection.execute(
+                f"""SELECT {", ".join(RESULT_COLUMNS)} FROM results
+                    WHERE {" AND ".join(clauses)} ORDER BY rowid LIMIT ? OFFSET ?""",
+                (*params, limit, offset)
+            ).fetchall()
+        return [dict(zip(RESULT_COLUMNS, row)) for row in rows]
+
+    def iter_results(self, run_id, batch_size=BATCH_SIZE):
+        """Todos os resultados de uma execução, lidos do cursor em lotes"""
+        with self._lock:
+            cursor = self.connection.execute(
+                f"""SELECT {", ".join(RESULT_COLUMNS)} FROM results
+                    WHERE run = (SELECT id FROM runs WHERE run_id = ?) ORDER BY rowid""",
+                (run_id,)
+            )
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield dict(zip(RESULT_COLUMNS, row))
+        finally:
+            cursor.close()
+
+    def modules(self):
+        with self._lock:
+            rows = self.connection.execute("SELECT DISTINCT module FROM results ORDER BY module")
+            return [row[0] for row in rows]
+
+    def aggregates(self, days=30):
+        """Totais gerais e execuções por dia nos últimos `days` dias"""
+        with self._lock:
+            runs, passed, average = self.connection.execute(
+                """SELECT COUNT(*), SUM(status = 'passed'), AVG(duration) FROM runs"""
+            ).fetchone()
+            daily = self.connection.execute(
+                """SELECT substr(started, 1, 10) AS day, COUNT(*), SUM(passed), SUM(failed)
+                   FROM runs WHERE started >= date('now', 'localtime', ?)
+                   GROUP BY day ORDER BY day""",
+                (f"-{days} days",)
+            ).fetchall()
+        return {
+            "runs": runs,
+            "pass_rate": (passed or 0) / runs if runs else 0.0,
+            "average_duration": average,
+            "daily": [
+                {"day": day, "runs": count, "passed": day_passed, "failed": day_failed}
+                for day, count, day_passed, day_failed in daily
+            ],
+        }
+
+    def close(self):
+        self.connection.close()
+
+
+def import_runs(history, runs_dir=RUNS_DIR):
+    """Grava as execuções de `runs_dir` que ainda não estão no histórico"""
+    imported = 0
+    for path in sorted(Path(runs_dir).glob(f"*/{RESULTS_PATTERN}")):
+        if not history.has_run(path.parent.name):
+            history.ingest(str(path))
+            imported += 1
+    return imported
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Histórico de execuções dos testes")
+    parser.add_argument("command", choices=["import", "stats"])
+    parser.add_argument("--db", default=DEFAULT_HISTORY_PATH)
+    parser.add_argument("--runs-dir", default=RUNS_DIR)
+    args = parser.parse_args(argv)
+
+    history = RunHistory(args.db)
+    if args.command == "import":
+        print(f"{import_runs(history, args.runs_dir)} execuções importadas para {args.db}")
+    else:
+        aggregates = history.aggregates()
+        print(f"{aggregates['runs']} execuções, {aggregates['pass_rate']:.0%} aprovadas")
+    history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Fila de execuções do dashboard, única por processo e compartilhada pelas sessões"""
+
+import os
+import threading
+from collections import deque
+
+from dashboard.pool import WarmPool
+from dashboard.runner import PytestRun, build_pytest_args
+
+MAX_RUNS_ENV = "E2E_DASHBOARD_MAX_RUNS"
+MAX_WORKERS_ENV = "E2E_DASHBOARD_MAX_WORKERS"
+WARM_POOL_ENV = "E2E_DASHBOARD_WARM_POOL"
+
+
+class JobManager:
+    """Enfileira as execuções e as inicia respeitando os limites globais
+
+    `max_runs` limita as execuções simultâneas e `max_workers` a soma dos
+    workers xdist em uso (uma execução serial ocupa 1). Todas as sessões do
+    Streamlit veem as mesmas execuções e podem cancelá-las. As execuções usam
+    o pool de processos pré-aquecidos, um por execução simultânea, a menos que
+    `E2E_DASHBOARD_WARM_POOL=0`.
+    """
+
+    def __init__(self, max_runs=None, max_workers=None, keep_finished=20, pool=None):
+        self.max_runs = max_runs or int(os.environ.get(MAX_RUNS_ENV, 1))
+        self.max_workers = max_workers or int(os.environ.get(MAX_WORKERS_ENV, 4))
+        self.keep_finished = keep_finished
+        if pool is None and os.environ.get(WARM_POOL_ENV, "1") != "0":
+            pool = WarmPool(size=self.max_runs)
+        self.pool = pool
+        self.jobs = {}
+        self.queue = deque()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def slots(run):
+        return max(run.workers, 1)
+
+    def submit(self, test_files=None, workers=0, selection="Todos", **options):
+        """Enfileira uma execução; inicia na hora se houver capacidade"""
+        workers = min(workers, self.max_workers)
+        run = PytestRun(
+            build_pytest_args(test_files, workers=workers, **options),
+            selection=selection, workers=workers, on_finish=self._finished, pool=self.pool,
+        )
+        with self._lock:
+            self.jobs[run.run_id] = run
+            self.queue.append(run)
+            self._schedule()
+            self._trim()
+        return run
+
+    def _schedule(self):
+        while self.queue:
+            running = [run for run in self.jobs.values() if run.running]
+            if len(running) >= self.max_runs:
+                return
+            used = sum(self.slots(run) for run in running)
+            if running and used + self.slots(self.queue[0]) > self.max_workers:
+                return
+            self.queue.popleft().start()
+
+    def _finished(self, run):
+        with self._lock:
+            self._schedule()
+
+    def _trim(self):
+        finished = [run_id for run_id, run in self.jobs.items() if not run.active]
+        for run_id in finished[:max(len(finished) - self.keep_finished, 0)]:
+            del self.jobs[run_id]
+
+    def cancel(self, run_id):
+        with self._lock:
+            run = self.jobs.get(run_id)
+            if run is None:
+                return False
+            if run in self.queue:
+                self.queue.remove(run)
+                run.status = "cancelled"
+                return True
+        run.cancel()
+        return True
+
+    def get(self, run_id):
+        return self.jobs.get(run_id)
+
+    def active(self):
+        """Execuções em andamento e na fila, na ordem em que serão atendidas"""
+        with self._lock:
+            return [run for run in self.jobs.values() if run.running] + list(self.queue)
+
+    def recent(self, limit=10):
+        with self._lock:
+            return list(self.jobs.values())[-limit:][::-1]
+
+    def position(self, run):
+        with self._lock:
+            return self.queue.index(run) + 1 if run in self.queue else None
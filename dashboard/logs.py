@@ -0,0 +1,164 @@
+"""Logs por execução com índice de linhas, lidos por mmap
+
+Cada linha do log (`run.log`) tem no índice (`run.log.idx`) um registro de
+9 bytes: offset da linha no log (uint64) e nível (uint8). Filtrar por nível
+e localizar uma janela de linhas só lê o índice; do log são lidos apenas os
+bytes das linhas exibidas.
+"""
+
+import mmap
+import os
+import re
+from datetime import datetime
+
+import numpy as np
+
+LOG_FILE = "run.log"
+INDEX_SUFFIX = ".idx"
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+INDEX_DTYPE = np.dtype([("offset", "<u8"), ("level", "u1")])
+TIMESTAMP_WIDTH = len("[2024-01-15 14:30:15] ")
+SCAN_CHUNK = 1 << 16
+
+ERROR_PATTERN = re.compile(r"\b(FAILED|ERROR|Error|Exception|Traceback)\b|^E\s")
+WARNING_PATTERN = re.compile(r"\b(WARNING|[Ww]arnings?|XPASS|XFAIL|SKIPPED)\b")
+INFO_PATTERN = re.compile(r"\bPASSED\b|^={3,}|^-{3,}|^\[gw\d+\]")
+
+
+def line_level(line):
+    """Nível de uma linha da saída do pytest"""
+    if ERROR_PATTERN.search(line):
+        return "ERROR"
+    if WARNING_PATTERN.search(line):
+        return "WARNING"
+    if INFO_PATTERN.search(line):
+        return "INFO"
+    return "DEBUG"
+
+
+class LogWriter:
+    """Grava o log e o índice; o índice é gravado depois da linha, nunca antes"""
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.log = open(path, "ab")
+        self.index = open(path + INDEX_SUFFIX, "ab")
+        self.offset = self.log.tell()
+
+    def write(self, line, level=None):
+        level = level or line_level(line)
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        data = f"[{timestamp}] {level}: {line}\n".encode("utf-8", errors="replace")
+        self.log.write(data)
+        self.log.flush()
+        record = np.array([(self.offset, LEVELS[level])], dtype=INDEX_DTYPE)
+        self.index.write(record.tobytes())
+        self.index.flush()
+        self.offset += len(data)
+
+    def close(self):
+        self.log.close()
+        self.index.close()
+
+
+def _map(path):
+    """mmap somente leitura; None para arquivo vazio ou inexistente"""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        return None
+
+
+class LogView:
+    """Janelas de linhas de um log, filtradas pelo nível mínimo
+
+    Abre em tempo constante: log e índice são mapeados, não lidos. Para
+    acompanhar um log que ainda cresce, basta criar outra LogView.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._log = _map(path)
+        self._index_map = _map(path + INDEX_SUFFIX)
+        if self._index_map is None:
+            self.index = np.zeros(0, dtype=INDEX_DTYPE)
+        else:
+            # Registro final incompleto (gravação em andamento) é ignorado
+            count = len(self._index_map) // INDEX_DTYPE.itemsize
+            self.index = np.frombuffer(self._index_map, dtype=INDEX_DTYPE, count=count)
+        self.size = len(self._log) if self._log is not None else 0
+
+    def __len__(self):
+        return len(self.index)
+
+    def count(self, min_level="DEBUG"):
+        if min_level == "DEBUG":
+            return len(self.index)
+        return int(np.count_nonzero(self.index["level"] >= LEVELS[min_level]))
+
+    def tail(self, min_level="DEBUG", lines=200, skip=0):
+        """Números das `lines` linhas do nível mínimo que antecedem as `skip` últimas
+
+        Percorre o índice de trás para frente em blocos, até achar o suficiente.
+        """
+        wanted = lines + skip
+        minimum = LEVELS[min_level]
+        found = []
+        end = len(self.index)
+        while end > 0 and wanted > 0:
+            start = max(end - SCAN_CHUNK, 0)
+            matches = np.flatnonzero(self.index["level"][start:end] >= minimum) + start
+            found.append(matches[-wanted:])
+            wanted -= len(found[-1])
+            end = start
+        numbers = np.concatenate(found[::-1]) if found else np.zeros(0, dtype=np.int64)
+        # `skip` além das linhas existentes: janela vazia (e não um fatiamento negativo)
+        return numbers[:max(len(numbers) - skip, 0)] if skip else numbers
+
+    def line(self, number):
+        start = int(self.index["offset"][number])
+        if number + 1 < len(self.index):
+            end = int(self.index["offset"][number + 1])
+        else:
+            # Última linha indexada: o log pode já ter a próxima, ainda sem índice
+            end = self._log.find(b"\n", start)
+            end = self.size if end < 0 else end
+        return self._log[start:end].decode("utf-8", errors="replace").rstrip("\n")
+
+    def window(self, min_level="DEBUG", lines=200, skip=0, timestamps=True):
+        """Texto das linhas da janela (só esses bytes são lidos do log)"""
+        if self._log is None:
+            return []
+        text = [self.line(number) for number in self.tail(min_level, lines, skip)]
+        return text if timestamps else [line[TIMESTAMP_WIDTH:] for line in text]
+
+    def close(self):
+        self.index = np.zeros(0, dtype=INDEX_DTYPE)
+        for mapped in (self._log, self._index_map):
+            if mapped is not None:
+                mapped.close()
+
+
+def recent_logs(runs_dir, limit=50):
+    """Ids das execuções mais recentes que têm log, da mais nova para a mais antiga"""
+    try:
+        names = sorted(os.listdir(runs_dir), reverse=True)
+    except OSError:
+        return []
+    found = []
+    for name in names:
+        if os.path.exists(os.path.join(runs_dir, name, LOG_FILE)):
+            found.append(name)
+            if len(found) == limit:
+                break
+    return found
+
+
+def remove_log(path):
+    for name in (path, path + INDEX_SUFFIX):
+        if os.path.exists(name):
+            os.remove(name)
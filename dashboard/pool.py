@@ -0,0 +1,265 @@
+"""Processos pré-aquecidos para iniciar o pytest sem custo de importação
+
+Cada processo do pool importa uma vez o pytest e as dependências pesadas dos
+testes (Selenium, pandas, NumPy...) e espera por execuções. Nada que importe
+um plugin do pytest é pré-carregado (o Streamlit, por exemplo, importa o
+anyio): o pytest precisa importar os plugins ele mesmo para reescrever os asserts.
+Para cada execução ele faz fork: o filho abre uma sessão própria (o
+cancelamento continua encerrando o grupo inteiro), recebe a saída e o pipe
+de eventos pelo socket de controle e chama `pytest.main`. Conftest e módulos
+de teste não são pré-carregados, então alterações neles valem já na execução
+seguinte. Depois de `max_uses` execuções o processo é substituído por outro,
+aquecido em segundo plano.
+"""
+
+import atexit
+import gc
+import importlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MAX_USES_ENV = "E2E_DASHBOARD_WARM_USES"
+READY_TIMEOUT = 60
+MESSAGE_SIZE = 1 << 16
+
+# Sem o Streamlit: ele importa o anyio, que também é um plugin do pytest (pytest11)
+PRELOAD = (
+    "pytest", "selenium.webdriver", "selenium.webdriver.support.ui",
+    "selenium.webdriver.support.expected_conditions", "webdriver_manager.chrome",
+    "pandas", "numpy", "PIL.Image", "requests", "websocket",
+)
+
+
+def _send(sock, message, fds=()):
+    socket.send_fds(sock, [json.dumps(message).encode("utf-8")], list(fds))
+
+
+def _receive(sock):
+    data, fds, _, _ = socket.recv_fds(sock, MESSAGE_SIZE, 2)
+    if not data:
+        raise ConnectionError("processo do pool encerrado")
+    return json.loads(data), fds
+
+
+# --- Lado do processo pré-aquecido ------------------------------------------
+
+def preload(modules=PRELOAD):
+    """Importa as dependências pesadas (não os plugins do pytest)"""
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # dependência opcional: será importada (ou falhará) na execução
+    # Objetos pré-carregados fora do GC: os filhos não os percorrem nem copiam as páginas
+    gc.freeze()
+
+
+def _run_child(control, request, output_fd, events_fd, ready_w):
+    """Filho do fork: vira líder de sessão e roda o pytest"""
+    code = 4
+    try:
+        os.setsid()
+        os.close(ready_w)
+        control.close()
+        os.dup2(output_fd, 1)
+        os.dup2(output_fd, 2)
+        os.close(output_fd)
+        os.environ[request["events_env"]] = str(events_fd)
+        os.chdir(request["cwd"])
+        import pytest
+        code = int(pytest.main(request["args"]))
+    except BaseException:
+        import traceback
+        traceback.print_exc()
+    finally:
+        # atexit também roda aqui (ex.: gravação pendente de screenshots)
+        atexit._run_exitfuncs()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def serve(control_fd, max_uses):
+    """Laço do processo do pool: uma execução por vez, até `max_uses`"""
+    preload()
+    control = socket.socket(fileno=control_fd)
+    try:
+        _send(control, {"ready": os.getpid()})
+    except OSError:
+        return  # o dashboard encerrou durante o aquecimento
+    for _ in range(max_uses):
+        try:
+            request, (output_fd, events_fd) = _receive(control)
+        except (ConnectionError, OSError, ValueError):
+            return
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            _run_child(control, request, output_fd, events_fd, ready_w)
+        os.close(ready_w)
+        os.close(output_fd)
+        os.close(events_fd)
+        # EOF quando o filho já abriu a própria sessão: killpg(pid) é seguro
+        os.read(ready_r, 1)
+        os.close(ready_r)
+        _send(control, {"pid": pid})
+        _, status = os.waitpid(pid, 0)
+        _send(control, {"exit": os.waitstatus_to_exitcode(status)})
+
+
+# --- Lado do dashboard -------------------------------------------------------
+
+class WarmProcess:
+    """Execução em um processo do pool, com a parte da interface do Popen usada pelo PytestRun"""
+
+    def __init__(self, worker, pid, stdout):
+        self.worker = worker
+        self.pid = pid
+        self.stdout = stdout
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self):
+        if self.returncode is None:
+            try:
+                message, _ = _receive(self.worker.control)
+                self.returncode = message["exit"]
+            except (ConnectionError, OSError, ValueError, KeyError):
+                # O processo do pool morreu: o filho não é nosso, só dá para esperar ele sumir
+                while _alive(self.pid):
+                    time.sleep(0.2)
+                self.returncode = -1
+            self.worker.release()
+        return self.returncode
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class _Worker:
+    """Um processo do pool e o socket de controle do lado do dashboard"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.uses = 0
+        self.ready = False
+        self.control, remote = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        try:
+            self.process = subprocess.Popen(
+                [sys.executable, "-m", "dashboard.pool", str(remote.fileno()), str(pool.max_uses)],
+                cwd=pool.cwd, pass_fds=(remote.fileno(),), stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                env={**os.environ, "PYTHONUNBUFFERED": "1", "PYTHONIOENCODING": "utf-8"},
+            )
+        except OSError:
+            self.control.close()
+            raise
+        finally:
+            remote.close()
+
+    def run(self, args, cwd, events_fd, events_env):
+        if not self.ready:
+            self.control.settimeout(READY_TIMEOUT)
+            try:
+                _receive(self.control)
+            finally:
+                self.control.settimeout(None)
+            self.ready = True
+        read_fd, write_fd = os.pipe()
+        try:
+            _send(self.control, {"args": args, "cwd": str(cwd), "events_env": events_env},
+                  fds=(write_fd, events_fd))
+        except OSError:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        stdout = open(read_fd, encoding="utf-8", errors="replace")
+        try:
+            message, _ = _receive(self.control)
+        except (ConnectionError, OSError, ValueError):
+            stdout.close()
+            raise
+        self.uses += 1
+        return WarmProcess(self, message["pid"], stdout)
+
+    def release(self):
+        self.pool._release(self)
+
+    def close(self):
+        self.control.close()
+        # O processo encerra ao ver o socket fechado; a espera só recolhe o status
+        threading.Thread(target=self.process.wait, daemon=True).start()
+
+
+class WarmPool:
+    """`size` processos pré-aquecidos; cada um atende até `max_uses` execuções"""
+
+    def __init__(self, size=1, max_uses=None, cwd=REPO_ROOT):
+        self.size = size
+        self.max_uses = max_uses or int(os.environ.get(MAX_USES_ENV, 20))
+        self.cwd = cwd
+        self.idle = deque()
+        self._lock = threading.Lock()
+        self._fill()
+
+    def _fill(self):
+        with self._lock:
+            while len(self.idle) < self.size:
+                try:
+                    self.idle.append(_Worker(self))
+                except OSError:
+                    return
+
+    def spawn(self, args, cwd, events_fd, events_env):
+        """Inicia uma execução; OSError se nenhum processo do pool puder atender"""
+        error = None
+        for _ in range(2):
+            with self._lock:
+                worker = self.idle.popleft() if self.idle else None
+            try:
+                # Mais execuções que processos: o excedente paga o aquecimento
+                worker = worker or _Worker(self)
+                return worker.run(args, cwd, events_fd, events_env)
+            except (ConnectionError, OSError, ValueError) as e:
+                error = e
+                if worker is not None:
+                    worker.close()
+                self._fill()
+        raise OSError(f"pool de processos indisponível: {error}")
+
+    def _release(self, worker):
+        with self._lock:
+            if worker.uses < self.max_uses and len(self.idle) < self.size:
+                self.idle.append(worker)
+                return
+        worker.close()
+        self._fill()
+
+    def close(self):
+        with self._lock:
+            workers, self.idle = list(self.idle), deque()
+        for worker in workers:
+            worker.close()
+
+
+if __name__ == "__main__":
+    serve(int(sys.argv[1]), int(sys.argv[2]))
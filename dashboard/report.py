@@ -0,0 +1,156 @@
+"""Relatório HTML de uma execução, gerado sob demanda
+
+As execuções gravam só os registros compactos (`results.jsonl.gz`) e o
+histórico SQLite; o HTML é montado quando pedido na aba Relatórios, linha a linha,
+direto para um arquivo gzip. O relatório de uma execução não muda depois de
+gravada, então o arquivo gerado fica em `reports/runs/<id>/report.html.gz`.
+"""
+
+import argparse
+import gzip
+import html
+import os
+import sys
+from datetime import datetime
+
+from dashboard.history import DEFAULT_HISTORY_PATH, RunHistory, read_records, run_status
+from dashboard.results import RUNS_DIR, read_summary
+
+REPORT_FILE = "report.html.gz"
+ROWS_PER_CHUNK = 1000
+
+STYLE = """
+body { font-family: -apple-system, "Segoe UI", Roboto, sans-serif; margin: 2rem; color: #1f2937; }
+table { border-collapse: collapse; width: 100%; margin-bottom: 1.5rem; font-size: 0.9rem; }
+th, td { border-bottom: 1px solid #e5e7eb; padding: 0.35rem 0.6rem; text-align: left; vertical-align: top; }
+th { background: #f3f4f6; }
+.meta th { width: 10rem; }
+.summary span { margin-right: 1.5rem; font-weight: bold; }
+.passed, .xpassed { color: #047857; }
+.failed, .error { color: #b91c1c; }
+.skipped, .xfailed { color: #b45309; }
+td.error-text { font-family: monospace; white-space: pre-wrap; color: #b91c1c; }
+"""
+
+
+def _cell(value):
+    return html.escape("" if value is None else str(value))
+
+
+def render_html(meta, results):
+    """Blocos de texto do relatório; `results` é consumido como iterador"""
+    yield (
+        '<!DOCTYPE html>\n<html lang="pt-br"><head><meta charset="utf-8">'
+        f"<title>Relatório E2E - {_cell(meta['run_id'])}</title><style>{STYLE}</style></head><body>\n"
+        "<h1>🧪 Relatório de Testes E2E</h1>\n<table class=\"meta\">\n"
+    )
+    duration = meta.get("duration")
+    for label, value in (
+        ("Execução", meta["run_id"]),
+        ("Início", (meta.get("started") or "").replace("T", " ")),
+        ("Testes", meta.get("selection")),
+        ("Status", meta.get("status")),
+        ("Duração", f"{duration:.1f}s" if duration is not None else "-"),
+        ("Commit", meta.get("commit_sha")),
+        ("Comando", meta.get("command")),
+    ):
+        yield f"<tr><th>{label}</th><td>{_cell(value)}</td></tr>\n"
+    yield (
+        '</table>\n<p class="summary">'
+        f'<span>Total: {_cell(meta.get("total"))}</span>'
+        f'<span class="passed">Passou: {_cell(meta.get("passed"))}</span>'
+        f'<span class="failed">Falhou: {_cell(meta.get("failed"))}</span>'
+        f'<span class="skipped">Pulado: {_cell(meta.get("skipped"))}</span></p>\n'
+        "<table class=\"results\"><thead><tr><th>Teste</th><th>Fase</th><th>Resultado</th>"
+        "<th>Duração</th><th>Worker</th><th>Erro</th></tr></thead><tbody>\n"
+    )
+    rows = []
+    for result in results:
+        outcome = html.escape(result["outcome"])
+        duration = result.get("duration")
+        error = result.get("error")
+        rows.append(
+            f"<tr><td>{html.escape(result['nodeid'])}</td><td>{html.escape(result['phase'])}</td>"
+            f'<td class="{outcome}">{outcome}</td>'
+            f"<td>{f'{duration:.2f}s' if duration is not None else '-'}</td>"
+            f"<td>{html.escape(result.get('worker') or '')}</td>"
+            f'<td class="error-text">{html.escape(error) if error else ""}</td></tr>\n'
+        )
+        if len(rows) == ROWS_PER_CHUNK:
+            yield "".join(rows)
+            rows = []
+    yield "".join(rows)
+    yield "</tbody></table>\n</body></html>\n"
+
+
+def write_report(meta, results, path):
+    """Grava o relatório bloco a bloco (gzip se `path` terminar em .gz); nunca inteiro em memória"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(tmp, "wt", encoding="utf-8") as f:
+        for chunk in render_html(meta, results):
+            f.write(chunk)
+    os.replace(tmp, path)
+    return str(path)
+
+
+def report_path(run_id, runs_dir=RUNS_DIR):
+    return os.path.join(runs_dir, run_id, REPORT_FILE)
+
+
+def cached_report(history, run_id, runs_dir=RUNS_DIR):
+    """Relatório de uma execução do histórico, gerado na primeira vez que é pedido"""
+    path = report_path(run_id, runs_dir)
+    if not os.path.exists(path):
+        meta = history.run(run_id)
+        if meta is None:
+            raise KeyError(run_id)
+        write_report(meta, history.iter_results(run_id), path)
+    return path
+
+
+def file_report(results_path, path):
+    """Relatório direto de um arquivo de resultados (ex.: execução local ou do CI)"""
+    summary = read_summary(results_path)
+    headline = summary.headline()
+    meta = {
+        "run_id": str(results_path),
+        "started": datetime.fromtimestamp(os.path.getmtime(results_path)).isoformat(timespec="seconds"),
+        "status": run_status(summary),
+        "total": summary.done,
+        "duration": summary.duration,
+        **headline,
+    }
+    records = (record for record in read_records(results_path) if record.get("event") == "test")
+    return write_report(meta, records, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Relatório HTML de uma execução dos testes")
+    parser.add_argument("source", help="arquivo de resultados (--results-log) ou id de execução do histórico")
+    parser.add_argument("-o", "--output", help="arquivo de saída (.html ou .html.gz)")
+    parser.add_argument("--db", default=DEFAULT_HISTORY_PATH)
+    args = parser.parse_args(argv)
+
+    if os.path.isfile(args.source):
+        output = args.output or os.path.join(os.path.dirname(args.source), REPORT_FILE)
+        print(file_report(args.source, output))
+        return 0
+    history = RunHistory(args.db)
+    try:
+        meta = history.run(args.source)
+        if meta is None:
+            print(f"Execução não encontrada: {args.source}", file=sys.stderr)
+            return 1
+        if args.output:
+            print(write_report(meta, history.iter_results(args.source), args.output))
+        else:
+            print(cached_report(history, args.source))
+    finally:
+        history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Leitura incremental dos registros JSONL de resultados (tests/support/live_events.py)"""
+
+import json
+import os
+import threading
+import zlib
+from collections import deque
+from pathlib import Path
+
+RUNS_DIR = "reports/runs"
+RESULTS_FILE = "results.jsonl.gz"
+RESULTS_PATTERN = "results.jsonl*"
+OUTCOMES = ("passed", "failed", "error", "skipped", "xfailed", "xpassed")
+CHUNK_SIZE = 1 << 16
+
+
+class ResultSummary:
+    """Agregados de uma execução, em memória constante
+
+    Só os contadores, o teste corrente e as últimas falhas são mantidos,
+    independentemente do tamanho da suíte.
+    """
+
+    def __init__(self, max_failures=50):
+        self.counts = dict.fromkeys(OUTCOMES, 0)
+        self.total = None
+        self.done = 0
+        self.current = None
+        self.failures = deque(maxlen=max_failures)
+        self.workers = {}
+        self.exitstatus = None
+        self.duration = None
+        self.records = 0
+
+    def add(self, record):
+        self.records += 1
+        event = record.get("event")
+        if event == "collected":
+            self.total = record["total"]
+        elif event == "running":
+            self.current = record["nodeid"]
+        elif event == "test":
+            outcome = record["outcome"]
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+            # Cada teste tem um registro `call` ou um setup que não passou
+            if record["phase"] in ("setup", "call"):
+                self.done += 1
+            worker = record.get("worker")
+            if worker:
+                self.workers[worker] = self.workers.get(worker, 0) + 1
+            if outcome in ("failed", "error"):
+                self.failures.append(record)
+        elif event == "collect_error":
+            self.counts["error"] += 1
+            self.failures.append({**record, "phase": "collect", "outcome": "error"})
+        elif event == "finish":
+            self.exitstatus = record["exitstatus"]
+            self.duration = record["duration"]
+            self.current = None
+
+    @property
+    def finished(self):
+        return self.exitstatus is not None
+
+    @property
+    def progress(self):
+        return min(self.done / self.total, 1.0) if self.total else 0.0
+
+    def headline(self):
+        """Contadores agrupados como nas métricas do dashboard"""
+        counts = self.counts
+        return {
+            "passed": counts["passed"] + counts["xpassed"],
+            "failed": counts["failed"] + counts["error"],
+            "skipped": counts["skipped"] + counts["xfailed"],
+        }
+
+    def as_dict(self):
+        return {
+            "headline": self.headline(),
+            "total": self.total,
+            "done": self.done,
+            "progress": self.progress,
+            "counts": dict(self.counts),
+            "current": self.current,
+            "failures": list(self.failures),
+            "workers": dict(self.workers),
+            "exitstatus": self.exitstatus,
+            "duration": self.duration,
+        }
+
+
+class ResultsReader:
+    """Lê só os bytes novos do arquivo a cada poll(), guardando o offset
+
+    Uma linha incompleta (ainda sendo escrita) fica no buffer até o próximo
+    poll(). Se o arquivo for recriado, a leitura recomeça do início. Arquivos
+    `.gz` são descomprimidos incrementalmente, também só os bytes novos.
+    """
+
+    def __init__(self, path, summary=None):
+        self.path = path
+        self.summary = summary or ResultSummary()
+        self.offset = 0
+        self.inode = None
+        self.partial = b""
+        self.decompressor = None
+        self._lock = threading.Lock()
+
+    def poll(self):
+        """Processa os registros novos; retorna quantos foram lidos"""
+        with self._lock:
+            return self._poll()
+
+    def _poll(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return 0
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            self.inode = stat.st_ino
+            self.offset, self.partial = 0, b""
+            self.decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16) \
+                if str(self.path).endswith(".gz") else None
+            self.summary = ResultSummary(self.summary.failures.maxlen)
+        if stat.st_size == self.offset:
+            return 0
+
+        read = 0
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            while block := f.read(CHUNK_SIZE):
+                self.offset += len(block)
+                if self.decompressor is not None:
+                    try:
+                        block = self.decompressor.decompress(block)
+                    except zlib.error:
+                        return read
+                *lines, self.partial = (self.partial + block).split(b"\n")
+                for line in lines:
+                    try:
+                        self.summary.add(json.loads(line))
+                    except ValueError:
+                        continue
+                    read += 1
+        return read
+
+
+def read_summary(path):
+    """Resumo de um arquivo de resultados completo, lido em blocos"""
+    reader = ResultsReader(path)
+    reader.poll()
+    return reader.summary
+
+
+def latest_results(runs_dir=RUNS_DIR):
+    """Arquivo de resultados da execução mais recente (ids ordenados por data)"""
+    runs = sorted(Path(runs_dir).glob(f"*/{RESULTS_PATTERN}")) if Path(runs_dir).is_dir() else []
+    return str(runs[-1]) if runs else None
@@ -0,0 +1,213 @@
+"""Execução do pytest em segundo plano com progresso em tempo real"""
+
+import json
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+from dashboard.history import DEFAULT_HISTORY_PATH, RunHistory
+from dashboard.logs import LOG_FILE, LogWriter
+from dashboard.results import RESULTS_FILE, RUNS_DIR, ResultSummary
+from tests.support.live_events import EVENTS_ENV
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+E2E_DIR = "tests/test_e2e"
+KILL_GRACE_SECONDS = 5
+
+
+def build_pytest_args(test_files=None, workers=0, result_cache=False):
+    """Argumentos do pytest a partir das opções do dashboard"""
+    args = [f"{E2E_DIR}/{name}" for name in test_files] if test_files else [E2E_DIR]
+    args.append("-v")
+    if workers:
+        args += ["-n", str(workers)]
+    if result_cache:
+        args.append("--result-cache")
+    return args
+
+
+class PytestRun:
+    """Um processo pytest; eventos (pipe) e saída são lidos por threads daemon
+
+    O estado é atualizado pelas threads e lido pelo script do Streamlit com
+    snapshot(), sem bloquear a interface. Os resultados também ficam em
+    `reports/runs/<id>/results.jsonl.gz` e, ao terminar, no histórico SQLite;
+    a saída, em `reports/runs/<id>/run.log` com o índice de linhas. Com um
+    `pool` (dashboard/pool.py) o pytest roda em um processo pré-aquecido; sem
+    ele, ou se o pool falhar, em um processo novo.
+    """
+
+    def __init__(self, args, selection="Todos", workers=0, on_finish=None, cwd=REPO_ROOT,
+                 max_lines=2000, history_path=DEFAULT_HISTORY_PATH, pool=None):
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.results_path = f"{RUNS_DIR}/{self.run_id}/{RESULTS_FILE}"
+        self.log_path = f"{RUNS_DIR}/{self.run_id}/{LOG_FILE}"
+        self.args = [*args, f"--results-log={self.results_path}"]
+        self.selection = selection
+        self.workers = workers
+        self.on_finish = on_finish
+        self.pool = pool
+        self.history_path = history_path
+        self.cwd = cwd
+        self.process = None
+        self.status = "queued"
+        self.submitted = time.time()
+        self.summary = ResultSummary()
+        self.lines = deque(maxlen=max_lines)
+        self.started = None
+        self.duration = None
+        self.returncode = None
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    @property
+    def command(self):
+        return " ".join(["pytest", *self.args])
+
+    @property
+    def running(self):
+        return self.status == "running"
+
+    @property
+    def active(self):
+        return self.status in ("queued", "running")
+
+    def start(self):
+        read_fd, write_fd = os.pipe()
+        env = {**os.environ, EVENTS_ENV: str(write_fd), "PYTHONUNBUFFERED": "1"}
+        self.started = time.time()
+        self.status = "running"
+        try:
+            self.process = self._spawn(write_fd, env)
+        except OSError as e:
+            os.close(read_fd)
+            self.lines.append(str(e))
+            self.status = "error"
+            if self.on_finish:
+                self.on_finish(self)
+            return self
+        finally:
+            # Só o pytest mantém a ponta de escrita: EOF quando ele terminar
+            os.close(write_fd)
+
+        readers = [
+            threading.Thread(target=self._read_events, args=(read_fd,), daemon=True),
+            threading.Thread(target=self._read_output, daemon=True),
+        ]
+        for thread in readers:
+            thread.start()
+        threading.Thread(target=self._wait, args=(readers,), daemon=True).start()
+        return self
+
+    def _spawn(self, write_fd, env):
+        if self.pool is not None:
+            try:
+                return self.pool.spawn(self.args, self.cwd, write_fd, EVENTS_ENV)
+            except OSError as e:
+                self.lines.append(f"{e}; iniciando o pytest em um processo novo")
+        return subprocess.Popen(
+            [sys.executable, "-m", "pytest", *self.args],
+            cwd=self.cwd, env=env, pass_fds=(write_fd,),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding="utf-8", errors="replace",
+            # Grupo de processos próprio: pytest, workers xdist, Chrome e
+            # servidores Streamlit são encerrados juntos no cancelamento
+            start_new_session=True,
+        )
+
+    def cancel(self, grace=KILL_GRACE_SECONDS):
+        """SIGTERM no grupo; SIGKILL em quem ainda estiver vivo após `grace` segundos"""
+        if self.process and self.process.poll() is None:
+            self.cancelled = True
+            self._signal_group(signal.SIGTERM)
+            timer = threading.Timer(grace, self._signal_group, args=(signal.SIGKILL,))
+            timer.daemon = True
+            timer.start()
+
+    def _signal_group(self, signum):
+        try:
+            os.killpg(self.process.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _read_events(self, fd):
+        with os.fdopen(fd, encoding="utf-8", errors="replace") as events:
+            for line in events:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                with self._lock:
+                    self.summary.add(event)
+
+    def _read_output(self):
+        log = LogWriter(os.path.join(self.cwd, self.log_path))
+        try:
+            for line in self.process.stdout:
+                line = line.rstrip("\n")
+                log.write(line)
+                with self._lock:
+                    self.lines.append(line)
+        finally:
+            log.close()
+            self.process.stdout.close()
+
+    def _wait(self, readers):
+        returncode = self.process.wait()
+        for thread in readers:
+            thread.join()
+        with self._lock:
+            self.returncode = returncode
+            self.summary.current = None
+            self.duration = self.summary.duration
+            if self.duration is None:
+                self.duration = round(time.time() - self.started, 3)
+            if self.cancelled:
+                status = "cancelled"
+            else:
+                status = {0: "passed", 1: "failed", 5: "empty"}.get(returncode, "error")
+        self._record(status)
+        # O status final só é publicado depois da gravação: a aba Relatórios já a encontra
+        with self._lock:
+            self.status = status
+        if self.on_finish:
+            self.on_finish(self)
+
+    def _record(self, status):
+        if not os.path.exists(os.path.join(self.cwd, self.results_path)):
+            return
+        try:
+            history = RunHistory(os.path.join(self.cwd, self.history_path))
+            history.ingest(
+                os.path.join(self.cwd, self.results_path), run_id=self.run_id,
+                selection=self.selection, command=self.command, status=status,
+                started=datetime.fromtimestamp(self.started),
+            )
+            history.close()
+        except sqlite3.Error as e:
+            with self._lock:
+                self.lines.append(f"Falha ao gravar o histórico: {e}")
+
+    def snapshot(self, lines=200):
+        """Cópia consistente do estado para a interface"""
+        with self._lock:
+            return {
+                **self.summary.as_dict(),
+                "run_id": self.run_id,
+                "status": self.status,
+                "selection": self.selection,
+                "workers": self.workers,
+                "command": self.command,
+                "results_path": self.results_path,
+                "elapsed": self.duration if self.duration is not None
+                else time.time() - (self.started or time.time()),
+                "returncode": self.returncode,
+                "lines": list(self.lines)[-lines:],
+            }
@@ -1,13 +1,17 @@
 import streamlit as st
-import subprocess
 import os
 import json
-import time
-from datetime import datetime
+from datetime import datetime, timedelta
 import pandas as pd
-from pathlib import Path
-import threading
-import queue
+
+from dashboard.discovery import SuiteDiscovery
+from dashboard.history import RunHistory
+from dashboard.logs import LOG_FILE, LogView, recent_logs, remove_log
+from dashboard.report import cached_report, report_path
+from dashboard.results import OUTCOMES, RUNS_DIR, ResultsReader, latest_results
+from dashboard.jobs import JobManager
+from tests.fixtures.test_data import SCREEN_RESOLUTIONS
+from tests.support.result_cache import load_summary
 
 # Configuração da página
 st.set_page_config(
@@ -63,92 +67,137 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Funções auxiliares
-@st.cache_data
+@st.cache_resource
+def get_test_discovery():
+    return SuiteDiscovery()
+
 def get_test_structure():
-    """Retorna a estrutura dos testes disponíveis"""
-    return {
-        "test_navigation.py": {
-            "description": "Testes de navegação entre páginas",
-            "tests": ["test_home_page_loads", "test_navigation_menu", "test_page_transitions"]
-        },
-        "test_portfolio.py": {
-            "description": "Testes das funcionalidades do portfolio",
-            "tests": ["test_portfolio_display", "test_project_details", "test_skills_section"]
-        },
-        "test_contact.py": {
-            "description": "Testes do formulário de contato",
-            "tests": ["test_contact_form", "test_form_validation", "test_submit_contact"]
-        },
-        "test_responsiveness.py": {
-            "description": "Testes de responsividade",
-            "tests": ["test_desktop_layout", "test_mobile_layout", "test_tablet_layout"]
-        }
-    }
+    """Estrutura dos testes lida por AST; só arquivos alterados são reprocessados"""
+    return get_test_discovery().discover()
 
-def run_tests_async(command, result_queue):
-    """Executa testes de forma assíncrona"""
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minutos timeout
-        )
-        result_queue.put({
-            'returncode': result.returncode,
-            'stdout': result.stdout,
-            'stderr': result.stderr,
-            'completed': True
-        })
-    except subprocess.TimeoutExpired:
-        result_queue.put({
-            'returncode': -1,
-            'stdout': '',
-            'stderr': 'Timeout: Testes excederam 5 minutos de execução',
-            'completed': True
-        })
-    except Exception as e:
-        result_queue.put({
-            'returncode': -1,
-            'stdout': '',
-            'stderr': str(e),
-            'completed': True
-        })
+STATUS_BADGES = {
+    "queued": ("status-pending", "⏳ Na fila"),
+    "running": ("status-running", "🔄 Executando..."),
+    "passed": ("status-passed", "✅ Aprovado"),
+    "failed": ("status-failed", "❌ Falhas"),
+    "error": ("status-failed", "⚠️ Erro na execução"),
+    "cancelled": ("status-pending", "⏹️ Interrompido"),
+    "empty": ("status-pending", "⚠️ Nenhum teste executado"),
+}
+RUN_STATUS_LABELS = {
+    "queued": "⏳ Na fila",
+    "running": "🔄 Executando",
+    "passed": "✅ Sucesso",
+    "failed": "⚠️ Falhas",
+    "error": "❌ Erro",
+    "cancelled": "⏹️ Interrompida",
+    "empty": "➖ Sem testes",
+}
+REFRESH_SECONDS = 0.5
+REPORT_PAGE_SIZE = 25
 
-def parse_pytest_output(output):
-    """Parse do output do pytest para extrair informações"""
-    lines = output.split('\n')
-    results = {
-        'passed': 0,
-        'failed': 0,
-        'errors': 0,
-        'skipped': 0,
-        'total_time': '0s',
-        'details': []
-    }
+def show_run_progress(manager, run, polling):
+    """Fila compartilhada e progresso da execução acompanhada, atualizados a cada REFRESH_SECONDS"""
+    active = manager.active()
+    if active:
+        st.write("**Execuções em andamento e na fila** (visíveis para todos):")
+        st.dataframe(pd.DataFrame([
+            {
+                'Id': job.run_id,
+                'Testes': job.selection,
+                'Workers': job.workers or 1,
+                'Status': RUN_STATUS_LABELS.get(job.status, job.status),
+                'Progresso': f"{job.summary.done}/{job.summary.total or '?'}",
+            }
+            for job in active
+        ]), use_container_width=True, hide_index=True)
+    
+    if polling and not active:
+        # Tudo terminou: atualiza o restante da página (status e botões) e para o polling
+        st.rerun()
+    if run is None:
+        return
+    
+    snapshot = run.snapshot()
+    counts = snapshot["headline"]
+    
+    if snapshot["status"] == "queued":
+        st.info(f"⏳ Execução `{run.run_id}` na fila (posição {manager.position(run)})")
+        return
+    
+    if snapshot["total"]:
+        label = f"{snapshot['done']} de {snapshot['total']} testes"
+    else:
+        label = "🔍 Coletando testes..."
+    st.progress(snapshot["progress"], text=label)
+    if snapshot["current"]:
+        st.caption(f"🧪 {snapshot['current']}")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("✅ Passou", counts["passed"])
+    with col2:
+        st.metric("❌ Falhou", counts["failed"])
+    with col3:
+        st.metric("⚠️ Pulou", counts["skipped"])
+    with col4:
+        st.metric("⏱️ Tempo", f"{snapshot['elapsed']:.1f}s")
     
-    for line in lines:
-        if '=====' in line and 'passed' in line:
-            # Extrai informações do resumo
-            parts = line.split()
-            for i, part in enumerate(parts):
-                if 'passed' in part and i > 0:
-                    results['passed'] = int(parts[i-1])
-                elif 'failed' in part and i > 0:
-                    results['failed'] = int(parts[i-1])
-                elif 'error' in part and i > 0:
-                    results['errors'] = int(parts[i-1])
-                elif 'skipped' in part and i > 0:
-                    results['skipped'] = int(parts[i-1])
-        
-        if 'seconds' in line or 'minutes' in line:
-            # Extrai tempo de execução
-            if 'in ' in line:
-                time_part = line.split('in ')[-1].strip()
-                results['total_time'] = time_part
+    if snapshot["status"] == "passed":
+        st.success("✅ Testes executados com sucesso!")
+    elif snapshot["status"] in ("failed", "error"):
+        st.error(f"❌ Execução terminou com código {snapshot['returncode']}")
+        for failure in snapshot["failures"]:
+            st.write(f"- `{failure['nodeid']}` ({failure['phase']}): {failure.get('error') or ''}")
+    elif snapshot["status"] == "cancelled":
+        st.warning("⏹️ Execução interrompida")
     
-    return results
+    st.caption(f"`{snapshot['command']}`")
+    st.code("\n".join(snapshot["lines"]) or " ", language="text")
+
+@st.cache_resource
+def get_results_reader(path):
+    """Um leitor por arquivo: cada rerun só processa os registros novos"""
+    return ResultsReader(path)
+
+@st.cache_resource
+def get_job_manager():
+    """Gerenciador único do processo: fila e limites valem para todas as sessões"""
+    return JobManager()
+
+@st.cache_resource
+def get_run_history():
+    """Conexão única com o histórico, compartilhada pelas sessões"""
+    return RunHistory()
+
+@st.cache_data
+def get_history_aggregates(version):
+    """Agregados do histórico; `version` muda quando uma execução é gravada"""
+    return get_run_history().aggregates()
+
+@st.cache_data
+def get_history_modules(version):
+    return get_run_history().modules()
+
+def show_log_window(log_path, level, lines, skip, timestamps):
+    """Janela do log; relida a cada segundo enquanto a execução grava o arquivo"""
+    view = LogView(log_path)
+    try:
+        text = "\n".join(view.window(level, lines, skip, timestamps))
+        st.caption(
+            f"{view.count(level)} linhas com nível {level} ou superior, "
+            f"{len(view)} no total ({view.size / 1e6:.1f} MB)"
+        )
+    finally:
+        view.close()
+    
+    st.code(text or " ", language="text")
+    st.download_button(
+        "💾 Download Janela",
+        data=text,
+        file_name=f"logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+        mime="text/plain"
+    )
 
 # Interface principal
 def main():
@@ -175,15 +224,15 @@ def main():
         max_workers = st.slider(
             "Workers Paralelos",
             min_value=1,
-            max_value=4,
+            max_value=max(get_job_manager().max_workers, 2),
             value=2,
             disabled=not parallel_tests
         )
         
-        generate_html_report = st.checkbox(
-            "Gerar Relatório HTML",
-            value=True,
-            help="Gera relatório detalhado em HTML"
+        use_result_cache = st.checkbox(
+            "Cache de Resultados",
+            value=False,
+            help="Não reexecuta testes aprovados cujas entradas não mudaram"
         )
         
         st.divider()
@@ -195,7 +244,7 @@ def main():
         - Frontend: Streamlit
         - Testes: Pytest + Selenium  
         - Browser: Chrome
-        - Relatórios: pytest-html
+        - Relatórios: HTML sob demanda
         
         **Resoluções Testadas:**
         - Desktop: 1920x1080
@@ -209,28 +258,30 @@ def main():
     
     with tab1:
         # Dashboard
+        test_structure = get_test_structure()
+        test_count = sum(len(info['tests']) for info in test_structure.values())
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.markdown("""
+            st.markdown(f"""
             <div class="metric-container">
-                <h3>4</h3>
+                <h3>{len(test_structure)}</h3>
                 <p>Módulos de Teste</p>
             </div>
             """, unsafe_allow_html=True)
         
         with col2:
-            st.markdown("""
+            st.markdown(f"""
             <div class="metric-container">
-                <h3>12</h3>
+                <h3>{test_count}</h3>
                 <p>Testes Individuais</p>
             </div>
             """, unsafe_allow_html=True)
         
         with col3:
-            st.markdown("""
+            st.markdown(f"""
             <div class="metric-container">
-                <h3>4</h3>
+                <h3>{len(SCREEN_RESOLUTIONS)}</h3>
                 <p>Resoluções</p>
             </div>
             """, unsafe_allow_html=True)
@@ -243,18 +294,43 @@ def main():
             </div>
             """, unsafe_allow_html=True)
         
+        results_path = latest_results()
+        if results_path:
+            reader = get_results_reader(results_path)
+            reader.poll()
+            last_run = reader.summary
+            counts = last_run.headline()
+            st.write(f"**Última execução** (`{results_path}`)")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("✅ Passou", counts["passed"])
+            with col2:
+                st.metric("❌ Falhou", counts["failed"])
+            with col3:
+                st.metric("⚠️ Pulou", counts["skipped"])
+            with col4:
+                duration = f"{last_run.duration:.1f}s" if last_run.duration is not None else "em andamento"
+                st.metric("⏱️ Tempo", duration)
+        
+        cache_summary = load_summary()
+        if cache_summary and cache_summary["total"]:
+            st.caption(
+                f"♻️ Última execução: {cache_summary['cached']} de {cache_summary['total']} "
+                f"testes vieram do cache ({cache_summary['cached_ratio']:.0%}), "
+                f"{cache_summary['executed']} executados"
+            )
+        
         st.divider()
         
         # Estrutura dos testes
         st.subheader("📁 Estrutura dos Testes")
-        test_structure = get_test_structure()
         
         for test_file, info in test_structure.items():
             with st.expander(f"📄 {test_file}"):
                 st.write(f"**Descrição:** {info['description']}")
-                st.write("**Testes inclusos:**")
-                for test in info['tests']:
-                    st.write(f"- `{test}`")
+                st.write(f"**Testes inclusos ({len(info['tests'])}):**")
+                # Um único elemento por arquivo, mesmo com muitos casos parametrizados
+                st.markdown("\n".join(f"- `{test}`" for test in info['tests']))
     
     with tab2:
         # Executar Testes
@@ -277,23 +353,20 @@ def main():
                     if st.checkbox(test_file, key=f"test_{test_file}"):
                         selected_tests.append(test_file)
         
+        # A execução desta sessão ou, sem ela, a que estiver em andamento
+        manager = get_job_manager()
+        active = manager.active()
+        run = manager.get(st.session_state.get("job_id")) or (active[0] if active else None)
+        
         with col2:
             st.write("**Status da Execução:**")
-            if 'test_running' not in st.session_state:
-                st.session_state.test_running = False
-            
-            status_placeholder = st.empty()
-            
-            if st.session_state.test_running:
-                status_placeholder.markdown(
-                    '<div class="test-status status-running">🔄 Executando...</div>',
-                    unsafe_allow_html=True
-                )
-            else:
-                status_placeholder.markdown(
-                    '<div class="test-status status-pending">⏸️ Aguardando</div>',
-                    unsafe_allow_html=True
-                )
+            badge, label = STATUS_BADGES.get(run.status if run else None, ("status-pending", "⏸️ Aguardando"))
+            st.markdown(f'<div class="test-status {badge}">{label}</div>', unsafe_allow_html=True)
+            queued = len(active) - sum(job.running for job in active)
+            st.caption(
+                f"Limite: {manager.max_runs} execução(ões) e {manager.max_workers} workers simultâneos"
+                + (f" · {queued} na fila" if queued else "")
+            )
         
         st.divider()
         
@@ -303,96 +376,93 @@ def main():
         with col1:
             run_button = st.button(
                 "▶️ Executar Testes Selecionados",
-                disabled=not selected_tests or st.session_state.test_running,
+                disabled=not selected_tests,
                 type="primary"
             )
         
         with col2:
-            run_all_button = st.button(
-                "🚀 Executar Todos os Testes",
-                disabled=st.session_state.test_running
-            )
+            run_all_button = st.button("🚀 Executar Todos os Testes")
         
         with col3:
-            if st.session_state.test_running:
+            if run is not None and run.active:
                 if st.button("⏹️ Parar Execução", type="secondary"):
-                    st.session_state.test_running = False
+                    manager.cancel(run.run_id)
                     st.rerun()
         
-        # Execução dos testes
+        # Execução dos testes: enfileirada no gerenciador, em processo de fundo
         if run_button or run_all_button:
-            if run_all_button:
-                selected_tests = list(test_structure.keys())
-            
-            st.session_state.test_running = True
-            
-            # Construir comando pytest
-            base_cmd = "pytest tests/test_e2e/"
-            
-            if selected_tests:
-                test_files = " ".join([f"tests/test_e2e/{test}" for test in selected_tests])
-                cmd = f"pytest {test_files} -v"
-            else:
-                cmd = f"{base_cmd} -v"
-            
-            # Adicionar flags baseadas nas configurações
-            if parallel_tests:
-                cmd += f" -n {max_workers}"
-            
-            if generate_html_report:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                cmd += f" --html=reports/report_{timestamp}.html --self-contained-html"
-            
-            # Executar testes
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            log_container = st.empty()
-            
-            # Simular execução (em produção, usar subprocess real)
-            for i in range(100):
-                time.sleep(0.05)  # Simular tempo de execução
-                progress_bar.progress(i + 1)
-                
-                if i < 30:
-                    status_text.text("🔍 Inicializando testes...")
-                elif i < 60:
-                    status_text.text("🧪 Executando testes de navegação...")
-                elif i < 80:
-                    status_text.text("📱 Testando responsividade...")
-                else:
-                    status_text.text("📊 Gerando relatórios...")
-            
-            st.session_state.test_running = False
-            
-            # Resultados simulados
-            st.success("✅ Testes executados com sucesso!")
-            
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("✅ Passou", "10", "2")
-            with col2:
-                st.metric("❌ Falhou", "1", "-1")
-            with col3:
-                st.metric("⚠️ Pulou", "1", "0")
-            with col4:
-                st.metric("⏱️ Tempo", "2.5s", "-0.3s")
+            job = manager.submit(
+                None if run_all_button else selected_tests,
+                workers=max_workers if parallel_tests else 0,
+                selection="Todos" if run_all_button or all_tests else ", ".join(selected_tests),
+                result_cache=use_result_cache,
+            )
+            st.session_state.job_id = job.run_id
+            st.rerun()
+        
+        polling = bool(active)
+        st.fragment(show_run_progress, run_every=REFRESH_SECONDS if polling else None)(manager, run, polling)
     
     with tab3:
         # Relatórios
         st.subheader("📊 Relatórios de Teste")
         
-        # Lista de relatórios (simulada)
-        reports_data = {
-            'Data': ['2024-01-15 14:30', '2024-01-15 12:15', '2024-01-14 16:45'],
-            'Testes': ['Todos', 'Navegação', 'Todos'],
-            'Passou': [10, 3, 8],
-            'Falhou': [1, 0, 2],
-            'Tempo': ['2.5s', '1.2s', '3.1s'],
-            'Status': ['✅ Sucesso', '✅ Sucesso', '⚠️ Falhas']
-        }
+        history = get_run_history()
+        version = history.version()
+        aggregates = get_history_aggregates(version)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Execuções", aggregates["runs"])
+        with col2:
+            st.metric("Taxa de Sucesso", f"{aggregates['pass_rate']:.0%}")
+        with col3:
+            average = aggregates["average_duration"]
+            st.metric("Duração Média", f"{average:.1f}s" if average is not None else "-")
         
-        df = pd.DataFrame(reports_data)
+        if aggregates["daily"]:
+            daily = pd.DataFrame(aggregates["daily"]).set_index("day")
+            st.bar_chart(daily[["passed", "failed"]].rename(columns={"passed": "Passou", "failed": "Falhou"}))
+        
+        # Filtros
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            period = st.date_input("Período", value=(), key="report_period")
+        with col2:
+            module = st.selectbox("Módulo", ["Todos", *get_history_modules(version)])
+        with col3:
+            outcome = st.selectbox("Resultado", ["Todos", *OUTCOMES])
+        
+        filters = {
+            "start": period[0] if period else None,
+            "end": period[-1] + timedelta(days=1) if period else None,
+            "module": None if module == "Todos" else module,
+            "outcome": None if outcome == "Todos" else outcome,
+        }
+        total_runs = history.count_runs(**filters)
+        pages = max(1, -(-total_runs // REPORT_PAGE_SIZE))
+        page = st.number_input("Página", min_value=1, max_value=pages, value=1)
+        runs = history.runs(limit=REPORT_PAGE_SIZE, offset=(page - 1) * REPORT_PAGE_SIZE, **filters)
+        
+        df = pd.DataFrame([
+            {
+                'Data': run['started'].replace('T', ' ')[:16],
+                'Testes': run['selection'],
+                'Passou': run['passed'],
+                'Falhou': run['failed'],
+                'Tempo': f"{run['duration']:.1f}s" if run['duration'] is not None else '-',
+                'Status': RUN_STATUS_LABELS.get(run['status'], run['status']),
+            }
+            for run in runs
+        ], columns=['Data', 'Testes', 'Passou', 'Falhou', 'Tempo', 'Status'])
         st.dataframe(df, use_container_width=True)
+        st.caption(f"{total_runs} execuções · página {page} de {pages}")
+        
+        run_id = None
+        if runs:
+            run_id = st.selectbox("Detalhes da execução", [run['run_id'] for run in runs])
+            results = history.results(run_id, module=filters["module"], outcome=filters["outcome"])
+            st.dataframe(pd.DataFrame(results), use_container_width=True)
         
         st.divider()
         
@@ -400,12 +470,24 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            st.download_button(
-                "📥 Download Último Relatório HTML",
-                data="<html>Relatório de exemplo</html>",
-                file_name="ultimo_relatorio.html",
-                mime="text/html"
-            )
+            # Gerado a partir do histórico e lido do disco só depois que o download é pedido,
+            # não a cada rerun da aba
+            if run_id is None or st.session_state.get('report_ready') != run_id:
+                if st.button("📄 Preparar Relatório HTML", disabled=run_id is None):
+                    cached_report(get_run_history(), run_id)
+                    st.session_state.report_ready = run_id
+                    st.rerun()
+            else:
+                with open(report_path(run_id), 'rb') as report_file:
+                    downloaded = st.download_button(
+                        "📥 Download Relatório HTML",
+                        data=report_file,
+                        file_name=f"relatorio_{run_id}.html.gz",
+                        mime="application/gzip"
+                    )
+                if downloaded:
+                    # Já baixado: as próximas execuções do script não carregam mais o arquivo
+                    del st.session_state.report_ready
         
         with col2:
             st.download_button(
@@ -419,52 +501,40 @@ def main():
         # Logs
         st.subheader("📋 Logs de Execução")
         
-        # Filtros de log
-        col1, col2 = st.columns(2)
-        with col1:
-            log_level = st.selectbox("Nível", ["INFO", "DEBUG", "WARNING", "ERROR"])
-        with col2:
-            show_timestamp = st.checkbox("Mostrar timestamp", value=True)
-        
-        # Container de logs simulados
-        sample_logs = """
-[2024-01-15 14:30:15] INFO: Iniciando execução de testes E2E
-[2024-01-15 14:30:16] DEBUG: Configurando WebDriver Chrome
-[2024-01-15 14:30:17] INFO: Executando test_navigation.py
-[2024-01-15 14:30:18] DEBUG: Navegando para página inicial
-[2024-01-15 14:30:19] INFO: ✅ test_home_page_loads PASSOU
-[2024-01-15 14:30:20] DEBUG: Testando menu de navegação
-[2024-01-15 14:30:21] INFO: ✅ test_navigation_menu PASSOU
-[2024-01-15 14:30:22] WARNING: Elemento demorou para carregar
-[2024-01-15 14:30:23] INFO: ✅ test_page_transitions PASSOU
-[2024-01-15 14:30:24] INFO: Executando test_responsiveness.py
-[2024-01-15 14:30:25] DEBUG: Testando resolução 1920x1080
-[2024-01-15 14:30:26] INFO: ✅ test_desktop_layout PASSOU
-[2024-01-15 14:30:27] ERROR: Falha no teste de mobile layout
-[2024-01-15 14:30:28] INFO: ❌ test_mobile_layout FALHOU
-[2024-01-15 14:30:29] INFO: Execução finalizada: 10 passou, 1 falhou
-        """
-        
-        st.markdown(
-            f'<div class="log-container">{sample_logs.strip()}</div>',
-            unsafe_allow_html=True
-        )
-        
-        # Botões de ação para logs
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("🔄 Atualizar Logs"):
-                st.rerun()
-        with col2:
-            if st.button("🗑️ Limpar Logs"):
-                st.success("Logs limpos!")
-        with col3:
-            st.download_button(
-                "💾 Download Logs",
-                data=sample_logs,
-                file_name=f"logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-                mime="text/plain"
+        log_runs = recent_logs(RUNS_DIR)
+        if not log_runs:
+            st.info("Nenhum log ainda: os logs aparecem aqui a partir da primeira execução.")
+        else:
+            # Filtros de log
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                log_run = st.selectbox("Execução", log_runs)
+            with col2:
+                log_level = st.selectbox("Nível", ["INFO", "DEBUG", "WARNING", "ERROR"])
+            with col3:
+                show_timestamp = st.checkbox("Mostrar timestamp", value=True)
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                window_size = st.select_slider("Linhas exibidas", options=[100, 200, 500, 1000, 2000], value=200)
+            with col2:
+                windows_back = st.number_input("Janelas antes do fim", min_value=0, value=0)
+            
+            log_path = os.path.join(RUNS_DIR, log_run, LOG_FILE)
+            tailing = log_run in {job.run_id for job in active}
+            st.fragment(show_log_window, run_every=1 if tailing else None)(
+                log_path, log_level, window_size, windows_back * window_size, show_timestamp
             )
+            
+            # Botões de ação para logs
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("🔄 Atualizar Logs"):
+                    st.rerun()
+            with col2:
+                if st.button("🗑️ Limpar Log", disabled=tailing):
+                    remove_log(log_path)
+                    st.rerun()
 
 if __name__ == "__main__":
     main()
@@ -1,59 +1,594 @@
 import pytest
 import streamlit as st
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import subprocess
-import time
-import requests
-from urllib.parse import urljoin
+import os
+import warnings
+from pathlib import Path
+from urllib.parse import urlencode, urljoin
+
+from app.utils.helpers import TestUtils
+from app.utils.screenshots import get_screenshot_writer, safe_name
+from tests.support.console_capture import LEVELS, ConsoleBuffer, ConsoleCapture
+from tests.support.driver_pool import DriverPool
+from tests.support.impact import (
+    DEFAULT_MAP_PATH, ImpactRecorder, changed_files, changed_units, load_map, save_map,
+    select_tests
+)
+from tests.support.live_events import EVENTS_ENV, LiveEvents
+from tests.support.load_generator import format_stage
+from tests.support.perf_baseline import (
+    DEFAULT_HISTORY_PATH, PerfBaseline, PerfHistory, PerfRegressionWarning, format_regression
+)
+from tests.support.perf_metrics import PERF_ARTIFACTS_DIR, PerformanceCollector
+from tests.support.readiness import record_startup_times
+from tests.support import result_cache
+from tests.support.result_cache import ResultCache
+from tests.support.scheduling import (
+    DEFAULT_DURATIONS_PATH, DurationHistory, DurationRecorder, HistoryScheduling, page_of
+)
+from tests.support.server_pool import StreamlitServerManager
+from tests.support.viewport import sweep_viewports
+from tests.support.visual_diff import (
+    BASELINE_DIR, DYNAMIC_SELECTORS, VisualBaselineStore, capture_frame
+)
+
+APP_MAIN = Path(__file__).resolve().parent.parent / "app" / "main.py"
+
+DRIVER_POOL_STATS = pytest.StashKey[dict]()
+STARTUP_TIMES = pytest.StashKey[list]()
+PERF_REGRESSIONS = pytest.StashKey[list]()
+PERF_BASELINE = pytest.StashKey[PerfBaseline]()
+LOAD_STAGES = pytest.StashKey[list]()
+SERVER_MANAGER = pytest.StashKey[StreamlitServerManager]()
+CONSOLE_BUFFER = pytest.StashKey[ConsoleBuffer]()
+IMPACT_RECORDER = pytest.StashKey[ImpactRecorder]()
+IMPACT_TESTS = pytest.StashKey[dict]()
+IMPACT_SELECTION = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("e2e", "Testes E2E")
+    group.addoption(
+        "--no-driver-pool",
+        action="store_true",
+        default=False,
+        help="Inicia um Chrome novo para cada teste em vez de reaproveitar sessões"
+    )
+    group.addoption(
+        "--streamlit-servers",
+        type=int,
+        default=0,
+        help="Tamanho do pool compartilhado de servidores Streamlit "
+             "(0 = um servidor por worker xdist)"
+    )
+    group.addoption(
+        "--streamlit-url",
+        default=os.environ.get("STREAMLIT_URL"),
+        help="Usa um servidor Streamlit já em execução (padrão: $STREAMLIT_URL)"
+    )
+    group.addoption(
+        "--backend",
+        choices=["all", "apptest", "selenium", "load"],
+        default="all",
+        help="Executa só os testes in-process (apptest), só os de browser (selenium), "
+             "ambos (all) ou os testes de carga (load)"
+    )
+    group.addoption(
+        "--load-stages",
+        default="1,5,10",
+        help="Níveis de concorrência dos testes de carga, separados por vírgula"
+    )
+    group.addoption(
+        "--schedule",
+        choices=["xdist", "history"],
+        default="xdist",
+        help="Com -n: distribuição padrão do xdist ou guiada pelo histórico de duração, "
+             "mantendo testes da mesma página no mesmo worker (history)"
+    )
+    group.addoption(
+        "--durations-history",
+        default=DEFAULT_DURATIONS_PATH,
+        help="Arquivo com a duração e a página de cada teste nas execuções anteriores"
+    )
+    group.addoption(
+        "--result-cache",
+        action="store_true",
+        default=False,
+        help="Não executa testes já aprovados com as mesmas entradas (fontes, fixtures e versões)"
+    )
+    group.addoption(
+        "--result-cache-refresh",
+        action="store_true",
+        default=False,
+        help="Executa todos os testes e atualiza o cache de resultados"
+    )
+    group.addoption(
+        "--result-cache-clear",
+        action="store_true",
+        default=False,
+        help="Invalida o cache de resultados antes da execução"
+    )
+    group.addoption(
+        "--results-log",
+        metavar="PATH",
+        help="Grava um registro JSONL por resultado (nodeid, fase, resultado, duração, "
+             "worker e resumo do erro)"
+    )
+    group.addoption(
+        "--impact-record",
+        action="store_true",
+        default=False,
+        help="Registra quais funções da aplicação cada teste executa (mapa de impacto)"
+    )
+    group.addoption(
+        "--impact-since",
+        metavar="REF",
+        help="Executa só os testes afetados pelas mudanças desde o commit REF"
+    )
+    group.addoption(
+        "--impact-map",
+        default=DEFAULT_MAP_PATH,
+        help="Arquivo do mapa de impacto"
+    )
+    group.addoption(
+        "--console-buffer",
+        type=int,
+        default=200,
+        help="Mensagens de console mantidas por teste (as mais antigas são descartadas)"
+    )
+    group.addoption(
+        "--console-level",
+        choices=LEVELS,
+        default="info",
+        help="Severidade mínima das mensagens de console capturadas"
+    )
+    group.addoption(
+        "--update-visual-baselines",
+        action="store_true",
+        default=False,
+        help=f"Regrava os baselines de regressão visual em {BASELINE_DIR}/"
+    )
+    group.addoption(
+        "--perf-history",
+        default=DEFAULT_HISTORY_PATH,
+        help="Banco SQLite com o histórico de medições de performance"
+    )
+    group.addoption(
+        "--perf-regression",
+        choices=["fail", "warn", "off"],
+        default="warn",
+        help="O que fazer quando uma medição regride em relação ao baseline"
+    )
+    group.addoption(
+        "--perf-tolerance",
+        type=float,
+        default=0.10,
+        help="Lentidão mínima sobre a mediana para considerar regressão (0.10 = 10%%)"
+    )
+
+def pytest_configure(config):
+    """Registra a duração de cada teste, os resultados em JSONL e o cache de resultados"""
+    if not hasattr(config, "workerinput") and not config.option.collectonly:
+        config.pluginmanager.register(
+            DurationRecorder(config.getoption("--durations-history")), "durations-history"
+        )
+    if os.environ.get(EVENTS_ENV) and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(
+            LiveEvents.from_fd(int(os.environ.pop(EVENTS_ENV))), "live-events"
+        )
+    if config.getoption("--results-log") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(
+            LiveEvents.from_path(config.getoption("--results-log")), "results-log"
+        )
+    
+    # Sem cacheprovider (-p no:cacheprovider) não há config.cache nem cache de resultados
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return
+    if config.getoption("--result-cache-clear") and not hasattr(config, "workerinput"):
+        result_cache.clear(cache.mkdir("e2e-result-cache"))
+    # Com servidor externo os fontes locais não descrevem a aplicação testada
+    if (not config.getoption("--streamlit-url")
+            and (config.getoption("--result-cache") or config.getoption("--result-cache-refresh"))):
+        cache_dir = cache.mkdir("e2e-result-cache")
+        config.pluginmanager.register(
+            ResultCache(cache_dir, refresh=config.getoption("--result-cache-refresh")),
+            "result-cache"
+        )
+
+def pytest_collection_modifyitems(config, items):
+    """Marca cada teste com o seu backend e aplica o filtro --backend"""
+    for item in items:
+        if "test_apptest" in item.path.parts:
+            item.add_marker(pytest.mark.apptest)
+        elif "test_e2e" in item.path.parts:
+            item.add_marker(pytest.mark.e2e)
+        elif "test_load" in item.path.parts:
+            item.add_marker(pytest.mark.load)
+        elif "test_support" in item.path.parts:
+            item.add_marker(pytest.mark.unit)
+        # Vai no relatório do teste até o processo principal (histórico de duração)
+        page = page_of(item)
+        if page:
+            item.user_properties.append(("page", page))
+    
+    backend = config.getoption("--backend")
+    # Testes unitários da infraestrutura (tests/test_support) rodam com qualquer backend de teste
+    wanted = {
+        "all": ("apptest", "e2e", "unit"),
+        "apptest": ("apptest", "unit"),
+        "selenium": ("e2e", "unit"),
+        "load": ("load",),
+    }[backend]
+    selected, deselected = [], []
+    for item in items:
+        keep = any(item.get_closest_marker(marker) for marker in wanted)
+        (selected if keep else deselected).append(item)
+    
+    base = config.getoption("--impact-since")
+    if base:
+        selected, impact_deselected = select_impacted(config, base, selected)
+        deselected += impact_deselected
+    
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+def select_impacted(config, base, items):
+    """Mantém só os testes que executaram funções alteradas desde `base`"""
+    impact_map = load_map(config.getoption("--impact-map"))
+    if impact_map is None:
+        config.stash[IMPACT_SELECTION] = "mapa de impacto não encontrado, executando tudo"
+        return items, []
+    
+    changes = changed_files(base)
+    units = changed_units(base, changes)
+    wanted, reason = select_tests(impact_map, changes, units, [item.nodeid for item in items])
+    if wanted is None:
+        config.stash[IMPACT_SELECTION] = f"{reason}, executando tudo"
+        return items, []
+    
+    selected = [item for item in items if item.nodeid in wanted]
+    config.stash[IMPACT_SELECTION] = (
+        f"{len(selected)} de {len(items)} testes afetados desde {base} ({reason})"
+    )
+    return selected, [item for item in items if item.nodeid not in wanted]
+
+def pytest_sessionstart(session):
+    """Inicia o pool compartilhado de servidores no processo principal"""
+    config = session.config
+    if config.getoption("--impact-record") and not config.option.collectonly:
+        trace_dir = os.path.join(os.path.dirname(config.getoption("--impact-map")) or ".", "impact")
+        recorder = ImpactRecorder(trace_dir)
+        recorder.start()
+        config.stash[IMPACT_RECORDER] = recorder
+    
+    size = config.getoption("--streamlit-servers")
+    if (size <= 0 or hasattr(config, "workerinput")
+            or config.getoption("--streamlit-url") or config.option.collectonly):
+        return
+    
+    manager = StreamlitServerManager()
+    config.stash[SERVER_MANAGER] = manager
+    manager.start_pool(size)
+    config.stash.setdefault(STARTUP_TIMES, []).extend(manager.startup_times())
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Repassa as URLs do pool para cada worker xdist"""
+    manager = node.config.stash.get(SERVER_MANAGER, None)
+    if manager:
+        node.workerinput["streamlit_urls"] = manager.urls
+
+def pytest_unconfigure(config):
+    """Encerra os servidores do pool compartilhado"""
+    manager = config.stash.get(SERVER_MANAGER, None)
+    if manager:
+        manager.shutdown()
 
 @pytest.fixture(scope="session")
-def streamlit_app():
-    """Inicia a aplicação Streamlit para os testes"""
-    # Inicia o servidor Streamlit
-    process = subprocess.Popen([
-        "streamlit", "run", "app/main.py",
-        "--server.port", "8501",
-        "--server.headless", "true",
-        "--browser.gatherUsageStats", "false"
-    ])
-    
-    # Aguarda o servidor iniciar
-    max_retries = 30
-    for _ in range(max_retries):
-        try:
-            response = requests.get("http://localhost:8501")
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
-    else:
-        raise Exception("Falha ao iniciar o servidor Streamlit")
+def streamlit_app(request):
+    """URL da aplicação Streamlit usada pelo worker atual"""
+    config = request.config
+    external_url = config.getoption("--streamlit-url")
+    if external_url:
+        yield external_url
+        return
+    
+    # Pool compartilhado: iniciado pelo processo principal
+    urls = getattr(config, "workerinput", {}).get("streamlit_urls")
+    manager = config.stash.get(SERVER_MANAGER, None)
+    if not urls and manager:
+        urls = manager.urls
+    if urls:
+        yield StreamlitServerManager.assign(urls)
+        return
+    
+    # Um servidor dedicado por worker, em porta livre
+    manager = StreamlitServerManager()
+    server = manager.start_server()
+    config.stash.setdefault(STARTUP_TIMES, []).extend(manager.startup_times())
+    
+    yield server.url
     
-    yield "http://localhost:8501"
+    manager.shutdown()
+
+@pytest.fixture(scope="session")
+def base_url(streamlit_app):
+    """Alias da URL da aplicação"""
+    return streamlit_app
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """Pool de sessões do Chrome compartilhado pelo processo (ou worker xdist)"""
+    pool = DriverPool(reuse=not request.config.getoption("--no-driver-pool"))
     
-    # Encerra o processo
-    process.terminate()
-    process.wait()
+    yield pool
+    
+    pool.shutdown()
+    request.config.stash[DRIVER_POOL_STATS] = pool.stats()
 
 @pytest.fixture
-def driver():
-    """Configura o driver do Selenium"""
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
+def driver(driver_pool, request):
+    """Entrega um driver do Selenium aquecido e limpa o estado ao final"""
+    driver = driver_pool.acquire()
     
-    driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(10)
+    config = request.config
+    buffer = ConsoleBuffer(
+        capacity=config.getoption("--console-buffer"),
+        min_level=config.getoption("--console-level"),
+    )
+    capture = ConsoleCapture(driver, buffer)
+    if capture.attach():
+        request.node.stash[CONSOLE_BUFFER] = buffer
     
     yield driver
     
-    driver.quit()
+    capture.detach()
+    driver_pool.release(driver)
+
+def report_perf_regressions(item, report):
+    """Regressões medidas pelo perf_baseline durante o teste, no relatório da fase call
+
+    Com --perf-regression fail o próprio teste falha (conta para --maxfail),
+    em vez de virar um erro de teardown.
+    """
+    baseline = item.stash.get(PERF_BASELINE, None)
+    mode = item.config.getoption("--perf-regression")
+    if baseline is None or not baseline.regressions or mode == "off":
+        return
+    
+    item.config.stash.setdefault(PERF_REGRESSIONS, []).extend(baseline.regressions)
+    details = "\n".join(format_regression(r) for r in baseline.regressions)
+    if mode != "fail":
+        warnings.warn(PerfRegressionWarning(details))
+    elif report.passed:
+        report.outcome = "failed"
+        report.longrepr = f"Regressão de performance:\n{details}"
+    else:
+        report.sections.append(("performance regression", details))
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Reporta regressões de performance e, quando o teste falha, anexa o console do browser e um screenshot"""
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call":
+        report_perf_regressions(item, report)
+    driver = item.funcargs.get("driver") if hasattr(item, "funcargs") else None
+    if not report.failed or report.when == "teardown" or driver is None:
+        return
+    
+    buffer = item.stash.get(CONSOLE_BUFFER, None)
+    if buffer is not None and buffer.received:
+        report.sections.append(("browser console", buffer.format()))
+    
+    try:
+        png = driver.get_screenshot_as_png()
+    except WebDriverException:
+        return
+    
+    path = get_screenshot_writer().submit(safe_name(item.nodeid), png)
+    if not path:
+        return
+    report.sections.append(("screenshot", path))
+    
+    if item.config.pluginmanager.hasplugin("html"):
+        from pytest_html import extras
+        # O PNG é gravado em segundo plano: o relatório referencia o arquivo
+        report.extras = getattr(report, "extras", []) + [
+            extras.url(os.path.abspath(path), name="screenshot")
+        ]
+
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Escalonador LPT com afinidade de página (--schedule history)"""
+    if config.getoption("--schedule") == "history":
+        return HistoryScheduling(config, log, DurationHistory(config.getoption("--durations-history")))
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Associa ao teste as funções da aplicação executadas durante ele"""
+    recorder = item.config.stash.get(IMPACT_RECORDER, None)
+    if recorder:
+        recorder.begin(item.nodeid)
+    yield
+    if recorder:
+        recorder.end(item.nodeid)
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """Envia a telemetria do worker ao processo principal ou a persiste"""
+    config = session.config
+    stats = config.stash.get(DRIVER_POOL_STATS, None)
+    startup_times = config.stash.get(STARTUP_TIMES, [])
+    
+    if hasattr(config, "workeroutput"):
+        if stats:
+            config.workeroutput["driver_pool"] = stats
+        config.workeroutput["streamlit_startup"] = startup_times
+        config.workeroutput["perf_regressions"] = config.stash.get(PERF_REGRESSIONS, [])
+        config.workeroutput["load_stages"] = config.stash.get(LOAD_STAGES, [])
+    elif startup_times:
+        record_startup_times("reports/streamlit_startup.jsonl", startup_times)
+    
+    recorder = config.stash.get(IMPACT_RECORDER, None)
+    if recorder:
+        tests = config.stash.setdefault(IMPACT_TESTS, {})
+        tests.update(recorder.finish())
+        if hasattr(config, "workeroutput"):
+            config.workeroutput["impact_map"] = tests
+        else:
+            save_map(config.getoption("--impact-map"), tests)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Agrega a telemetria recebida de cada worker xdist"""
+    workeroutput = getattr(node, "workeroutput", {})
+    node.config.stash.setdefault(STARTUP_TIMES, []).extend(
+        workeroutput.get("streamlit_startup", [])
+    )
+    node.config.stash.setdefault(PERF_REGRESSIONS, []).extend(
+        workeroutput.get("perf_regressions", [])
+    )
+    node.config.stash.setdefault(LOAD_STAGES, []).extend(workeroutput.get("load_stages", []))
+    node.config.stash.setdefault(IMPACT_TESTS, {}).update(workeroutput.get("impact_map", {}))
+    
+    stats = workeroutput.get("driver_pool")
+    if not stats:
+        return
+    
+    totals = node.config.stash.get(DRIVER_POOL_STATS, {})
+    for key, value in stats.items():
+        totals[key] = totals.get(key, 0) + value
+    node.config.stash[DRIVER_POOL_STATS] = totals
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Mostra a economia do pool de WebDriver, o cold start do Streamlit, regressões e a rampa de carga"""
+    cache = config.pluginmanager.get_plugin("result-cache")
+    if cache and not hasattr(config, "workerinput"):
+        summary = cache.summary()
+        terminalreporter.write_sep("-", "cache de resultados")
+        terminalreporter.write_line(
+            f"{summary['cached']} de {summary['total']} testes vieram do cache "
+            f"({summary['cached_ratio']:.0%}), {summary['executed']} executados"
+        )
+    
+    selection = config.stash.get(IMPACT_SELECTION, None)
+    if selection:
+        terminalreporter.write_sep("-", "seleção por impacto")
+        terminalreporter.write_line(selection)
+    if config.stash.get(IMPACT_RECORDER, None):
+        terminalreporter.write_sep("-", "mapa de impacto")
+        terminalreporter.write_line(
+            f"{len(config.stash.get(IMPACT_TESTS, {}))} testes mapeados em "
+            f"{config.getoption('--impact-map')}"
+        )
+    
+    writer = get_screenshot_writer(create=False)
+    if writer is not None:
+        writer.flush()
+        stats = writer.stats()
+        terminalreporter.write_sep("-", "screenshots de falhas")
+        terminalreporter.write_line(
+            f"{stats['written']} gravados em {writer.directory}/, "
+            f"{stats['duplicates']} repetidos ignorados, {stats['dropped']} descartados"
+        )
+    
+    regressions = config.stash.get(PERF_REGRESSIONS, [])
+    if regressions:
+        terminalreporter.write_sep("-", "regressões de performance")
+        for regression in regressions:
+            terminalreporter.write_line(format_regression(regression))
+    
+    load_stages = config.stash.get(LOAD_STAGES, [])
+    if load_stages:
+        terminalreporter.write_sep("-", "rampa de carga")
+        for stage in load_stages:
+            terminalreporter.write_line(format_stage(stage))
+    
+    startup_times = config.stash.get(STARTUP_TIMES, [])
+    if startup_times:
+        terminalreporter.write_sep("-", "inicialização do Streamlit")
+        for entry in startup_times:
+            terminalreporter.write_line(
+                f"porta {entry['port']}: pronto em {entry['seconds']:.2f}s"
+            )
+    
+    stats = config.stash.get(DRIVER_POOL_STATS, None)
+    if not stats:
+        return
+    
+    terminalreporter.write_sep("-", "pool de WebDriver")
+    terminalreporter.write_line(
+        f"{stats['launches']} Chrome(s) iniciados para {stats['acquisitions']} testes, "
+        f"{stats['launches_avoided']} inicializações evitadas, "
+        f"{stats['replacements']} sessões substituídas"
+    )
+
+@pytest.fixture
+def load_stages(request):
+    """Estágios da rampa de carga medidos no teste, mostrados no resumo do terminal"""
+    return request.config.stash.setdefault(LOAD_STAGES, [])
+
+@pytest.fixture
+def perf_metrics(driver, request):
+    """Coleta métricas de performance do browser por página e grava um artefato por teste"""
+    collector = PerformanceCollector(driver)
+    collector.install()
+    
+    yield collector
+    
+    collector.uninstall()
+    collector.write_artifact(PERF_ARTIFACTS_DIR, request.node.nodeid)
+
+@pytest.fixture(scope="session")
+def perf_history(request):
+    """Histórico de medições compartilhado pela sessão"""
+    history = PerfHistory(request.config.getoption("--perf-history"))
+    
+    yield history
+    
+    history.close()
+
+@pytest.fixture
+def perf_baseline(perf_history, request):
+    """Grava medições de tempo e compara com o baseline das execuções anteriores
+
+    As regressões são reportadas ao fim da fase call (report_perf_regressions).
+    """
+    baseline = PerfBaseline(
+        perf_history, request.node.nodeid, tolerance=request.config.getoption("--perf-tolerance")
+    )
+    request.node.stash[PERF_BASELINE] = baseline
+    return baseline
+
+@pytest.fixture
+def visual_regression(driver, request):
+    """Compara a viewport atual com o baseline da página na resolução informada"""
+    store = VisualBaselineStore(update=request.config.getoption("--update-visual-baselines"))
+    
+    def _check(name, resolution, mask_selectors=(), **options):
+        image, regions = capture_frame(driver, DYNAMIC_SELECTORS + tuple(mask_selectors))
+        result, path = store.check(name, resolution, image, regions, **options)
+        if result is None:
+            pytest.skip(f"Baseline visual gravado em {path}")
+        if not result.passed:
+            pytest.fail(f"Regressão visual em {name} @ {resolution}: {result.summary()} ({path})",
+                        pytrace=False)
+        return result
+    
+    return _check
+
+@pytest.fixture
+def app_test():
+    """Executa app/main.py in-process com o AppTest do Streamlit (sem browser nem servidor)"""
+    from streamlit.testing.v1 import AppTest
+    
+    return AppTest.from_file(str(APP_MAIN), default_timeout=10).run()
 
 @pytest.fixture
 def wait():
@@ -66,21 +601,56 @@ class StreamlitHelper:
     """Classe auxiliar para interações com Streamlit"""
     
     @staticmethod
-    def wait_for_app_load(driver, wait_func):
-        """Aguarda o carregamento completo da aplicação"""
-        wait_func(driver).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='stSidebar']"))
+    def wait_for_app_load(driver, wait_func=None, timeout=10):
+        """Aguarda o carregamento completo da aplicação (primeiro rerun concluído)"""
+        TestUtils.wait_for_rerun(
+            driver, selector="[data-testid='stSidebar']", timeout=timeout
         )
     
+    @staticmethod
+    def arm_rerun(driver):
+        """Marca o ponto de partida antes de uma interação que dispara rerun"""
+        return TestUtils.arm_rerun(driver)
+    
+    @staticmethod
+    def wait_for_rerun(driver, since=None, timeout=10):
+        """Aguarda o rerun do Streamlit terminar"""
+        return TestUtils.wait_for_rerun(driver, since=since, timeout=timeout)
+    
+    @staticmethod
+    def dom_snapshot(driver, selectors, **kwargs):
+        """Snapshot de visibilidade, retângulos, texto e atributos em um único round trip"""
+        return TestUtils.dom_snapshot(driver, selectors, **kwargs)
+    
+    @staticmethod
+    def open_page(driver, base_url, page, **params):
+        """Abre uma página diretamente pelo deep link (?page=<slug>) e aguarda o carregamento
+        
+        Filtros da página de projetos podem ser passados como tech=[...] e year="2024".
+        """
+        query = urlencode({"page": page, **params}, doseq=True)
+        driver.get(f"{base_url.rstrip('/')}/?{query}")
+        StreamlitHelper.wait_for_app_load(driver)
+    
+    @staticmethod
+    def sweep_viewports(driver, resolutions, emulate_devices=True):
+        """Mede overflow e alvos de toque em cada resolução sem recarregar a página"""
+        return sweep_viewports(driver, resolutions, emulate_devices=emulate_devices)
+    
     @staticmethod
     def select_sidebar_option(driver, option_text):
-        """Seleciona uma opção no sidebar"""
+        """Seleciona uma opção no sidebar e aguarda o rerun terminar"""
         sidebar = driver.find_element(By.CSS_SELECTOR, "[data-testid='stSidebar']")
         select_element = sidebar.find_element(By.TAG_NAME, "select")
         
         from selenium.webdriver.support.ui import Select
         select = Select(select_element)
+        # Opção já ativa: o Streamlit não faz rerun e não há o que esperar
+        if select.first_selected_option.text == option_text:
+            return
+        since = TestUtils.arm_rerun(driver)
         select.select_by_visible_text(option_text)
+        TestUtils.wait_for_rerun(driver, since=since)
     
     @staticmethod
     def fill_form_field(driver, field_name, value):
@@ -91,11 +661,75 @@ class StreamlitHelper:
     
     @staticmethod
     def click_button(driver, button_text):
-        """Clica em um botão pelo texto"""
+        """Clica em um botão pelo texto e aguarda o rerun terminar"""
         button = driver.find_element(By.XPATH, f"//button[contains(text(), '{button_text}')]")
+        since = TestUtils.arm_rerun(driver)
         button.click()
+        TestUtils.wait_for_rerun(driver, since=since)
+    
+    @staticmethod
+    def fill_contact_form(driver, data):
+        """Preenche o formulário de contato e clica em enviar (mesmos dados do AppTestHelper)"""
+        from selenium.webdriver.support.ui import Select
+        name_input, email_input = driver.find_elements(
+            By.CSS_SELECTOR, "[data-testid='stTextInput'] input"
+        )[:2]
+        name_input.send_keys(data["name"])
+        email_input.send_keys(data["email"])
+        if data["subject"]:
+            subject = driver.find_element(By.CSS_SELECTOR, "[data-testid='stSelectbox'] select")
+            Select(subject).select_by_visible_text(data["subject"])
+        driver.find_element(
+            By.CSS_SELECTOR, "[data-testid='stTextArea'] textarea"
+        ).send_keys(data["message"])
+        
+        StreamlitHelper.click_button(driver, "Enviar Mensagem")
 
 @pytest.fixture
 def streamlit_helper():
     """Fixture para helper do Streamlit"""
-    return StreamlitHelper
\ No newline at end of file
+    return StreamlitHelper
+
+class AppTestHelper:
+    """Classe auxiliar para cenários executados com o AppTest"""
+    
+    @staticmethod
+    def open_page(page, **params):
+        """Executa a aplicação a partir de um deep link (?page=<slug>)"""
+        from streamlit.testing.v1 import AppTest
+        
+        at = AppTest.from_file(str(APP_MAIN), default_timeout=10)
+        at.query_params["page"] = page
+        for key, value in params.items():
+            at.query_params[key] = value
+        return at.run()
+    
+    @staticmethod
+    def select_sidebar_option(at, option_text):
+        """Seleciona uma opção no sidebar e executa o rerun"""
+        return at.selectbox(key="navigation_select").select(option_text).run()
+    
+    @staticmethod
+    def find_markdown(at, testid):
+        """Retorna o markdown que contém o data-testid informado"""
+        for element in at.markdown:
+            if f'data-testid="{testid}"' in element.value:
+                return element
+        return None
+    
+    @staticmethod
+    def fill_contact_form(at, data):
+        """Preenche o formulário de contato e clica em enviar"""
+        at.text_input(key="contact_name").input(data["name"])
+        at.text_input(key="contact_email").input(data["email"])
+        if data["subject"]:
+            at.selectbox(key="contact_subject").select(data["subject"])
+        at.text_area(key="contact_message").input(data["message"])
+        
+        submit = next(button for button in at.button if "Enviar Mensagem" in button.label)
+        return submit.click().run()
+
+@pytest.fixture
+def apptest_helper():
+    """Fixture para helper do AppTest"""
+    return AppTestHelper
\ No newline at end of file
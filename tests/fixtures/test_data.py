@@ -22,6 +22,21 @@ CONTACT_FORM_DATA = {
     }
 }
 
+# Cenários do formulário de contato: conjunto de dados e resultado esperado
+CONTACT_FORM_SCENARIOS = [
+    {"data": "valid", "expected": "success", "message": "sucesso"},
+    {"data": "empty", "expected": "error", "message": "preencha todos os campos"}
+]
+
+# Páginas da aplicação: opção do sidebar, data-testid e texto do título
+# e slug usado no deep link (?page=<slug>)
+PAGES = [
+    {"option": "🏠 Home", "slug": "home", "title_testid": "home-title", "title": "Bem-vindo"},
+    {"option": "👤 Sobre", "slug": "sobre", "title_testid": "about-title", "title": "Sobre Mim"},
+    {"option": "💼 Projetos", "slug": "projetos", "title_testid": "projects-title", "title": "Meus Projetos"},
+    {"option": "📧 Contato", "slug": "contato", "title_testid": "contact-title", "title": "Entre em Contato"}
+]
+
 # Dados de teste para projetos
 PROJECTS_DATA = [
     {
@@ -56,6 +71,8 @@ EXPECTED_METRICS = {
 SCREEN_RESOLUTIONS = [
     {"name": "desktop", "width": 1920, "height": 1080},
     {"name": "laptop", "width": 1366, "height": 768},
-    {"name": "tablet", "width": 768, "height": 1024},
-    {"name": "mobile", "width": 375, "height": 667}
+    {"name": "tablet", "width": 768, "height": 1024,
+     "device_scale_factor": 2, "mobile": True, "touch": True},
+    {"name": "mobile", "width": 375, "height": 667,
+     "device_scale_factor": 2, "mobile": True, "touch": True}
 ]
\ No newline at end of file
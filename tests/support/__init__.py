@@ -0,0 +1 @@
+# Infraestrutura de suporte aos testes E2E
@@ -0,0 +1,125 @@
+"""Captura contínua do console e de exceções JS via WebDriver BiDi"""
+
+import threading
+from collections import deque
+from datetime import datetime
+
+from selenium.common.exceptions import WebDriverException
+
+LEVELS = ("debug", "info", "warn", "error")
+
+
+def level_rank(level):
+    """Posição da severidade em LEVELS (desconhecidas contam como info)"""
+    level = str(level or "info").lower()
+    if level == "warning":
+        level = "warn"
+    return LEVELS.index(level) if level in LEVELS else LEVELS.index("info")
+
+
+class ConsoleBuffer:
+    """Buffer circular de mensagens: a memória fica limitada a `capacity` entradas
+
+    Mensagens abaixo de `min_level` são descartadas na chegada; as que saem
+    do buffer por excesso são contadas em `overwritten`.
+    """
+
+    def __init__(self, capacity=200, min_level="info"):
+        self.min_rank = level_rank(min_level)
+        self.entries = deque(maxlen=capacity)
+        self.received = 0
+        self.overwritten = 0
+        self._lock = threading.Lock()
+
+    def add(self, source, level, message, timestamp=None):
+        if level_rank(level) < self.min_rank:
+            return
+        entry = {
+            "source": source,
+            "level": LEVELS[level_rank(level)],
+            "message": message,
+            "timestamp": timestamp,
+        }
+        # Chamado pela thread do websocket BiDi
+        with self._lock:
+            self.received += 1
+            if len(self.entries) == self.entries.maxlen:
+                self.overwritten += 1
+            self.entries.append(entry)
+
+    def snapshot(self, min_level="debug"):
+        """Cópia das entradas a partir da severidade informada"""
+        rank = level_rank(min_level)
+        with self._lock:
+            return [e for e in self.entries if level_rank(e["level"]) >= rank]
+
+    def has_errors(self):
+        return bool(self.snapshot("error"))
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+
+    def format(self, min_level="debug"):
+        lines = []
+        if self.overwritten:
+            lines.append(f"... {self.overwritten} mensagens mais antigas descartadas")
+        for entry in self.snapshot(min_level):
+            when = ""
+            if entry["timestamp"]:
+                when = datetime.fromtimestamp(entry["timestamp"] / 1000).strftime("%H:%M:%S.%f")[:-3] + " "
+            lines.append(f"{when}[{entry['level']}] {entry['source']}: {entry['message']}")
+        return "\n".join(lines)
+
+
+class ConsoleCapture:
+    """Registra handlers BiDi no driver e alimenta um ConsoleBuffer
+
+    Os eventos chegam pelo websocket BiDi conforme acontecem, sem nenhuma
+    chamada extra ao WebDriver para consultar logs.
+    """
+
+    def __init__(self, driver, buffer):
+        self.driver = driver
+        self.buffer = buffer
+        self._handlers = []
+
+    def attach(self):
+        """Inicia a captura; retorna False se o driver não tiver BiDi habilitado"""
+        try:
+            script = self.driver.script
+            self._handlers = [
+                (script.remove_console_message_handler,
+                 script.add_console_message_handler(self._on_console)),
+                (script.remove_javascript_error_handler,
+                 script.add_javascript_error_handler(self._on_error)),
+            ]
+        except (WebDriverException, AttributeError, KeyError):
+            # Sessão sem webSocketUrl (enable_bidi) ou Selenium sem suporte
+            self.detach()
+            return False
+        self.driver.console_buffer = self.buffer
+        return True
+
+    def detach(self):
+        for remove, handler_id in self._handlers:
+            try:
+                remove(handler_id)
+            except (WebDriverException, KeyError, ValueError):
+                pass
+        self._handlers = []
+        if getattr(self.driver, "console_buffer", None) is self.buffer:
+            del self.driver.console_buffer
+
+    def _on_console(self, entry):
+        self.buffer.add(
+            f"console.{getattr(entry, 'method', None) or 'log'}",
+            getattr(entry, "level", None),
+            getattr(entry, "text", None),
+            getattr(entry, "timestamp", None),
+        )
+
+    def _on_error(self, entry):
+        self.buffer.add(
+            "exception", "error", getattr(entry, "text", None), getattr(entry, "timestamp", None)
+        )
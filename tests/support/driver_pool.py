@@ -0,0 +1,154 @@
+"""Pool de sessões do Chrome reaproveitadas entre os testes"""
+
+import threading
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+from tests.support.viewport import clear_emulation
+
+DEFAULT_WINDOW_SIZE = (1920, 1080)
+
+
+def create_chrome_driver():
+    """Inicia uma nova sessão headless do Chrome"""
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument(f"--window-size={DEFAULT_WINDOW_SIZE[0]},{DEFAULT_WINDOW_SIZE[1]}")
+    # WebDriver BiDi: eventos de console chegam por websocket (ver console_capture)
+    options.enable_bidi = True
+
+    driver = webdriver.Chrome(options=options)
+    # Sem implicit wait: as esperas são explícitas e orientadas a eventos
+    # (ver TestUtils.wait_for_rerun), com folga para o execute_async_script
+    driver.set_script_timeout(60)
+    return driver
+
+
+def _run_with_timeout(func, timeout):
+    """Executa func em uma thread auxiliar; retorna False se falhar ou travar"""
+    outcome = {"ok": False}
+
+    def target():
+        try:
+            func()
+            outcome["ok"] = True
+        except Exception:
+            # Qualquer falha (ex.: conexão recusada) conta como sessão morta
+            pass
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return outcome["ok"] and not thread.is_alive()
+
+
+class DriverPool:
+    """Mantém sessões do Chrome aquecidas e as reinicia entre os testes"""
+
+    def __init__(self, factory=create_chrome_driver, reuse=True,
+                 window_size=DEFAULT_WINDOW_SIZE, health_timeout=5):
+        self.factory = factory
+        self.reuse = reuse
+        self.window_size = window_size
+        self.health_timeout = health_timeout
+        self._idle = []
+        self._lock = threading.Lock()
+        self.launches = 0
+        self.acquisitions = 0
+        self.replacements = 0
+
+    def acquire(self):
+        """Entrega uma sessão saudável, reaproveitando uma ociosa se possível"""
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                break
+            # Verificação fora do lock: um browser travado não bloqueia as outras threads
+            if self.is_alive(driver):
+                with self._lock:
+                    self.acquisitions += 1
+                return driver
+            with self._lock:
+                self.replacements += 1
+            self._discard(driver)
+
+        # Contadores só depois que a sessão de fato iniciou
+        driver = self.factory()
+        with self._lock:
+            self.launches += 1
+            self.acquisitions += 1
+        return driver
+
+    def release(self, driver):
+        """Devolve a sessão ao pool já com o estado limpo"""
+        if not self.reuse:
+            self._discard(driver)
+            return
+
+        if _run_with_timeout(lambda: self.reset(driver), self.health_timeout):
+            with self._lock:
+                self._idle.append(driver)
+        else:
+            with self._lock:
+                self.replacements += 1
+            self._discard(driver)
+
+    def reset(self, driver):
+        """Limpa cookies, storage, abas extras e tamanho da janela"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            # about:blank e páginas de erro não expõem storage
+            pass
+
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except (WebDriverException, AttributeError):
+            driver.delete_all_cookies()
+
+        # Emulação de viewport deixada por um teste que falhou no meio da varredura
+        clear_emulation(driver)
+        driver.set_window_size(*self.window_size)
+        driver.get("about:blank")
+
+    def is_alive(self, driver):
+        """Verifica se a sessão responde dentro do tempo limite"""
+        return _run_with_timeout(
+            lambda: driver.execute_script("return document.readyState"),
+            self.health_timeout
+        )
+
+    def shutdown(self):
+        """Encerra todas as sessões ociosas"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+    def _discard(self, driver):
+        """Encerra a sessão sem ficar preso a um browser travado"""
+        _run_with_timeout(driver.quit, self.health_timeout)
+
+    @property
+    def launches_avoided(self):
+        return self.acquisitions - self.launches
+
+    def stats(self):
+        """Resumo do uso do pool para relatório"""
+        return {
+            "launches": self.launches,
+            "acquisitions": self.acquisitions,
+            "replacements": self.replacements,
+            "launches_avoided": self.launches_avoided,
+        }
@@ -0,0 +1,313 @@
+"""Seleção de testes por impacto: mapa função da aplicação -> testes
+
+O mapa é construído em uma execução completa com `--impact-record`, que
+registra quais funções de `app/` cada teste executou: in-process (AppTest)
+e no servidor Streamlit dos testes E2E. Com `--impact-since <ref>`, o diff
+do git é traduzido em funções alteradas e só os testes que as executaram
+(mais os testes novos ou alterados) são selecionados.
+"""
+
+import ast
+import fnmatch
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from tests.support.perf_baseline import current_commit
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+APP_DIR = "app"
+DEFAULT_MAP_PATH = "reports/impact_map.json"
+MODULE_UNIT = "<module>"
+
+# Mudanças que podem afetar qualquer teste: executa a suíte inteira
+GLOBAL_PATTERNS = (
+    "tests/conftest.py", "tests/support/*", "tests/fixtures/*",
+    "pytest.ini", "requirements.txt", "app/*.css", "app/static/*", ".streamlit/*",
+)
+# Mudanças que não afetam a aplicação nem os testes
+IGNORED_PATTERNS = (
+    "*.md", "docs/*", "LICENSE", ".gitignore", "streamlit_app.py", "dashboard/*",
+)
+
+CONTEXT_ENV = "E2E_IMPACT_CONTEXT"
+POLL_INTERVAL = 0.02
+
+
+def unit_name(path, qualname):
+    """Unidade de impacto: função ou classe de nível superior do arquivo"""
+    name = qualname.split(".")[0]
+    if name.startswith("<"):
+        name = MODULE_UNIT
+    return f"{path}::{name}"
+
+
+class FunctionTracer:
+    """Registra as funções de `app/` chamadas (via sys.setprofile, sem coverage)
+
+    Só vale para a thread atual e para as threads criadas depois do start(),
+    o que inclui as threads de script do Streamlit e do AppTest.
+    """
+
+    def __init__(self, root=REPO_ROOT, app_dir=APP_DIR):
+        self.root = str(root) + os.sep
+        self.prefix = os.path.join(self.root, app_dir) + os.sep
+        self.calls = set()
+        self._units = {}
+
+    def _profile(self, frame, event, arg):
+        if event != "call":
+            return
+        code = frame.f_code
+        unit = self._units.get(code, False)
+        if unit is False:
+            unit = None
+            if code.co_filename.startswith(self.prefix):
+                path = code.co_filename[len(self.root):].replace(os.sep, "/")
+                unit = unit_name(path, code.co_qualname)
+            self._units[code] = unit
+        if unit:
+            self.calls.add(unit)
+
+    def start(self):
+        threading.setprofile(self._profile)
+        sys.setprofile(self._profile)
+
+    def stop(self):
+        sys.setprofile(None)
+        threading.setprofile(None)
+
+    def take(self):
+        """Retorna e zera as funções registradas desde a última chamada"""
+        calls, self.calls = self.calls, set()
+        return calls
+
+
+def _watch_context(tracer, context_path, output_path):
+    """Thread do servidor: troca o teste corrente quando o arquivo de contexto muda"""
+    current, mtime = "", None
+    while True:
+        try:
+            stat = os.stat(context_path)
+            if stat.st_mtime_ns != mtime:
+                mtime = stat.st_mtime_ns
+                with open(context_path, encoding="utf-8") as f:
+                    context = f.read().strip()
+                if context != current:
+                    calls = tracer.take()
+                    if current and calls:
+                        with open(output_path, "a", encoding="utf-8") as out:
+                            out.write(json.dumps({"test": current, "units": sorted(calls)}) + "\n")
+                    current = context
+        except OSError:
+            pass
+        time.sleep(POLL_INTERVAL)
+
+
+def serve(argv):
+    """Executa `streamlit run` com o tracer ativo (usado por StreamlitServer)"""
+    context_path = os.environ[CONTEXT_ENV]
+    output_path = f"{context_path}.{os.getpid()}.jsonl"
+    tracer = FunctionTracer()
+    tracer.start()
+    threading.Thread(
+        target=_watch_context, args=(tracer, context_path, output_path), daemon=True
+    ).start()
+
+    from streamlit.web import cli
+    sys.argv = ["streamlit", "run", *argv]
+    cli.main()
+
+
+class ImpactRecorder:
+    """Constrói o mapa durante uma execução completa"""
+
+    def __init__(self, trace_dir):
+        self.trace_dir = trace_dir
+        self.context_path = os.path.join(trace_dir, f"context-{os.getpid()}")
+        self.tracer = FunctionTracer()
+        self.tests = {}
+        os.makedirs(trace_dir, exist_ok=True)
+        for path in self._server_outputs():
+            os.remove(path)
+        self._set_context("")
+        # Servidores iniciados a partir daqui executam com o tracer (ver StreamlitServer)
+        os.environ[CONTEXT_ENV] = self.context_path
+
+    def start(self):
+        self.tracer.start()
+
+    def begin(self, nodeid):
+        self.tracer.take()
+        self._set_context(nodeid)
+
+    def end(self, nodeid):
+        self.tests.setdefault(nodeid, set()).update(self.tracer.take())
+        self._set_context("")
+
+    def finish(self):
+        """Para o tracer e incorpora o que os servidores registraram"""
+        self.tracer.stop()
+        # O servidor verifica o contexto a cada POLL_INTERVAL
+        time.sleep(POLL_INTERVAL * 5)
+        for path in self._server_outputs():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    record = json.loads(line)
+                    self.tests.setdefault(record["test"], set()).update(record["units"])
+        # Testes sem nenhuma função registrada (ex.: servidor externo ou pool
+        # compartilhado, não rastreáveis) ficam fora do mapa e sempre rodam
+        return {nodeid: sorted(units) for nodeid, units in self.tests.items() if units}
+
+    def _server_outputs(self):
+        prefix = os.path.basename(self.context_path) + "."
+        return [
+            os.path.join(self.trace_dir, name)
+            for name in os.listdir(self.trace_dir) if name.startswith(prefix)
+        ]
+
+    def _set_context(self, nodeid):
+        with open(self.context_path, "w", encoding="utf-8") as f:
+            f.write(nodeid)
+
+
+def save_map(path, tests):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    impact_map = {
+        "commit": current_commit(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "tests": tests,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(impact_map, f, indent=1, sort_keys=True)
+    return impact_map
+
+
+def load_map(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def function_ranges(source):
+    """(unidade, primeira linha, última linha) das definições de nível superior"""
+    ranges = []
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+            ranges.append((node.name, start, node.end_lineno))
+    return ranges
+
+
+def units_for_lines(path, source, lines):
+    """Unidades que contêm as linhas alteradas (fora de funções: o módulo)"""
+    try:
+        ranges = function_ranges(source)
+    except SyntaxError:
+        return {unit_name(path, MODULE_UNIT)}
+    units = set()
+    for line in lines:
+        name = next((n for n, start, end in ranges if start <= line <= end), MODULE_UNIT)
+        units.add(unit_name(path, name))
+    return units
+
+
+HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def parse_diff(diff_text):
+    """path -> (linhas antigas, linhas novas) alteradas, a partir de um diff -U0"""
+    changes, path, old_path = {}, None, None
+    for line in diff_text.splitlines():
+        if line.startswith("--- "):
+            old_path = None if line == "--- /dev/null" else line[6:]
+        elif line.startswith("+++ "):
+            path = old_path if line == "+++ /dev/null" else line[6:]
+            changes.setdefault(path, (set(), set()))
+        elif path and (match := HUNK.match(line)):
+            old_start, old_count, new_start, new_count = (
+                int(value) if value is not None else 1 for value in match.groups()
+            )
+            old_lines, new_lines = changes[path]
+            # Hunks só de remoção/inserção (contagem 0) marcam a linha vizinha
+            old_lines.update(range(old_start, old_start + max(old_count, 1)))
+            new_lines.update(range(new_start, new_start + max(new_count, 1)))
+    return changes
+
+
+def _git(*args):
+    return subprocess.run(
+        ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def changed_files(base):
+    """Alterações da árvore de trabalho em relação a `base`, incluindo arquivos novos"""
+    changes = parse_diff(_git("diff", "-U0", "--no-color", "--no-renames", base))
+    for path in _git("ls-files", "--others", "--exclude-standard").splitlines():
+        changes.setdefault(path, (set(), {0}))
+    return changes
+
+
+def changed_units(base, changes):
+    """Funções da aplicação alteradas, dos dois lados do diff"""
+    units = set()
+    for path, (old_lines, new_lines) in changes.items():
+        if not (path.startswith(f"{APP_DIR}/") and path.endswith(".py")):
+            continue
+        try:
+            old_source = _git("show", f"{base}:{path}")
+        except subprocess.CalledProcessError:
+            old_source = ""
+        new_file = REPO_ROOT / path
+        new_source = new_file.read_text(encoding="utf-8") if new_file.exists() else ""
+        if old_source:
+            units |= units_for_lines(path, old_source, old_lines)
+        if new_source:
+            units |= units_for_lines(path, new_source, new_lines)
+    return units
+
+
+def _matches(path, patterns):
+    return any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
+
+
+def select_tests(impact_map, changes, units, nodeids):
+    """Retorna (testes selecionados, motivo) ou (None, motivo) para rodar tudo"""
+    mapped = impact_map["tests"]
+    selected = set()
+
+    for path in changes:
+        if _matches(path, IGNORED_PATTERNS):
+            continue
+        if _matches(path, GLOBAL_PATTERNS):
+            return None, f"{path} afeta todos os testes"
+        if path.startswith("tests/"):
+            # Testes novos ou alterados sempre rodam
+            selected.update(n for n in nodeids if n.split("::")[0] == path)
+        elif path.startswith(f"{APP_DIR}/") and not path.endswith(".py"):
+            return None, f"{path} não tem mapeamento por função"
+        elif not path.startswith(f"{APP_DIR}/"):
+            return None, f"{path} está fora do mapa de impacto"
+
+    for nodeid in nodeids:
+        if nodeid not in mapped:
+            # Sem histórico de execução (teste novo ou não rastreável): roda por segurança
+            selected.add(nodeid)
+        elif units.intersection(mapped[nodeid]):
+            selected.add(nodeid)
+
+    return selected, f"{len(units)} funções alteradas"
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["serve"]:
+        serve(sys.argv[2:])
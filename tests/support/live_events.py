@@ -0,0 +1,131 @@
+"""Resultados da execução em JSONL, para o dashboard e outras ferramentas
+
+Cada linha é um registro JSON compacto. O dashboard lê os registros ao
+vivo por um pipe (descritor de escrita em `E2E_EVENTS_FD`), e
+`--results-log` grava os mesmos registros em um arquivo, comprimido com
+gzip se o nome terminar em `.gz`:
+
+    {"event": "collected", "total": 18}
+    {"event": "test", "nodeid": "...", "phase": "call", "outcome": "failed",
+     "duration": 1.2, "worker": "gw0", "error": "AssertionError: ..."}
+    {"event": "finish", "exitstatus": 1, "duration": 9.8}
+
+Há um registro `test` para cada fase `call` e para setup/teardown que não
+passaram, contados como no resumo do próprio pytest.
+"""
+
+import gzip
+import io
+import json
+import os
+import time
+
+import pytest
+
+EVENTS_ENV = "E2E_EVENTS_FD"
+MAX_ERROR_LENGTH = 300
+
+
+def report_outcome(report):
+    """Resultado do relatório de uma fase, com os nomes do resumo do pytest"""
+    if hasattr(report, "wasxfail"):
+        return "xfailed" if report.skipped else "xpassed"
+    if report.failed and report.when != "call":
+        return "error"
+    return report.outcome
+
+
+def error_summary(report):
+    """Primeira linha da mensagem de erro"""
+    crash = getattr(report.longrepr, "reprcrash", None)
+    text = crash.message if crash else str(report.longrepr or "")
+    text = text.strip()
+    return text.splitlines()[0][:MAX_ERROR_LENGTH] if text else None
+
+
+def result_record(report):
+    record = {
+        "nodeid": report.nodeid,
+        "phase": report.when,
+        "outcome": report_outcome(report),
+        "duration": round(report.duration, 4),
+    }
+    # Com xdist o controlador recebe o relatório com o nó de origem
+    node = getattr(report, "node", None)
+    if node is not None:
+        record["worker"] = node.gateway.id
+    if report.failed:
+        record["error"] = error_summary(report)
+    return record
+
+
+class LiveEvents:
+    """Plugin do processo principal (com xdist, o controlador recebe todos os relatórios)"""
+
+    def __init__(self, stream, live=True):
+        self.stream = stream
+        self.live = live
+        self.total = None
+        self.started = time.perf_counter()
+
+    @classmethod
+    def from_fd(cls, fd):
+        return cls(os.fdopen(fd, "w", encoding="utf-8", buffering=1))
+
+    @classmethod
+    def from_path(cls, path):
+        """Arquivo de resultados: sem os eventos de progresso (`start`, `running`)"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if path.endswith(".gz"):
+            # Sync flush a cada linha: execução interrompida não perde os registros já gravados
+            stream = io.TextIOWrapper(gzip.GzipFile(path, "wb"), encoding="utf-8", line_buffering=True)
+            return cls(stream, live=False)
+        return cls(open(path, "w", encoding="utf-8", buffering=1), live=False)
+
+    def emit(self, event, **data):
+        try:
+            self.stream.write(json.dumps({"event": event, **data}, separators=(",", ":")) + "\n")
+        except (OSError, ValueError):
+            # Dashboard fechou o pipe: a execução continua sem eventos
+            pass
+
+    def pytest_sessionstart(self, session):
+        if self.live:
+            self.emit("start", pid=os.getpid())
+
+    def pytest_collection_finish(self, session):
+        self._collected(len(session.items))
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node, ids):
+        self._collected(len(ids))
+
+    def _collected(self, total):
+        # Com xdist cada worker coleta os mesmos testes: vale o primeiro
+        if self.total is None:
+            self.total = total
+            self.emit("collected", total=total)
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.emit("collect_error", nodeid=report.nodeid, error=error_summary(report))
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        if self.live:
+            self.emit("running", nodeid=nodeid)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call" or not report.passed:
+            self.emit("test", **result_record(report))
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.emit(
+            "finish", exitstatus=int(exitstatus),
+            duration=round(time.perf_counter() - self.started, 3),
+        )
+
+    def pytest_unconfigure(self, config):
+        try:
+            self.stream.close()
+        except OSError:
+            pass
@@ -0,0 +1,250 @@
+"""Gerador de carga no nível do protocolo websocket do Streamlit (sem browser)"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+
+import websocket
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.Selectbox_pb2 import Selectbox
+from streamlit.proto.MultiSelect_pb2 import MultiSelect
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from tests.fixtures.test_data import CONTACT_FORM_DATA
+from tests.support.perf_baseline import percentile
+
+WIDGET_TYPES = ("selectbox", "multiselect", "button", "text_input", "text_area")
+
+# Versões recentes do Streamlit enviam o valor de selectbox/multiselect como
+# texto; as antigas, como índice das opções
+SELECTBOX_BY_VALUE = "raw_value" in Selectbox.DESCRIPTOR.fields_by_name
+MULTISELECT_BY_VALUE = "raw_values" in MultiSelect.DESCRIPTOR.fields_by_name
+
+
+class LoadSessionError(Exception):
+    """O rerun falhou ou a aplicação exibiu uma exceção"""
+
+
+class StreamlitSession:
+    """Uma sessão da aplicação dirigida diretamente pelo websocket"""
+
+    def __init__(self, base_url, timeout=30):
+        self.url = base_url.rstrip("/").replace("http", "ws", 1) + "/_stcore/stream"
+        self.timeout = timeout
+        self.ws = None
+        self.page_script_hash = ""
+        self.widgets = {}
+        self.widget_states = {}
+
+    def connect(self):
+        self.ws = websocket.create_connection(
+            self.url, subprotocols=["streamlit"], timeout=self.timeout
+        )
+        return self
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+            self.ws = None
+
+    def rerun(self, query_string=""):
+        """Envia um rerun com o estado atual dos widgets e retorna a latência até o script terminar"""
+        message = BackMsg()
+        client_state = message.rerun_script
+        client_state.query_string = query_string
+        client_state.page_script_hash = self.page_script_hash
+        client_state.widget_states.widgets.extend(self.widget_states.values())
+
+        started = time.perf_counter()
+        self.ws.send_binary(message.SerializeToString())
+
+        widgets, exceptions = {}, []
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(self.ws.recv())
+            kind = forward.WhichOneof("type")
+
+            if kind == "new_session":
+                self.page_script_hash = forward.new_session.main_script_hash
+            elif kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type in WIDGET_TYPES:
+                    proto = getattr(element, element_type)
+                    widgets[proto.id] = (element_type, proto)
+                elif element_type == "exception":
+                    exceptions.append(element.exception.message)
+            elif kind == "script_finished":
+                latency = time.perf_counter() - started
+                break
+
+        # Como no frontend: só widgets renderizados mantêm estado; triggers são de uso único
+        self.widgets = widgets
+        self.widget_states = {
+            widget_id: state for widget_id, state in self.widget_states.items()
+            if widget_id in widgets and not state.HasField("trigger_value")
+        }
+
+        if forward.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY or exceptions:
+            raise LoadSessionError(exceptions[0] if exceptions else "Script não terminou com sucesso")
+        return latency
+
+    def find_widget(self, key=None, label=None):
+        """Localiza um widget pela key do usuário ou pelo label"""
+        for widget_id, (element_type, proto) in self.widgets.items():
+            if key is not None and widget_id.endswith(f"-{key}"):
+                return widget_id, element_type, proto
+            if label is not None and label in proto.label:
+                return widget_id, element_type, proto
+        raise LoadSessionError(f"Widget não encontrado: {key or label}")
+
+    def set_value(self, key, value):
+        """Define o valor de um widget (aplicado no próximo rerun)"""
+        widget_id, element_type, proto = self.find_widget(key=key)
+        state = WidgetState(id=widget_id)
+
+        if element_type == "selectbox":
+            if SELECTBOX_BY_VALUE:
+                state.string_value = value
+            else:
+                state.int_value = list(proto.options).index(value)
+        elif element_type == "multiselect":
+            if MULTISELECT_BY_VALUE:
+                state.string_array_value.data.extend(value)
+            else:
+                state.int_array_value.data.extend(list(proto.options).index(v) for v in value)
+        else:
+            state.string_value = value
+
+        self.widget_states[widget_id] = state
+
+    def click(self, key=None, label=None):
+        """Aciona um botão (aplicado no próximo rerun)"""
+        widget_id, _, _ = self.find_widget(key=key, label=label)
+        self.widget_states[widget_id] = WidgetState(id=widget_id, trigger_value=True)
+
+
+def portfolio_flow(session):
+    """Fluxo típico: home, Projetos, filtro de tecnologia e envio do contato"""
+    contact = CONTACT_FORM_DATA["valid"]
+
+    yield "home", session.rerun()
+
+    session.set_value("navigation_select", "💼 Projetos")
+    yield "projetos", session.rerun()
+
+    session.set_value("tech_filter", ["Python"])
+    yield "tech_filter", session.rerun()
+
+    session.set_value("navigation_select", "📧 Contato")
+    yield "contato", session.rerun()
+
+    session.set_value("contact_name", contact["name"])
+    session.set_value("contact_email", contact["email"])
+    session.set_value("contact_subject", contact["subject"])
+    session.set_value("contact_message", contact["message"])
+    session.click(label="Enviar Mensagem")
+    yield "contact_form", session.rerun()
+
+
+def summarize(latencies):
+    """Percentis de latência em milissegundos"""
+    if not latencies:
+        return {"count": 0}
+    return {
+        "count": len(latencies),
+        "p50": percentile(latencies, 0.50) * 1000,
+        "p95": percentile(latencies, 0.95) * 1000,
+        "p99": percentile(latencies, 0.99) * 1000,
+        "max": max(latencies) * 1000,
+    }
+
+
+def run_stage(base_url, users, iterations=1, flow=portfolio_flow, ramp_up=0.0):
+    """Executa `users` sessões simultâneas, cada uma repetindo o fluxo `iterations` vezes"""
+    lock = threading.Lock()
+    latencies = {}
+    errors = []
+
+    def user():
+        session = StreamlitSession(base_url)
+        try:
+            session.connect()
+            for _ in range(iterations):
+                for step, latency in flow(session):
+                    with lock:
+                        latencies.setdefault(step, []).append(latency)
+        except (LoadSessionError, websocket.WebSocketException, OSError) as e:
+            with lock:
+                errors.append(str(e))
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=user, daemon=True) for _ in range(users)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+        if ramp_up:
+            time.sleep(ramp_up / users)
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        "users": users,
+        "duration": elapsed,
+        "reruns": len(all_latencies),
+        "throughput": len(all_latencies) / elapsed if elapsed else 0.0,
+        "errors": errors,
+        "latency": summarize(all_latencies),
+        "steps": {step: summarize(values) for step, values in latencies.items()},
+    }
+
+
+def run_ramp(base_url, stages, iterations=1, ramp_up=0.0):
+    """Executa um estágio por nível de concorrência, do menor para o maior"""
+    return [run_stage(base_url, users, iterations, ramp_up=ramp_up) for users in stages]
+
+
+def format_stage(stage):
+    latency = stage["latency"]
+    if not latency["count"]:
+        return f"{stage['users']:>4} usuários: sem reruns, {len(stage['errors'])} erros"
+    return (
+        f"{stage['users']:>4} usuários: {stage['throughput']:7.1f} reruns/s  "
+        f"p50 {latency['p50']:7.1f} ms  p95 {latency['p95']:7.1f} ms  "
+        f"p99 {latency['p99']:7.1f} ms  erros {len(stage['errors'])}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Teste de carga da aplicação via websocket")
+    parser.add_argument("url", help="URL base da aplicação, ex.: http://localhost:8501")
+    parser.add_argument("--stages", default="1,5,10,25,50",
+                        help="Níveis de concorrência separados por vírgula")
+    parser.add_argument("--iterations", type=int, default=3,
+                        help="Repetições do fluxo por usuário em cada estágio")
+    parser.add_argument("--ramp-up", type=float, default=0.0,
+                        help="Segundos para iniciar todos os usuários de um estágio")
+    parser.add_argument("--json", help="Grava o relatório completo neste arquivo")
+    args = parser.parse_args(argv)
+
+    stages = [int(value) for value in args.stages.split(",")]
+    report = []
+    for users in stages:
+        stage = run_stage(args.url, users, args.iterations, ramp_up=args.ramp_up)
+        report.append(stage)
+        print(format_stage(stage))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if any(stage["errors"] for stage in report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""Histórico persistente de medições de tempo e detecção de regressões"""
+
+import os
+import sqlite3
+import statistics
+import subprocess
+from datetime import datetime
+
+DEFAULT_HISTORY_PATH = "reports/perf_history.db"
+
+
+class PerfRegressionWarning(UserWarning):
+    """Medição significativamente mais lenta que o baseline"""
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS measurements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    commit_sha TEXT NOT NULL,
+    test TEXT NOT NULL,
+    page TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_measurements_key
+    ON measurements (test, page, resolution, metric, id);
+"""
+
+
+def current_commit():
+    """Commit atual (GIT_COMMIT tem prioridade, útil em CI)"""
+    if os.environ.get("GIT_COMMIT"):
+        return os.environ["GIT_COMMIT"][:12]
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short=12", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def percentile(values, fraction):
+    """Percentil por interpolação linear"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def detect_regression(value, history, tolerance=0.10, min_samples=5, z_threshold=3.0):
+    """Compara uma medição com o baseline (mediana e p95 das execuções anteriores)
+
+    É regressão quando o valor supera o p95, fica mais de `tolerance` acima da
+    mediana e está a mais de `z_threshold` desvios robustos (MAD) da mediana.
+    Retorna None sem histórico suficiente ou quando não há regressão.
+    """
+    if len(history) < min_samples:
+        return None
+
+    median = statistics.median(history)
+    p95 = percentile(history, 0.95)
+    mad = statistics.median(abs(v - median) for v in history)
+    # Piso de ruído para séries muito estáveis (MAD = 0)
+    spread = max(1.4826 * mad, median * 0.01, 1e-9)
+    z_score = (value - median) / spread
+
+    if value > p95 and value > median * (1 + tolerance) and z_score > z_threshold:
+        return {
+            "value": value,
+            "median": median,
+            "p95": p95,
+            "slowdown": value / median - 1 if median else float("inf"),
+            "z_score": z_score,
+            "samples": len(history),
+        }
+    return None
+
+
+class PerfHistory:
+    """Armazena medições em SQLite, chaveadas por teste, página, resolução e commit"""
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH, window=20, commit=None):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.window = window
+        self.commit = commit or current_commit()
+        # WAL + timeout: vários workers xdist gravando no mesmo arquivo
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    def baseline(self, test, page, resolution, metric):
+        """Últimas `window` medições da mesma chave"""
+        rows = self.connection.execute(
+            """SELECT value FROM measurements
+               WHERE test = ? AND page = ? AND resolution = ? AND metric = ?
+               ORDER BY id DESC LIMIT ?""",
+            (test, page, resolution, metric, self.window)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def record(self, test, page, resolution, metric, value):
+        with self.connection:
+            self.connection.execute(
+                """INSERT INTO measurements
+                   (timestamp, commit_sha, test, page, resolution, metric, value)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (datetime.now().isoformat(timespec="seconds"), self.commit,
+                 test, page, resolution, metric, value)
+            )
+
+    def close(self):
+        self.connection.close()
+
+
+class PerfBaseline:
+    """Registra as medições de um teste e acumula as regressões encontradas"""
+
+    def __init__(self, history, test, tolerance=0.10):
+        self.history = history
+        self.test = test
+        self.tolerance = tolerance
+        self.regressions = []
+
+    def measure(self, page, metric, value, resolution="default"):
+        """Compara com o baseline e grava a medição no histórico"""
+        if value is None:
+            return None
+
+        previous = self.history.baseline(self.test, page, resolution, metric)
+        regression = detect_regression(value, previous, tolerance=self.tolerance)
+        self.history.record(self.test, page, resolution, metric, value)
+
+        if regression:
+            regression.update(test=self.test, page=page, resolution=resolution, metric=metric)
+            self.regressions.append(regression)
+        return regression
+
+
+def format_regression(regression):
+    return (
+        f"{regression['test']} [{regression['page']} @ {regression['resolution']}] "
+        f"{regression['metric']}: {regression['value']:.3f} vs mediana "
+        f"{regression['median']:.3f} (p95 {regression['p95']:.3f}, "
+        f"+{regression['slowdown']:.0%}, n={regression['samples']})"
+    )
@@ -0,0 +1,149 @@
+"""Coleta de métricas de performance do browser via CDP e Navigation/Paint Timing"""
+
+import json
+import os
+import re
+
+from selenium.common.exceptions import WebDriverException
+
+PERF_ARTIFACTS_DIR = "reports/perf"
+
+# Injetado antes de qualquer script da página: registra long tasks e o
+# instante da primeira mensagem e do primeiro delta recebidos pelo websocket
+# do Streamlit (ForwardMsg com o campo 5, `delta`).
+INSTRUMENTATION_SCRIPT = """
+(() => {
+    if (window.__e2ePerf) return;
+    const perf = window.__e2ePerf = {longTasks: [], firstMessage: null, firstDelta: null, deltas: 0};
+
+    try {
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) perf.longTasks.push(entry.duration);
+        }).observe({type: "longtask", buffered: true});
+    } catch (e) {
+        // Browser sem suporte a long tasks
+    }
+
+    function hasDelta(buffer) {
+        const bytes = new Uint8Array(buffer);
+        let i = 0;
+        const varint = () => {
+            let result = 0, shift = 0, byte;
+            do {
+                byte = bytes[i++];
+                result += (byte & 0x7f) * 2 ** shift;
+                shift += 7;
+            } while (byte & 0x80 && i < bytes.length);
+            return result;
+        };
+        while (i < bytes.length) {
+            const tag = varint();
+            const field = Math.floor(tag / 8), wire = tag % 8;
+            if (field === 5) return true;
+            if (wire === 0) varint();
+            else if (wire === 1) i += 8;
+            else if (wire === 2) {
+                const length = varint();
+                i += length;
+            }
+            else if (wire === 5) i += 4;
+            else return false;
+        }
+        return false;
+    }
+
+    const NativeWebSocket = window.WebSocket;
+    window.WebSocket = class extends NativeWebSocket {
+        constructor(...args) {
+            super(...args);
+            this.addEventListener("message", (event) => {
+                const now = performance.now();
+                if (perf.firstMessage === null) perf.firstMessage = now;
+                if (event.data instanceof ArrayBuffer && hasDelta(event.data)) {
+                    perf.deltas += 1;
+                    if (perf.firstDelta === null) perf.firstDelta = now;
+                }
+            });
+        }
+    };
+})();
+"""
+
+COLLECT_SCRIPT = """
+const nav = performance.getEntriesByType("navigation")[0];
+const paint = performance.getEntriesByName("first-contentful-paint")[0];
+const perf = window.__e2ePerf || {longTasks: [], firstMessage: null, firstDelta: null, deltas: 0};
+return {
+    viewport: window.innerWidth + "x" + window.innerHeight,
+    ttfb: nav ? nav.responseStart - nav.startTime : null,
+    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+    load_event: nav ? nav.loadEventEnd : null,
+    first_contentful_paint: paint ? paint.startTime : null,
+    long_tasks: perf.longTasks.length,
+    long_task_time: perf.longTasks.reduce((a, b) => a + b, 0),
+    first_websocket_message: perf.firstMessage,
+    first_delta: perf.firstDelta,
+    deltas: perf.deltas
+};
+"""
+
+
+def artifact_path(directory, nodeid):
+    """Nome de arquivo seguro derivado do nodeid do teste"""
+    safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")
+    return os.path.join(directory, f"{safe}.json")
+
+
+class PerformanceCollector:
+    """Registra métricas reais de carregamento para cada página visitada
+
+    Tempos em milissegundos a partir do início da navegação; heap em bytes.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.records = []
+        self._script_id = None
+
+    def install(self):
+        """Habilita o domínio Performance e injeta a instrumentação nas próximas páginas"""
+        self.driver.execute_cdp_cmd("Performance.enable", {})
+        result = self.driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": INSTRUMENTATION_SCRIPT}
+        )
+        self._script_id = result.get("identifier")
+
+    def uninstall(self):
+        """Remove a instrumentação para não afetar o próximo teste da sessão"""
+        try:
+            if self._script_id:
+                self.driver.execute_cdp_cmd(
+                    "Page.removeScriptToEvaluateOnNewDocument", {"identifier": self._script_id}
+                )
+            self.driver.execute_cdp_cmd("Performance.disable", {})
+        except WebDriverException:
+            pass
+        self._script_id = None
+
+    def collect(self, page):
+        """Coleta as métricas da página atual e as acumula no registro do teste"""
+        record = {"page": page, **self.driver.execute_script(COLLECT_SCRIPT)}
+
+        metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        values = {metric["name"]: metric["value"] for metric in metrics}
+        record["js_heap_used"] = values.get("JSHeapUsedSize")
+        record["js_heap_total"] = values.get("JSHeapTotalSize")
+
+        self.records.append(record)
+        return record
+
+    def write_artifact(self, directory, nodeid):
+        """Grava as métricas do teste em um JSON próprio"""
+        if not self.records:
+            return None
+
+        os.makedirs(directory, exist_ok=True)
+        path = artifact_path(directory, nodeid)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"test": nodeid, "pages": self.records}, f, indent=2)
+        return path
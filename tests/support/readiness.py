@@ -0,0 +1,86 @@
+"""Verificação de prontidão do servidor Streamlit pelo endpoint de health"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import requests
+
+HEALTH_PATH = "/_stcore/health"
+
+
+class StreamlitStartupError(Exception):
+    """O servidor Streamlit não ficou pronto"""
+
+
+def wait_for_streamlit(url, process=None, timeout=30, started_at=None,
+                       initial_delay=0.05, max_delay=0.5):
+    """Aguarda o health endpoint responder e retorna o tempo até ficar pronto
+
+    Se `process` for informado, falha imediatamente caso ele termine antes
+    de o servidor responder.
+    """
+    health_url = url.rstrip("/") + HEALTH_PATH
+    if started_at is None:
+        started_at = time.perf_counter()
+    deadline = started_at + timeout
+    delay = initial_delay
+
+    while True:
+        if process is not None and process.poll() is not None:
+            raise StreamlitStartupError(
+                f"Processo do Streamlit terminou com código {process.returncode} antes de ficar pronto"
+            )
+
+        try:
+            response = requests.get(health_url, timeout=max_delay)
+            if response.status_code == 200:
+                return time.perf_counter() - started_at
+        except requests.exceptions.RequestException:
+            pass
+
+        if time.perf_counter() + delay > deadline:
+            raise StreamlitStartupError(
+                f"Streamlit não respondeu em {health_url} após {timeout}s"
+            )
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+def record_startup_times(path, entries):
+    """Acrescenta os tempos de inicialização ao histórico em JSON Lines"""
+    try:
+        import streamlit
+        version = streamlit.__version__
+    except ImportError:
+        version = None
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    timestamp = datetime.now().isoformat(timespec="seconds")
+    with open(path, "a", encoding="utf-8") as f:
+        for entry in entries:
+            record = {"timestamp": timestamp, "streamlit_version": version, **entry}
+            f.write(json.dumps(record) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aguarda o servidor Streamlit ficar pronto")
+    parser.add_argument("url", help="URL base da aplicação, ex.: http://app:8501")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args(argv)
+
+    try:
+        elapsed = wait_for_streamlit(args.url, timeout=args.timeout)
+    except StreamlitStartupError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(f"Streamlit pronto em {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
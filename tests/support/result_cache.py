@@ -0,0 +1,222 @@
+"""Cache de resultados: testes aprovados com as mesmas entradas não são executados de novo
+
+A chave de cada teste é o hash do arquivo do teste, da infraestrutura de
+testes (conftest, fixtures, support), dos fontes de `app/` e das versões do
+Python, Streamlit, Selenium e do Chrome.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from _pytest.runner import CallInfo
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+CACHE_DIR = REPO_ROOT / ".pytest_cache" / "d" / "e2e-result-cache"
+SUMMARY_PATH = "reports/result_cache.json"
+CACHED_PROPERTY = "result_cache"
+
+# Entradas compartilhadas por todos os testes
+INPUT_GLOBS = (
+    "tests/conftest.py", "tests/fixtures/**/*", "tests/support/**/*.py",
+    "app/**/*", "pytest.ini", "requirements.txt",
+)
+# Testes que medem ou gravam histórico precisam rodar sempre
+UNCACHEABLE_FIXTURES = ("perf_metrics", "perf_baseline")
+UNCACHEABLE_MARKERS = ("load",)
+BROWSERS = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def browser_version():
+    """Versão do Chrome instalado, sem abrir o browser"""
+    for name in BROWSERS:
+        executable = shutil.which(name)
+        if executable:
+            try:
+                return subprocess.run(
+                    [executable, "--version"], capture_output=True, text=True, timeout=10
+                ).stdout.strip()
+            except (OSError, subprocess.TimeoutExpired):
+                break
+    return "unknown"
+
+
+def environment_fingerprint():
+    import selenium
+    import streamlit
+    return {
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "selenium": selenium.__version__,
+        "browser": browser_version(),
+    }
+
+
+def inputs_digest(root=REPO_ROOT, globs=INPUT_GLOBS, environment=None):
+    """Hash das entradas compartilhadas e do ambiente"""
+    digest = hashlib.sha256()
+    paths = sorted({
+        path for pattern in globs for path in root.glob(pattern)
+        if path.is_file() and "__pycache__" not in path.parts
+    })
+    for path in paths:
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(file_digest(path).encode())
+    digest.update(json.dumps(environment or environment_fingerprint(), sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def cacheable(item):
+    if any(name in item.fixturenames for name in UNCACHEABLE_FIXTURES):
+        return False
+    return not any(item.get_closest_marker(marker) for marker in UNCACHEABLE_MARKERS)
+
+
+class ResultCache:
+    """Plugin: reporta como aprovados, sem executar, os testes com chave já aprovada"""
+
+    def __init__(self, directory=CACHE_DIR, refresh=False):
+        self.directory = Path(directory)
+        self.refresh = refresh
+        self.keys = {}
+        self.outcomes = {}
+        self.counts = {"cached": 0, "executed": 0}
+        self._shared = None
+        self._modules = {}
+
+    def key(self, item):
+        if self._shared is None:
+            self._shared = inputs_digest()
+        if item.path not in self._modules:
+            self._modules[item.path] = file_digest(item.path)
+        digest = hashlib.sha256()
+        for part in (self._shared, self._modules[item.path], item.nodeid):
+            digest.update(part.encode())
+        return digest.hexdigest()
+
+    def entry_path(self, key):
+        return self.directory / key[:2] / f"{key}.json"
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items):
+        self.keys = {item.nodeid: self.key(item) for item in items if cacheable(item)}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        key = self.keys.get(item.nodeid)
+        if not key or self.refresh or not self.entry_path(key).exists():
+            return None
+
+        # Mesmo fluxo de relatórios de um teste aprovado, sem fixtures nem browser
+        ihook = item.ihook
+        ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for when in ("setup", "call", "teardown"):
+            call = CallInfo.from_call(lambda: None, when=when)
+            report = ihook.pytest_runtest_makereport(item=item, call=call)
+            # Lista nova: o relatório compartilha item.user_properties
+            report.user_properties = [*report.user_properties, (CACHED_PROPERTY, key[:12])]
+            ihook.pytest_runtest_logreport(report=report)
+        ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def pytest_runtest_logreport(self, report):
+        cached = any(name == CACHED_PROPERTY for name, _ in report.user_properties)
+        if report.when == "call":
+            self.counts["cached" if cached else "executed"] += 1
+
+        key = self.keys.get(report.nodeid)
+        if not key or cached:
+            return
+        self.outcomes.setdefault(report.nodeid, []).append(report.passed)
+        if report.when == "teardown" and all(self.outcomes.pop(report.nodeid)):
+            self._store(key, report.nodeid)
+
+    def pytest_sessionfinish(self, session):
+        if not hasattr(session.config, "workerinput"):
+            write_summary(self.summary())
+
+    def pytest_report_teststatus(self, report, config):
+        if report.when == "call" and report.passed and any(
+            name == CACHED_PROPERTY for name, _ in report.user_properties
+        ):
+            return "passed", "c", "CACHED"
+        return None
+
+    def _store(self, key, nodeid):
+        path = self.entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({
+            "nodeid": nodeid, "passed_at": datetime.now().isoformat(timespec="seconds")
+        }), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def summary(self):
+        total = self.counts["cached"] + self.counts["executed"]
+        return {
+            **self.counts,
+            "total": total,
+            "cached_ratio": self.counts["cached"] / total if total else 0.0,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+        }
+
+
+def write_summary(summary, path=SUMMARY_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+
+def load_summary(path=SUMMARY_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def clear(directory=CACHE_DIR):
+    """Invalida todo o cache; retorna o número de entradas removidas"""
+    directory = Path(directory)
+    if not directory.exists():
+        return 0
+    removed = sum(1 for _ in directory.rglob("*.json"))
+    shutil.rmtree(directory)
+    return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cache de resultados dos testes")
+    parser.add_argument("command", choices=["clear", "stats"])
+    parser.add_argument("--dir", default=CACHE_DIR)
+    args = parser.parse_args(argv)
+
+    if args.command == "clear":
+        print(f"{clear(args.dir)} resultados removidos do cache")
+    else:
+        entries = list(Path(args.dir).rglob("*.json")) if Path(args.dir).exists() else []
+        print(f"{len(entries)} resultados em cache")
+        summary = load_summary()
+        if summary:
+            print(f"Última execução: {summary['cached']} de {summary['total']} testes do cache")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""Escalonamento do xdist guiado pelo histórico de duração e agrupado por página"""
+
+import json
+import os
+import statistics
+
+from xdist.scheduler import LoadScopeScheduling
+
+from tests.support.result_cache import CACHED_PROPERTY
+
+DEFAULT_DURATIONS_PATH = "reports/test_durations.json"
+DEFAULT_DURATION = 1.0
+PAGE_SCOPE = "page:"
+
+
+def page_of(item):
+    """Página que o teste exercita: marker `page` ou parâmetro `page` de PAGES"""
+    marker = item.get_closest_marker("page")
+    if marker and marker.args:
+        return marker.args[0]
+    callspec = getattr(item, "callspec", None)
+    page = callspec.params.get("page") if callspec else None
+    if isinstance(page, dict):
+        return page.get("slug")
+    return page if isinstance(page, str) else None
+
+
+class DurationHistory:
+    """Duração média móvel (EMA) e página de cada teste, persistidas em JSON"""
+
+    def __init__(self, path=DEFAULT_DURATIONS_PATH, alpha=0.3):
+        self.path = path
+        self.alpha = alpha
+        self.tests = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.tests = json.load(f)
+        except (OSError, ValueError):
+            pass
+        known = [entry["duration"] for entry in self.tests.values()]
+        # Teste sem histórico: mediana dos conhecidos
+        self.default = statistics.median(known) if known else DEFAULT_DURATION
+
+    def duration(self, nodeid):
+        entry = self.tests.get(nodeid)
+        return entry["duration"] if entry else self.default
+
+    def page(self, nodeid):
+        entry = self.tests.get(nodeid)
+        return entry.get("page") if entry else None
+
+    def update(self, nodeid, duration, page=None):
+        entry = self.tests.get(nodeid)
+        if entry:
+            duration = self.alpha * duration + (1 - self.alpha) * entry["duration"]
+        self.tests[nodeid] = {"duration": round(duration, 4), "page": page}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.tests, f, indent=1, sort_keys=True)
+
+
+class DurationRecorder:
+    """Plugin do processo principal: soma as fases de cada teste e atualiza o histórico"""
+
+    def __init__(self, path=DEFAULT_DURATIONS_PATH):
+        self.path = path
+        self.durations = {}
+
+    def pytest_runtest_logreport(self, report):
+        properties = dict(report.user_properties)
+        # Resultado reaproveitado do cache (--result-cache): duração ~0, não é uma medição
+        if CACHED_PROPERTY in properties:
+            return
+        entry = self.durations.setdefault(report.nodeid, [0.0, None])
+        entry[0] += report.duration
+        entry[1] = properties.get("page", entry[1])
+
+    def pytest_sessionfinish(self, session):
+        if not self.durations:
+            return
+        history = DurationHistory(self.path)
+        for nodeid, (duration, page) in self.durations.items():
+            history.update(nodeid, duration, page)
+        history.save()
+
+
+class HistoryScheduling(LoadScopeScheduling):
+    """Longest-processing-time-first com afinidade de página
+
+    Testes da mesma página formam uma unidade de trabalho (partida em blocos
+    quando passaria de 1/N do tempo total, para não desbalancear). O worker
+    livre recebe o próximo bloco da página em que já está; se não houver,
+    o bloco restante mais longo.
+    """
+
+    def __init__(self, config, log=None, history=None):
+        super().__init__(config, log)
+        self.history = history or DurationHistory()
+        self.node_page = {}
+        self.chunk_scopes = {}
+
+    def schedule(self):
+        # Os blocos precisam existir antes da distribuição inicial: a classe
+        # base encerra os workers que sobram em relação ao número de unidades
+        if self.collection is None and self.collection_is_completed and self.registered_collections:
+            self.chunk_scopes = self._plan_chunks(next(iter(self.registered_collections.values())))
+        super().schedule()
+
+    def _page_scope(self, nodeid):
+        page = self.history.page(nodeid)
+        return f"{PAGE_SCOPE}{page}" if page else nodeid
+
+    def _split_scope(self, nodeid):
+        return self.chunk_scopes.get(nodeid) or self._page_scope(nodeid)
+
+    def _unit_duration(self, work_unit):
+        return sum(self.history.duration(nodeid) for nodeid in work_unit)
+
+    def _plan_chunks(self, collection):
+        """Divide grupos de página maiores que a fatia ideal de cada worker
+
+        Retorna o escopo de cada teste que foi para um bloco (`page:<slug>#<n>`).
+        """
+        groups = {}
+        for nodeid in collection:
+            groups.setdefault(self._page_scope(nodeid), []).append(nodeid)
+        target = self._unit_duration(collection) / max(len(self.nodes), 1)
+        chunk_scopes = {}
+        for scope, nodeids in groups.items():
+            if not scope.startswith(PAGE_SCOPE) or self._unit_duration(nodeids) <= target:
+                continue
+            elapsed, index = 0.0, 0
+            for nodeid in nodeids:
+                duration = self.history.duration(nodeid)
+                if elapsed and elapsed + duration > target:
+                    elapsed, index = 0.0, index + 1
+                chunk_scopes[nodeid] = f"{scope}#{index}"
+                elapsed += duration
+        return chunk_scopes
+
+    def _assign_work_unit(self, node):
+        page = self.node_page.get(node)
+        same_page = [
+            scope for scope in self.workqueue
+            if page and scope.split("#")[0] == page
+        ]
+        candidates = same_page or list(self.workqueue)
+        scope = max(candidates, key=lambda s: self._unit_duration(self.workqueue[s]))
+        work_unit = self.workqueue.pop(scope)
+        if scope.startswith(PAGE_SCOPE):
+            self.node_page[node] = scope.split("#")[0]
+
+        self.assigned_work.setdefault(node, {})[scope] = work_unit
+        worker_collection = self.registered_collections[node]
+        node.send_runtest_some([
+            worker_collection.index(nodeid)
+            for nodeid, completed in work_unit.items() if not completed
+        ])
+
+    def mark_test_complete(self, node, item_index, duration=0):
+        # Grupos partidos em blocos: o escopo não é mais derivável do nodeid
+        nodeid = self.registered_collections[node][item_index]
+        for work_unit in self.assigned_work[node].values():
+            if nodeid in work_unit:
+                work_unit[nodeid] = True
+                break
+        self._reschedule(node)
+
+    def _reschedule(self, node):
+        # Só entrega um novo bloco quando o worker está quase ocioso: com
+        # blocos ordenados por duração, adiantar trabalho desbalanceia o final
+        if node.shutting_down:
+            return
+        if not self.workqueue:
+            node.shutdown()
+            return
+        if self._pending_of(self.assigned_work[node]) > 1:
+            return
+        self._assign_work_unit(node)
@@ -0,0 +1,122 @@
+"""Gerenciamento de servidores Streamlit para execuções paralelas"""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from tests.support.impact import CONTEXT_ENV
+from tests.support.readiness import wait_for_streamlit
+
+DEFAULT_APP_PATH = "app/main.py"
+
+
+def find_free_port():
+    """Reserva temporariamente uma porta livre no localhost"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def worker_index(worker_id):
+    """Converte o id do worker xdist ("gw3") em índice numérico"""
+    if worker_id and worker_id.startswith("gw"):
+        return int(worker_id[2:])
+    return 0
+
+
+class StreamlitServer:
+    """Um processo `streamlit run` em uma porta dedicada"""
+
+    def __init__(self, app_path=DEFAULT_APP_PATH, port=None):
+        self.app_path = app_path
+        self.port = port or find_free_port()
+        self.process = None
+        self.started_at = None
+        self.time_to_ready = None
+
+    @property
+    def url(self):
+        return f"http://localhost:{self.port}"
+
+    def start(self):
+        """Inicia o processo sem aguardar que fique pronto"""
+        self.started_at = time.perf_counter()
+        command = [sys.executable, "-m", "streamlit", "run"]
+        if os.environ.get(CONTEXT_ENV):
+            # Gravação do mapa de impacto: o servidor registra as funções executadas
+            command = [sys.executable, "-m", "tests.support.impact", "serve"]
+        self.process = subprocess.Popen(command + [
+            self.app_path,
+            "--server.port", str(self.port),
+            "--server.headless", "true",
+            "--browser.gatherUsageStats", "false"
+        ])
+        return self
+
+    def wait_until_ready(self, timeout=30):
+        """Aguarda o health endpoint e registra o tempo de inicialização"""
+        self.time_to_ready = wait_for_streamlit(
+            self.url, process=self.process, timeout=timeout, started_at=self.started_at
+        )
+        return self.time_to_ready
+
+    def stop(self, timeout=10):
+        """Encerra o processo, forçando se não responder"""
+        if self.process is None or self.process.poll() is not None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class StreamlitServerManager:
+    """Inicia um pool de servidores e distribui os workers entre eles"""
+
+    def __init__(self, app_path=DEFAULT_APP_PATH):
+        self.app_path = app_path
+        self.servers = []
+
+    @property
+    def urls(self):
+        return [server.url for server in self.servers]
+
+    def startup_times(self):
+        """Tempo até ficar pronto de cada servidor, para telemetria"""
+        return [
+            {"port": server.port, "seconds": round(server.time_to_ready, 3)}
+            for server in self.servers if server.time_to_ready is not None
+        ]
+
+    def start_server(self):
+        """Inicia um servidor em uma porta livre e aguarda ficar pronto"""
+        return self.start_pool(1)[0]
+
+    def start_pool(self, size):
+        """Inicia `size` servidores em paralelo"""
+        servers = [StreamlitServer(self.app_path).start() for _ in range(size)]
+        self.servers.extend(servers)
+        try:
+            for server in servers:
+                server.wait_until_ready()
+        except Exception:
+            self.shutdown()
+            raise
+        return servers
+
+    @staticmethod
+    def assign(urls, worker_id=None):
+        """Escolhe o servidor do worker em round-robin"""
+        if worker_id is None:
+            worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+        return urls[worker_index(worker_id) % len(urls)]
+
+    def shutdown(self):
+        """Encerra todos os servidores iniciados"""
+        for server in self.servers:
+            server.stop()
+        self.servers = []
@@ -0,0 +1,91 @@
+"""Varredura de resoluções na mesma página via emulação de viewport do CDP"""
+
+from selenium.common.exceptions import WebDriverException
+
+TOUCH_TARGET_SELECTOR = "button"
+
+# Espera dois frames (layout + pintura do React após o resize) e mede tudo de uma vez
+MEASURE_SCRIPT = """
+const [selector, done] = arguments;
+requestAnimationFrame(() => requestAnimationFrame(() => {
+    const targets = [];
+    for (const el of document.querySelectorAll(selector)) {
+        const r = el.getBoundingClientRect();
+        const style = window.getComputedStyle(el);
+        if (r.width === 0 || r.height === 0 || style.visibility === "hidden") continue;
+        targets.push({
+            tag: el.tagName.toLowerCase(),
+            text: (el.innerText || el.getAttribute("aria-label") || "").trim().slice(0, 40),
+            width: r.width,
+            height: r.height
+        });
+    }
+    done({
+        viewport_width: window.innerWidth,
+        viewport_height: window.innerHeight,
+        scroll_width: document.documentElement.scrollWidth,
+        body_width: document.body.scrollWidth,
+        device_pixel_ratio: window.devicePixelRatio,
+        touch: navigator.maxTouchPoints > 0,
+        touch_targets: targets
+    });
+}));
+"""
+
+
+def emulate_viewport(driver, resolution):
+    """Aplica o perfil sem recarregar a página (tamanho, DPR, mobile e toque)"""
+    touch = resolution.get("touch", False)
+    driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+        "width": resolution["width"],
+        "height": resolution["height"],
+        "deviceScaleFactor": resolution.get("device_scale_factor", 1),
+        "mobile": resolution.get("mobile", False),
+    })
+    driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {
+        "enabled": touch, "maxTouchPoints": 5 if touch else 1
+    })
+
+
+def clear_emulation(driver):
+    """Volta ao viewport real da janela"""
+    try:
+        driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+        driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {"enabled": False})
+    except WebDriverException:
+        pass
+
+
+def sweep_viewports(driver, resolutions, emulate_devices=True, selector=TOUCH_TARGET_SELECTOR):
+    """Percorre as resoluções na página já carregada e mede overflow e alvos de toque
+
+    Com `emulate_devices=False` só o tamanho é emulado (DPR 1, sem toque).
+    Retorna uma medição por resolução, com o nome do perfil em "name".
+    """
+    measurements = []
+    try:
+        for resolution in resolutions:
+            profile = resolution if emulate_devices else {
+                "width": resolution["width"], "height": resolution["height"]
+            }
+            emulate_viewport(driver, profile)
+            measurement = driver.execute_async_script(MEASURE_SCRIPT, selector)
+            measurement["name"] = resolution.get("name", f"{resolution['width']}x{resolution['height']}")
+            measurements.append(measurement)
+    finally:
+        clear_emulation(driver)
+    return measurements
+
+
+def horizontal_overflow(measurement):
+    """Pixels de conteúdo além da largura da viewport"""
+    content = max(measurement["scroll_width"], measurement["body_width"])
+    return max(content - measurement["viewport_width"], 0)
+
+
+def small_touch_targets(measurement, minimum=44):
+    """Alvos de toque com as duas dimensões abaixo de `minimum` px"""
+    return [
+        target for target in measurement["touch_targets"]
+        if target["width"] < minimum and target["height"] < minimum
+    ]
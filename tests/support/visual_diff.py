@@ -0,0 +1,225 @@
+"""Regressão visual: comparação vetorizada de screenshots com baselines"""
+
+import io
+import os
+from dataclasses import dataclass, field
+
+import numpy as np
+from PIL import Image
+
+from app.utils.helpers import TestUtils
+from app.utils.screenshots import safe_name
+
+BASELINE_DIR = "tests/visual_baselines"
+VISUAL_ARTIFACTS_DIR = "reports/visual"
+
+# Regiões que mudam entre execuções sem indicar quebra de layout
+DYNAMIC_SELECTORS = (
+    '[data-testid="stStatusWidget"]',
+    '[data-testid="stDecoration"]',
+    '[data-testid="stToolbar"]',
+)
+
+
+def load_image(source):
+    """Carrega PNG (bytes ou caminho) como array RGB uint8 de forma (altura, largura, 3)"""
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    with Image.open(source) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def build_mask(shape, regions):
+    """Máscara booleana (True = comparar); regiões são (x, y, largura, altura)"""
+    height, width = shape[:2]
+    mask = np.ones((height, width), dtype=bool)
+    for x, y, w, h in regions:
+        x0, y0 = max(int(x), 0), max(int(y), 0)
+        x1, y1 = min(int(x + w + 0.5), width), min(int(y + h + 0.5), height)
+        if x1 > x0 and y1 > y0:
+            mask[y0:y1, x0:x1] = False
+    return mask
+
+
+def _neighborhood_range(image, ys, xs):
+    """Mínimo e máximo por canal na vizinhança 3x3 dos pixels (ys, xs)"""
+    height, width = image.shape[:2]
+    low = high = image[ys, xs]
+    # Acumula deslocamento a deslocamento: reduzir eixos pequenos é lento
+    for dy in (-1, 0, 1):
+        rows = np.clip(ys + dy, 0, height - 1)
+        for dx in (-1, 0, 1):
+            if dy or dx:
+                neighbor = image[rows, np.clip(xs + dx, 0, width - 1)]
+                low = np.minimum(low, neighbor)
+                high = np.maximum(high, neighbor)
+    return low.astype(np.int16), high.astype(np.int16)
+
+
+def _within(values, low, high, threshold):
+    """Cada canal de `values` está na faixa [low, high] com folga de `threshold`"""
+    return np.all((values >= low - threshold) & (values <= high + threshold), axis=1)
+
+
+@dataclass
+class DiffResult:
+    """Resultado da comparação de dois quadros"""
+    size: tuple
+    diff_pixels: int = 0
+    antialiased_pixels: int = 0
+    masked_pixels: int = 0
+    failed_tiles: list = field(default_factory=list)
+    diff_mask: np.ndarray = None
+    antialias_mask: np.ndarray = None
+    compare_mask: np.ndarray = None
+    size_mismatch: bool = False
+
+    @property
+    def passed(self):
+        return not self.size_mismatch and not self.failed_tiles
+
+    @property
+    def diff_ratio(self):
+        compared = self.size[0] * self.size[1] - self.masked_pixels
+        return self.diff_pixels / compared if compared else 0.0
+
+    def summary(self):
+        if self.size_mismatch:
+            return f"tamanhos diferentes: {self.size}"
+        return (
+            f"{self.diff_pixels} pixels diferentes ({self.diff_ratio:.3%}), "
+            f"{len(self.failed_tiles)} blocos acima da tolerância, "
+            f"{self.antialiased_pixels} ignorados como anti-aliasing"
+        )
+
+
+def compare_images(baseline, current, mask=None, threshold=24, tile=32, tile_tolerance=0.005):
+    """Compara dois quadros RGB pixel a pixel, agregando as diferenças em blocos
+
+    Um pixel difere quando algum canal varia mais que `threshold`. Diferenças
+    explicadas por anti-aliasing (o valor de cada quadro está dentro da faixa
+    da vizinhança 3x3 do outro) são ignoradas. Um bloco `tile` x `tile` falha
+    quando a fração de pixels diferentes passa de `tile_tolerance`.
+    """
+    if baseline.shape != current.shape:
+        return DiffResult(size=current.shape[:2], size_mismatch=True)
+
+    height, width = current.shape[:2]
+    # |a - b| em uint8 sem overflow nem conversão para int; o máximo entre os
+    # canais é feito por fatias (reduzir o eixo de tamanho 3 é bem mais lento)
+    delta = np.maximum(baseline, current) - np.minimum(baseline, current)
+    delta = np.maximum(np.maximum(delta[..., 0], delta[..., 1]), delta[..., 2])
+    candidates = delta > threshold
+    if mask is not None:
+        candidates &= mask
+
+    antialias = np.zeros_like(candidates)
+    if candidates.any():
+        ys, xs = np.nonzero(candidates)
+        # Só os candidatos passam pela checagem de vizinhança: custo proporcional à diferença
+        current_values = current[ys, xs].astype(np.int16)
+        baseline_values = baseline[ys, xs].astype(np.int16)
+        in_baseline = _within(current_values, *_neighborhood_range(baseline, ys, xs), threshold)
+        in_current = _within(baseline_values, *_neighborhood_range(current, ys, xs), threshold)
+        shifted = in_baseline & in_current
+        antialias[ys[shifted], xs[shifted]] = True
+        candidates[ys[shifted], xs[shifted]] = False
+
+    # Contagem por bloco via reshape (bordas preenchidas com False)
+    tiles_y, tiles_x = -(-height // tile), -(-width // tile)
+    failed = []
+    if candidates.any():
+        padded = np.zeros((tiles_y * tile, tiles_x * tile), dtype=bool)
+        padded[:height, :width] = candidates
+        counts = padded.reshape(tiles_y, tile, tiles_x, tile).sum(axis=(1, 3))
+        failed = [
+            (int(tx) * tile, int(ty) * tile, tile, tile)
+            for ty, tx in zip(*np.nonzero(counts > tile_tolerance * tile * tile))
+        ]
+
+    return DiffResult(
+        size=(height, width),
+        diff_pixels=int(np.count_nonzero(candidates)),
+        antialiased_pixels=int(np.count_nonzero(antialias)),
+        masked_pixels=0 if mask is None else mask.size - int(np.count_nonzero(mask)),
+        failed_tiles=failed,
+        diff_mask=candidates,
+        antialias_mask=antialias,
+        compare_mask=mask,
+    )
+
+
+def render_diff(current, result):
+    """Imagem de diff: quadro atual esmaecido, diferenças em vermelho,
+    anti-aliasing em amarelo, regiões mascaradas em azul e blocos reprovados contornados"""
+    gray = current.mean(axis=2, dtype=np.float32)
+    base = (255 - (255 - gray) * 0.25).astype(np.uint8)
+    image = np.repeat(base[:, :, None], 3, axis=2)
+
+    if result.compare_mask is not None:
+        image[~result.compare_mask] = (200, 215, 255)
+    image[result.antialias_mask] = (255, 200, 0)
+    image[result.diff_mask] = (230, 0, 0)
+
+    height, width = image.shape[:2]
+    for x, y, w, h in result.failed_tiles:
+        x1, y1 = min(x + w, width) - 1, min(y + h, height) - 1
+        image[y, x:x1 + 1] = image[y1, x:x1 + 1] = (255, 0, 255)
+        image[y:y1 + 1, x] = image[y:y1 + 1, x1] = (255, 0, 255)
+    return image
+
+
+def capture_frame(driver, mask_selectors=DYNAMIC_SELECTORS):
+    """Screenshot da viewport e retângulos (em pixels da imagem) das regiões dinâmicas"""
+    image = load_image(driver.get_screenshot_as_png())
+    snapshot = TestUtils.dom_snapshot(
+        driver, {"viewport": "html", **{s: s for s in mask_selectors}}, properties=("rect",)
+    )
+    viewport_width = snapshot.pop("viewport")[0]["rect"]["width"] or image.shape[1]
+    scale = image.shape[1] / viewport_width  # devicePixelRatio
+    regions = [
+        (r["x"] * scale, r["y"] * scale, r["width"] * scale, r["height"] * scale)
+        for elements in snapshot.values()
+        for r in (element["rect"] for element in elements)
+    ]
+    return image, regions
+
+
+class VisualBaselineStore:
+    """Baselines em PNG por página e resolução, com artefatos de diff para falhas"""
+
+    def __init__(self, directory=BASELINE_DIR, artifacts=VISUAL_ARTIFACTS_DIR, update=False):
+        self.directory = directory
+        self.artifacts = artifacts
+        self.update = update
+
+    def baseline_path(self, name, resolution):
+        return os.path.join(self.directory, safe_name(resolution), f"{safe_name(name)}.png")
+
+    def save_baseline(self, name, resolution, image):
+        path = self.baseline_path(name, resolution)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        Image.fromarray(image).save(path, format="PNG", optimize=True)
+        return path
+
+    def check(self, name, resolution, current, regions=(), **options):
+        """Compara com o baseline; retorna (resultado, caminho do diff) ou (None, baseline criado)"""
+        path = self.baseline_path(name, resolution)
+        if self.update or not os.path.exists(path):
+            return None, self.save_baseline(name, resolution, current)
+
+        result = compare_images(
+            load_image(path), current, mask=build_mask(current.shape, regions), **options
+        )
+        if result.passed:
+            return result, None
+        return result, self._write_artifacts(name, resolution, current, result)
+
+    def _write_artifacts(self, name, resolution, current, result):
+        os.makedirs(self.artifacts, exist_ok=True)
+        prefix = os.path.join(self.artifacts, f"{safe_name(resolution)}_{safe_name(name)}")
+        Image.fromarray(current).save(f"{prefix}.actual.png", format="PNG")
+        if result.size_mismatch:
+            return f"{prefix}.actual.png"
+        Image.fromarray(render_diff(current, result)).save(f"{prefix}.diff.png", format="PNG")
+        return f"{prefix}.diff.png"
@@ -0,0 +1 @@
+# Testes in-process (AppTest)
\ No newline at end of file
@@ -0,0 +1,19 @@
+import pytest
+
+from tests.fixtures.test_data import CONTACT_FORM_DATA, CONTACT_FORM_SCENARIOS
+
+
+class TestContactAppTest:
+    """Validação do formulário de contato executada in-process"""
+
+    @pytest.mark.parametrize(
+        "scenario", CONTACT_FORM_SCENARIOS, ids=[s["data"] for s in CONTACT_FORM_SCENARIOS]
+    )
+    def test_contact_form_validation(self, app_test, apptest_helper, scenario):
+        """Testa a resposta do formulário para cada conjunto de dados"""
+        apptest_helper.select_sidebar_option(app_test, "📧 Contato")
+        apptest_helper.fill_contact_form(app_test, CONTACT_FORM_DATA[scenario["data"]])
+
+        alerts = getattr(app_test, scenario["expected"])
+        assert len(alerts) == 1
+        assert scenario["message"] in alerts[0].value.lower()
@@ -0,0 +1,55 @@
+import pytest
+
+from tests.fixtures.test_data import PAGES
+
+
+class TestNavigationAppTest:
+    """Roteamento do sidebar executado in-process"""
+
+    def test_sidebar_navigation_exists(self, app_test):
+        """Testa se o sidebar de navegação existe"""
+        assert app_test.sidebar.title[0].value == "Navegação"
+        options = app_test.selectbox(key="navigation_select").options
+        assert options == [page["option"] for page in PAGES]
+
+    def test_home_is_default_page(self, app_test, apptest_helper):
+        """Testa se a página inicial é exibida por padrão"""
+        title = apptest_helper.find_markdown(app_test, "home-title")
+        assert title is not None
+        assert "Bem-vindo" in title.value
+
+    @pytest.mark.parametrize("page", PAGES, ids=[page["title_testid"] for page in PAGES])
+    def test_page_routing(self, app_test, apptest_helper, page):
+        """Testa se cada opção do sidebar renderiza a página correta"""
+        apptest_helper.select_sidebar_option(app_test, page["option"])
+
+        assert not app_test.exception
+        title = apptest_helper.find_markdown(app_test, page["title_testid"])
+        assert title is not None, f"Título da página {page['option']} não encontrado"
+        assert page["title"] in title.value
+
+    @pytest.mark.parametrize("page", PAGES, ids=[page["slug"] for page in PAGES])
+    def test_deep_link_opens_page(self, apptest_helper, page):
+        """Testa se ?page=<slug> abre a página diretamente"""
+        at = apptest_helper.open_page(page["slug"])
+
+        assert at.selectbox(key="navigation_select").value == page["option"]
+        assert apptest_helper.find_markdown(at, page["title_testid"]) is not None
+
+    def test_deep_link_restores_project_filters(self, apptest_helper):
+        """Testa se os filtros de projetos são restaurados a partir da URL"""
+        at = apptest_helper.open_page("projetos", tech=["Python", "Streamlit"], year="2024")
+
+        assert at.multiselect(key="tech_filter").value == ["Python", "Streamlit"]
+        assert at.selectbox(key="year_filter").value == "2024"
+
+    def test_query_params_follow_navigation(self, app_test, apptest_helper):
+        """Testa se a URL acompanha a navegação e os filtros"""
+        apptest_helper.select_sidebar_option(app_test, "💼 Projetos")
+        app_test.selectbox(key="year_filter").select("2023").run()
+        assert app_test.query_params["page"] == "projetos"
+        assert app_test.query_params["year"] == "2023"
+
+        apptest_helper.select_sidebar_option(app_test, "📧 Contato")
+        assert app_test.query_params["page"] == "contato"
+        assert "year" not in app_test.query_params
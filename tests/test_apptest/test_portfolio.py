@@ -0,0 +1,33 @@
+from tests.fixtures.test_data import EXPECTED_METRICS
+
+
+class TestPortfolioAppTest:
+    """Conteúdo das páginas do portfólio executado in-process"""
+
+    def test_home_metrics_display(self, app_test):
+        """Testa se as métricas da home têm os valores esperados"""
+        metrics = {metric.label: metric.value for metric in app_test.metric}
+
+        assert metrics["Projetos Concluídos"] == str(EXPECTED_METRICS["projects"])
+        assert metrics["Tecnologias"] == str(EXPECTED_METRICS["technologies"])
+        assert metrics["Anos de Experiência"] == str(EXPECTED_METRICS["experience"])
+
+    def test_skills_buttons_interactive(self, app_test):
+        """Testa se os botões de habilidades não geram erro ao clicar"""
+        app_test.button(key="skill_python").click().run()
+        assert not app_test.exception
+
+    def test_about_download_cv(self, app_test, apptest_helper):
+        """Testa o botão de download do CV na página Sobre"""
+        apptest_helper.select_sidebar_option(app_test, "👤 Sobre")
+        app_test.button(key="download_cv").click().run()
+
+        assert "sucesso" in app_test.success[0].value.lower()
+
+    def test_projects_filters_and_cards(self, app_test, apptest_helper):
+        """Testa se os filtros e os cards de projetos são exibidos"""
+        apptest_helper.select_sidebar_option(app_test, "💼 Projetos")
+
+        assert app_test.multiselect(key="tech_filter").options
+        assert app_test.selectbox(key="year_filter").value == "Todos"
+        assert apptest_helper.find_markdown(app_test, "project-dashboard-analytics") is not None
@@ -1,8 +1,10 @@
 import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
 
+from tests.fixtures.test_data import CONTACT_FORM_DATA, CONTACT_FORM_SCENARIOS
+
+@pytest.mark.page("contato")
 class TestContact:
     """Testes da funcionalidade de contato"""
     
@@ -34,69 +36,30 @@ class TestContact:
         )
         assert submit_button.is_displayed()
     
-    def test_contact_form_validation(self, driver, streamlit_app, wait, streamlit_helper):
-        """Testa validação do formulário de contato"""
+    @pytest.mark.parametrize(
+        "scenario", CONTACT_FORM_SCENARIOS, ids=[s["data"] for s in CONTACT_FORM_SCENARIOS]
+    )
+    def test_contact_form_validation(self, driver, streamlit_app, wait, streamlit_helper, scenario):
+        """Testa a resposta do formulário para cada conjunto de dados (os mesmos do AppTest)"""
         driver.get(streamlit_app)
         streamlit_helper.wait_for_app_load(driver, wait)
         
         # Navega para página Contato
         streamlit_helper.select_sidebar_option(driver, "📧 Contato")
-        
-        # Tenta enviar formulário vazio
-        submit_button = wait(driver).until(
+        wait(driver).until(
             EC.element_to_be_clickable(
                 (By.XPATH, "//button[contains(text(), 'Enviar Mensagem')]")
             )
         )
-        submit_button.click()
-        
-        # Verifica mensagem de erro
-        error_message = wait(driver).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='stAlert']"))
-        )
-        assert "preencha todos os campos" in error_message.text.lower()
-    
-    def test_contact_form_submission(self, driver, streamlit_app, wait, streamlit_helper):
-        """Testa envio do formulário de contato"""
-        driver.get(streamlit_app)
-        streamlit_helper.wait_for_app_load(driver, wait)
-        
-        # Navega para página Contato
-        streamlit_helper.select_sidebar_option(driver, "📧 Contato")
         
-        # Preenche o formulário
-        name_field = wait(driver).until(
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "[data-testid='stTextInput'] input")
-            )
-        )
-        name_field.send_keys("João Silva")
-        
-        # Email field (segundo input)
-        email_inputs = driver.find_elements(By.CSS_SELECTOR, "[data-testid='stTextInput'] input")
-        if len(email_inputs) > 1:
-            email_inputs[1].send_keys("joao@exemplo.com")
-        
-        # Seleciona assunto
-        subject_select = driver.find_element(By.CSS_SELECTOR, "[data-testid='stSelectbox'] select")
-        select = Select(subject_select)
-        select.select_by_visible_text("Proposta de Trabalho")
-        
-        # Mensagem
-        message_field = driver.find_element(By.CSS_SELECTOR, "[data-testid='stTextArea'] textarea")
-        message_field.send_keys("Olá! Gostaria de discutir uma oportunidade de trabalho.")
-        
-        # Envia formulário
-        submit_button = driver.find_element(
-            By.XPATH, "//button[contains(text(), 'Enviar Mensagem')]"
-        )
-        submit_button.click()
+        # Preenche com o conjunto de dados do cenário e envia
+        streamlit_helper.fill_contact_form(driver, CONTACT_FORM_DATA[scenario["data"]])
         
-        # Verifica mensagem de sucesso
-        success_message = wait(driver).until(
+        # Verifica a mensagem de sucesso ou de erro
+        alert = wait(driver).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='stAlert']"))
         )
-        assert "sucesso" in success_message.text.lower()
+        assert scenario["message"] in alert.text.lower()
     
     def test_contact_info_display(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa se as informações de contato são exibidas"""
@@ -2,6 +2,8 @@ import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
+from tests.fixtures.test_data import PAGES
+
 class TestNavigation:
     """Testes de navegação entre páginas"""
     
@@ -17,6 +19,7 @@ class TestNavigation:
         nav_title = sidebar.find_element(By.XPATH, "//div[contains(text(), 'Navegação')]")
         assert nav_title.is_displayed()
     
+    @pytest.mark.page("home")
     def test_home_page_load(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa se a página inicial carrega corretamente"""
         driver.get(streamlit_app)
@@ -32,6 +35,7 @@ class TestNavigation:
         metrics = driver.find_elements(By.CSS_SELECTOR, "[data-testid='metric-container']")
         assert len(metrics) >= 3
     
+    @pytest.mark.page("sobre")
     def test_about_page_navigation(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa navegação para página Sobre"""
         driver.get(streamlit_app)
@@ -46,6 +50,7 @@ class TestNavigation:
         )
         assert "Sobre Mim" in title.text
     
+    @pytest.mark.page("projetos")
     def test_projects_page_navigation(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa navegação para página Projetos"""
         driver.get(streamlit_app)
@@ -64,6 +69,7 @@ class TestNavigation:
         tech_filter = driver.find_element(By.CSS_SELECTOR, "[data-testid='stMultiSelect']")
         assert tech_filter.is_displayed()
     
+    @pytest.mark.page("contato")
     def test_contact_page_navigation(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa navegação para página Contato"""
         driver.get(streamlit_app)
@@ -80,19 +86,17 @@ class TestNavigation:
     
     def test_all_pages_accessible(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa se todas as páginas são acessíveis"""
-        driver.get(streamlit_app)
-        streamlit_helper.wait_for_app_load(driver, wait)
-        
-        pages = ["🏠 Home", "👤 Sobre", "💼 Projetos", "📧 Contato"]
-        
-        for page in pages:
-            streamlit_helper.select_sidebar_option(driver, page)
+        for page in PAGES:
+            # Abre a página direto pelo deep link
+            streamlit_helper.open_page(driver, streamlit_app, page["slug"])
             
             # Aguarda o carregamento da página
             wait(driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid$='-title']"))
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, f"[data-testid='{page['title_testid']}']")
+                )
             )
             
             # Verifica se não há erros na página
             error_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='stException']")
-            assert len(error_elements) == 0, f"Erro encontrado na página {page}"
\ No newline at end of file
+            assert len(error_elements) == 0, f"Erro encontrado na página {page['option']}"
\ No newline at end of file
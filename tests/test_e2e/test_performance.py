@@ -3,32 +3,46 @@ import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
+from tests.fixtures.test_data import PAGES
+
 class TestPerformance:
     """Testes de performance da aplicação"""
     
-    def test_page_load_time(self, driver, streamlit_app, wait, streamlit_helper):
+    def test_page_load_time(self, driver, streamlit_app, wait, streamlit_helper, perf_metrics,
+                            perf_baseline):
         """Testa tempo de carregamento das páginas"""
-        pages = ["🏠 Home", "👤 Sobre", "💼 Projetos", "📧 Contato"]
+        # Teto absoluto; regressões menores são detectadas pelo perf_baseline
         max_load_time = 10  # segundos
         
-        for page in pages:
+        for page in PAGES:
             start_time = time.time()
             
-            driver.get(streamlit_app)
-            streamlit_helper.wait_for_app_load(driver, wait)
-            
-            if page != "🏠 Home":
-                streamlit_helper.select_sidebar_option(driver, page)
+            # Deep link: uma única carga por página
+            streamlit_helper.open_page(driver, streamlit_app, page["slug"])
             
             # Aguarda carregamento completo
             wait(driver).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid$='-title']"))
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, f"[data-testid='{page['title_testid']}']")
+                )
             )
             
             load_time = time.time() - start_time
-            assert load_time < max_load_time, f"Página {page} demorou {load_time:.2f}s para carregar"
+            
+            # Métricas vistas pelo usuário (TTFB, FCP, long tasks, heap, 1º delta)
+            metrics = perf_metrics.collect(page["slug"])
+            
+            # Histórico e comparação com o baseline
+            resolution = metrics["viewport"]
+            perf_baseline.measure(page["slug"], "load_time", load_time, resolution)
+            for metric in ("ttfb", "first_contentful_paint", "first_delta"):
+                perf_baseline.measure(page["slug"], metric, metrics[metric], resolution)
+            
+            assert load_time < max_load_time, f"Página {page['option']} demorou {load_time:.2f}s para carregar"
     
-    def test_form_submission_response_time(self, driver, streamlit_app, wait, streamlit_helper):
+    @pytest.mark.page("contato")
+    def test_form_submission_response_time(self, driver, streamlit_app, wait, streamlit_helper,
+                                           perf_baseline):
         """Testa tempo de resposta do formulário"""
         driver.get(streamlit_app)
         streamlit_helper.wait_for_app_load(driver, wait)
@@ -59,4 +73,8 @@ class TestPerformance:
         )
         
         response_time = time.time() - start_time
+        
+        resolution = driver.execute_script("return window.innerWidth + 'x' + window.innerHeight")
+        perf_baseline.measure("contato", "form_response_time", response_time, resolution)
+        
         assert response_time < 5, f"Formulário demorou {response_time:.2f}s para responder"
\ No newline at end of file
@@ -5,20 +5,30 @@ from selenium.webdriver.support import expected_conditions as EC
 class TestPortfolio:
     """Testes das funcionalidades do portfólio"""
     
+    @pytest.mark.page("home")
     def test_home_metrics_display(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa se as métricas da home são exibidas corretamente"""
         driver.get(streamlit_app)
         streamlit_helper.wait_for_app_load(driver, wait)
         
-        # Verifica métricas
-        metrics = driver.find_elements(By.CSS_SELECTOR, "[data-testid='metric-container']")
+        # Verifica métricas e seus valores em um único round trip
+        snapshot = streamlit_helper.dom_snapshot(driver, {
+            "metrics": {
+                "selector": "[data-testid='metric-container']",
+                "properties": (),
+                "children": {"value": "[data-testid='metric-value']"}
+            }
+        }, properties=("text",))
+        metrics = snapshot["metrics"]
         assert len(metrics) >= 3
         
         # Verifica valores das métricas
         for metric in metrics:
-            value = metric.find_element(By.CSS_SELECTOR, "[data-testid='metric-value']")
-            assert value.text.strip() != ""
+            values = metric["children"]["value"]
+            assert values, "Métrica sem valor"
+            assert values[0]["text"].strip() != ""
     
+    @pytest.mark.page("home")
     def test_skills_buttons_interactive(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa se os botões de habilidades são interativos"""
         driver.get(streamlit_app)
@@ -33,11 +43,14 @@ class TestPortfolio:
         
         # Testa clique em um botão
         if skill_buttons:
+            since = streamlit_helper.arm_rerun(driver)
             skill_buttons[0].click()
+            streamlit_helper.wait_for_rerun(driver, since)
             # Verifica se o clique não gerou erro
             error_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='stException']")
             assert len(error_elements) == 0
     
+    @pytest.mark.page("sobre")
     def test_about_page_content(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa o conteúdo da página Sobre"""
         driver.get(streamlit_app)
@@ -56,6 +69,7 @@ class TestPortfolio:
         )
         assert cv_button.is_displayed()
     
+    @pytest.mark.page("projetos")
     def test_projects_filtering(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa funcionalidade de filtros na página de projetos"""
         driver.get(streamlit_app)
@@ -79,6 +93,7 @@ class TestPortfolio:
         assert tech_filter.is_displayed()
         assert year_filter.is_displayed()
     
+    @pytest.mark.page("projetos")
     def test_project_github_links(self, driver, streamlit_app, wait, streamlit_helper):
         """Testa se os links do GitHub nos projetos funcionam"""
         driver.get(streamlit_app)
@@ -87,17 +102,22 @@ class TestPortfolio:
         # Navega para página Projetos
         streamlit_helper.select_sidebar_option(driver, "💼 Projetos")
         
-        # Encontra links do GitHub
-        github_links = wait(driver).until(
+        # Aguarda os links do GitHub
+        wait(driver).until(
             EC.presence_of_all_elements_located(
                 (By.XPATH, "//a[contains(text(), 'GitHub')]")
             )
         )
         
+        links = streamlit_helper.dom_snapshot(
+            driver, {"links": "a"}, properties=("text",), attributes=("href",)
+        )["links"]
+        github_links = [link for link in links if "GitHub" in link["text"]]
+        
         assert len(github_links) > 0
         
         # Verifica se os links têm href válido
         for link in github_links:
-            href = link.get_attribute("href")
+            href = link["attributes"]["href"]
             assert href is not None
             assert "github.com" in href
\ No newline at end of file
@@ -3,46 +3,86 @@ Testes de responsividade
 """
 import pytest
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from tests.fixtures.test_data import PAGES, SCREEN_RESOLUTIONS
+from tests.support.viewport import (
+    clear_emulation, emulate_viewport, horizontal_overflow, small_touch_targets
+)
+
+MOBILE = next(r for r in SCREEN_RESOLUTIONS if r["name"] == "mobile")
+SIDEBAR = "[data-testid='stSidebar']"
+# Botão de menu da sidebar recolhida (o data-testid mudou entre versões do Streamlit)
+SIDEBAR_MENU = "[data-testid='stExpandSidebarButton'], [data-testid='stSidebarCollapsedControl'] button"
 
 class TestResponsiveness:
     """Classe de testes para responsividade"""
     
-    @pytest.mark.parametrize("width,height", [
-        (1920, 1080),  # Desktop
-        (1366, 768),   # Laptop
-        (768, 1024),   # Tablet
-        (375, 667),    # Mobile
-    ])
-    def test_layout_at_different_resolutions(self, driver, base_url, width, height):
-        """Testa layout em diferentes resoluções"""
-        driver.set_window_size(width, height)
-        driver.get(base_url)
+    def test_layout_at_different_resolutions(self, driver, base_url, streamlit_helper):
+        """Testa layout de todas as páginas em diferentes resoluções (uma única carga do app)"""
+        streamlit_helper.open_page(driver, base_url, PAGES[0]["slug"])
         
-        # Verificar se elementos principais estão visíveis
-        body = driver.find_element(By.TAG_NAME, "body")
-        assert body.is_displayed()
+        overflow = {}
+        for index, page in enumerate(PAGES):
+            # A primeira página já está aberta; as demais pelo sidebar (rerun, sem recarregar o app)
+            if index:
+                streamlit_helper.select_sidebar_option(driver, page["option"])
+            
+            # Verificar se elementos principais estão visíveis
+            body = driver.find_element(By.TAG_NAME, "body")
+            assert body.is_displayed()
+            
+            for m in streamlit_helper.sweep_viewports(driver, SCREEN_RESOLUTIONS):
+                overflow[f"{page['slug']}@{m['name']}"] = horizontal_overflow(m)
+        
+        # Verificar se não há overflow horizontal em nenhuma resolução
+        assert all(pixels <= 20 for pixels in overflow.values()), overflow  # Margem de 20px
+    
+    @pytest.mark.parametrize("page", PAGES, ids=[page["slug"] for page in PAGES])
+    @pytest.mark.parametrize(
+        "resolution", SCREEN_RESOLUTIONS, ids=[r["name"] for r in SCREEN_RESOLUTIONS]
+    )
+    def test_visual_regression(self, driver, base_url, streamlit_helper, visual_regression,
+                               resolution, page):
+        """Testa se o layout de cada página não mudou em relação ao baseline"""
+        driver.set_window_size(resolution["width"], resolution["height"])
+        streamlit_helper.open_page(driver, base_url, page["slug"])
         
-        # Verificar se não há overflow horizontal
-        viewport_width = driver.execute_script("return window.innerWidth")
-        body_width = driver.execute_script("return document.body.scrollWidth")
-        assert body_width <= viewport_width + 20  # Margem de 20px
+        visual_regression(page["slug"], resolution["name"])
     
-    def test_mobile_navigation(self, driver, base_url):
+    def test_mobile_navigation(self, driver, base_url, streamlit_helper, wait):
         """Testa navegação em dispositivos móveis"""
-        driver.set_window_size(375, 667)
         driver.get(base_url)
+        streamlit_helper.wait_for_app_load(driver)
+        sidebar = driver.find_element(By.CSS_SELECTOR, SIDEBAR)
+        target = PAGES[1]
         
-        # Verificar se navegação mobile funciona
-        assert driver.find_element(By.TAG_NAME, "body").is_displayed()
+        try:
+            emulate_viewport(driver, MOBILE)
+            
+            # Abaixo do breakpoint o sidebar é recolhido e o botão de menu aparece
+            wait(driver).until(lambda d: sidebar.get_attribute("aria-expanded") == "false")
+            menu = wait(driver).until(EC.element_to_be_clickable((By.CSS_SELECTOR, SIDEBAR_MENU)))
+            
+            # O menu reabre o sidebar e a navegação funciona a partir dele
+            menu.click()
+            wait(driver).until(lambda d: sidebar.get_attribute("aria-expanded") == "true")
+            streamlit_helper.select_sidebar_option(driver, target["option"])
+            title = wait(driver).until(
+                EC.visibility_of_element_located(
+                    (By.CSS_SELECTOR, f"[data-testid='{target['title_testid']}']")
+                )
+            )
+            assert target["title"] in title.text
+        finally:
+            clear_emulation(driver)
     
-    def test_touch_friendly_elements(self, driver, base_url):
+    def test_touch_friendly_elements(self, driver, base_url, streamlit_helper):
         """Testa se elementos são touch-friendly"""
-        driver.set_window_size(375, 667)
         driver.get(base_url)
+        streamlit_helper.wait_for_app_load(driver)
         
         # Verificar tamanho mínimo de elementos clicáveis (44px recomendado)
-        buttons = driver.find_elements(By.TAG_NAME, "button")
-        for button in buttons:
-            if button.is_displayed():
-                size = button.size
-                assert size['height'] >= 44 or size['width'] >= 44
+        touch_profiles = [r for r in SCREEN_RESOLUTIONS if r.get("touch")]
+        for measurement in streamlit_helper.sweep_viewports(driver, touch_profiles):
+            assert not small_touch_targets(measurement), measurement["name"]
@@ -0,0 +1 @@
+# Testes de carga (websocket, sem browser)
\ No newline at end of file
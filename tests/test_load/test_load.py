@@ -0,0 +1,30 @@
+import json
+import os
+
+from tests.support.load_generator import run_ramp
+
+# Teto de p95 de rerun no maior nível de concorrência
+MAX_P95_MS = 5000
+
+
+class TestLoad:
+    """Testes de carga com sessões Streamlit simultâneas, sem browser"""
+
+    def test_concurrency_ramp(self, streamlit_app, request, load_stages):
+        """Executa o fluxo típico em níveis crescentes de concorrência"""
+        stages = [int(v) for v in request.config.getoption("--load-stages").split(",")]
+        report = run_ramp(streamlit_app, stages, iterations=2)
+
+        os.makedirs("reports/load", exist_ok=True)
+        with open("reports/load/ramp.json", "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        # Resumo por estágio no fim da sessão (pytest_terminal_summary)
+        load_stages.extend(report)
+        for stage in report:
+            assert not stage["errors"], f"Erros com {stage['users']} usuários: {stage['errors'][:3]}"
+
+        top = report[-1]
+        assert top["latency"]["p95"] < MAX_P95_MS, (
+            f"p95 de {top['latency']['p95']:.0f} ms com {top['users']} usuários"
+        )
@@ -0,0 +1,49 @@
+"""Reaproveitamento de sessões do Chrome (tests/support/driver_pool.py)"""
+
+import pytest
+
+from tests.support.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Sessão falsa; `error` é levantado em qualquer comando"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if self.error:
+            raise self.error
+        return "complete"
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestDriverPool:
+    """Contadores e descarte de sessões mortas"""
+
+    def test_dead_session_is_replaced(self):
+        """Erro fora do WebDriverException (ex.: conexão recusada) também descarta a sessão"""
+        fresh = FakeDriver()
+        pool = DriverPool(factory=lambda: fresh, health_timeout=1)
+        dead = FakeDriver(error=ConnectionRefusedError())
+        pool._idle.append(dead)
+
+        assert pool.acquire() is fresh
+        assert dead.quit_called
+        assert pool.stats() == {
+            "launches": 1, "acquisitions": 1, "replacements": 1, "launches_avoided": 0
+        }
+
+    def test_failed_launch_is_not_counted(self):
+        """Falha ao iniciar o Chrome não conta como sessão lançada nem reaproveitada"""
+        def factory():
+            raise RuntimeError("chrome indisponível")
+
+        pool = DriverPool(factory=factory, health_timeout=1)
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+        assert pool.stats()["launches"] == 0
+        assert pool.stats()["launches_avoided"] == 0
@@ -0,0 +1,119 @@
+"""Tradução do diff em testes selecionados (tests/support/impact.py)"""
+
+from tests.support.impact import parse_diff, select_tests, units_for_lines
+
+DIFF = """\
+diff --git a/app/main.py b/app/main.py
+--- a/app/main.py
++++ b/app/main.py
+@@ -10,0 +11,2 @@ def load_css():
++    x = 1
++    y = 2
+@@ -20,2 +21,0 @@ def main():
+-    a
+-    b
+@@ -30 +29 @@ def footer():
+-old
++new
+diff --git a/app/old.py b/app/old.py
+deleted file mode 100644
+--- a/app/old.py
++++ /dev/null
+@@ -1,3 +0,0 @@
+-a
+-b
+-c
+diff --git a/app/new.py b/app/new.py
+new file mode 100644
+--- /dev/null
++++ b/app/new.py
+@@ -0,0 +1,2 @@
++a
++b
+"""
+
+SOURCE = '''\
+import streamlit as st
+
+@st.cache_data
+def load():
+    return 1
+
+
+class Page:
+    def render(self):
+        return load()
+'''
+
+NODEIDS = [
+    "tests/test_e2e/test_contact.py::TestContact::test_a",
+    "tests/test_e2e/test_navigation.py::TestNavigation::test_b",
+    "tests/test_e2e/test_navigation.py::TestNavigation::test_new",
+]
+IMPACT_MAP = {"tests": {
+    NODEIDS[0]: ["app/main.py::show_contact", "app/main.py::<module>"],
+    NODEIDS[1]: ["app/main.py::show_home"],
+}}
+
+
+class TestParseDiff:
+    """Linhas alteradas de cada lado de um diff -U0"""
+
+    def test_hunk_counts(self):
+        old_lines, new_lines = parse_diff(DIFF)["app/main.py"]
+        # Inserção (contagem 0 no lado antigo) marca a linha vizinha
+        assert {10, 20, 21, 30} == old_lines
+        # Remoção (contagem 0 no lado novo) idem; sem contagem = 1 linha
+        assert {11, 12, 21, 29} == new_lines
+
+    def test_deleted_file_keeps_its_path(self):
+        assert parse_diff(DIFF)["app/old.py"] == ({1, 2, 3}, {0})
+
+    def test_new_file(self):
+        assert parse_diff(DIFF)["app/new.py"] == ({0}, {1, 2})
+
+
+class TestUnitsForLines:
+    """Linhas alteradas -> função ou classe de nível superior"""
+
+    def test_functions_classes_and_module(self):
+        units = units_for_lines("app/x.py", SOURCE, {1, 3, 10})
+        assert units == {"app/x.py::<module>", "app/x.py::load", "app/x.py::Page"}
+
+    def test_syntax_error_falls_back_to_module(self):
+        assert units_for_lines("app/x.py", "def broken(:\n", {1}) == {"app/x.py::<module>"}
+
+
+class TestSelectTests:
+    """Quais testes rodam para um conjunto de mudanças"""
+
+    def select(self, paths, units=()):
+        changes = {path: (set(), {1}) for path in paths}
+        return select_tests(IMPACT_MAP, changes, set(units), NODEIDS)
+
+    def test_changed_units_select_mapped_tests(self):
+        selected, _ = self.select(["app/main.py"], ["app/main.py::show_home"])
+        # O teste fora do mapa roda sempre
+        assert selected == {NODEIDS[1], NODEIDS[2]}
+
+    def test_no_changed_units_runs_only_unmapped_tests(self):
+        selected, _ = self.select(["README.md", "dashboard/app.py", "streamlit_app.py"])
+        assert selected == {NODEIDS[2]}
+
+    def test_changed_test_file_runs_its_tests(self):
+        selected, _ = self.select(["tests/test_e2e/test_contact.py"])
+        assert selected == {NODEIDS[0], NODEIDS[2]}
+
+    def test_global_change_runs_everything(self):
+        for path in ("tests/conftest.py", "tests/support/viewport.py", "app/style.css", "pytest.ini"):
+            selected, reason = self.select([path])
+            assert selected is None, path
+            assert path in reason
+
+    def test_ignored_patterns_win_over_global(self):
+        selected, _ = self.select(["tests/support/NOTES.md"])
+        assert selected == {NODEIDS[2]}
+
+    def test_unmapped_paths_run_everything(self):
+        assert self.select(["app/data.json"])[0] is None
+        assert self.select(["setup.cfg"])[0] is None
@@ -0,0 +1,96 @@
+"""Índice de linhas e janelas dos logs de execução (dashboard/logs.py)"""
+
+import pytest
+
+from dashboard import logs
+from dashboard.logs import INDEX_SUFFIX, LEVELS, TIMESTAMP_WIDTH, LogView, LogWriter
+
+ORDER = ["DEBUG", "INFO", "DEBUG", "WARNING", "DEBUG", "ERROR", "INFO"]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    """Log com 30 linhas de níveis alternados, gravado pelo LogWriter"""
+    path = str(tmp_path / "run.log")
+    writer = LogWriter(path)
+    for number in range(30):
+        writer.write(f"linha {number}", level=ORDER[number % len(ORDER)])
+    writer.close()
+    return path
+
+
+def expected_tail(min_level, lines, skip):
+    matching = [
+        number for number in range(30)
+        if LEVELS[ORDER[number % len(ORDER)]] >= LEVELS[min_level]
+    ]
+    end = max(len(matching) - skip, 0)
+    return matching[max(end - lines, 0):end]
+
+
+class TestTail:
+    """Varredura do índice de trás para frente, em blocos"""
+
+    @pytest.mark.parametrize("chunk", [4, 7, 1 << 16])
+    @pytest.mark.parametrize("min_level", list(LEVELS))
+    @pytest.mark.parametrize("lines, skip", [(5, 0), (5, 3), (3, 10), (100, 0), (2, 25), (5, 40)])
+    def test_matches_a_full_scan(self, log_path, monkeypatch, chunk, min_level, lines, skip):
+        monkeypatch.setattr(logs, "SCAN_CHUNK", chunk)
+        view = LogView(log_path)
+        assert view.tail(min_level, lines, skip).tolist() == expected_tail(min_level, lines, skip)
+        view.close()
+
+    def test_count_by_level(self, log_path):
+        view = LogView(log_path)
+        assert view.count() == 30
+        assert view.count("ERROR") == len(expected_tail("ERROR", 30, 0))
+        view.close()
+
+
+class TestWindow:
+    """Leitura das linhas da janela"""
+
+    def test_window_text(self, log_path):
+        view = LogView(log_path)
+        text = view.window("ERROR", lines=2, timestamps=False)
+        assert text == ["ERROR: linha 19", "ERROR: linha 26"]
+        assert view.window("ERROR", lines=1)[0][TIMESTAMP_WIDTH:] == "ERROR: linha 26"
+        view.close()
+
+    def test_empty_log(self, tmp_path):
+        view = LogView(str(tmp_path / "missing.log"))
+        assert len(view) == 0
+        assert view.window() == []
+        view.close()
+
+
+class TestWriteInProgress:
+    """Log lido enquanto ainda está sendo gravado"""
+
+    def test_partial_index_record_is_ignored(self, log_path):
+        with open(log_path + INDEX_SUFFIX, "ab") as index:
+            index.write(b"\x00" * 4)
+        view = LogView(log_path)
+        assert len(view) == 30
+        assert view.line(29).endswith("linha 29")
+        view.close()
+
+    def test_last_line_stops_at_the_next_unindexed_line(self, log_path):
+        # Linha já no log, mas ainda sem registro no índice (e sem o \n final)
+        with open(log_path, "ab") as log:
+            log.write(b"[2024-01-15 14:30:15] INFO: linha 30 parcial")
+        view = LogView(log_path)
+        assert len(view) == 30
+        assert view.line(29).endswith("INFO: linha 29")
+        view.close()
+
+    def test_last_line_without_newline_reads_to_the_end(self, tmp_path):
+        path = str(tmp_path / "run.log")
+        writer = LogWriter(path)
+        writer.write("linha 0", level="INFO")
+        writer.close()
+        with open(path, "rb+") as log:
+            log.truncate(log.seek(0, 2) - 1)
+        view = LogView(path)
+        assert view.line(0).endswith("INFO: linha 0")
+        view.close()
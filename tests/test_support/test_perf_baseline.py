@@ -0,0 +1,76 @@
+"""Detecção de regressões de performance (tests/support/perf_baseline.py)"""
+
+import pytest
+
+from tests.support.perf_baseline import PerfBaseline, PerfHistory, detect_regression
+
+STABLE = [1.0, 1.02, 0.98, 1.01, 0.99, 1.0, 1.03, 0.97]
+NOISY = [0.6, 1.4, 0.7, 1.3, 0.8, 1.2, 1.0, 1.0]
+OUTLIER = [1.0] * 9 + [2.0]
+FLAT = [1.0] * 5
+
+
+@pytest.mark.parametrize("history, value, tolerance, regression", [
+    (STABLE, 1.5, 0.10, True),
+    # Acima do p95 e com z alto, mas dentro da tolerância sobre a mediana
+    (STABLE, 1.05, 0.10, False),
+    # Acima do p95 e da tolerância, mas dentro do ruído da série (z <= 3)
+    (NOISY, 1.45, 0.10, False),
+    (NOISY, 2.5, 0.10, True),
+    # Acima da tolerância e com z alto, mas abaixo do p95 (outlier no histórico)
+    (OUTLIER, 1.3, 0.10, False),
+    (OUTLIER, 2.5, 0.10, True),
+    # MAD = 0: piso de 1% da mediana para o desvio
+    (FLAT, 1.02, 0.01, False),
+    (FLAT, 1.04, 0.01, True),
+    # Menos de min_samples medições: sem baseline
+    (FLAT[:4], 10.0, 0.10, False),
+    ([], 10.0, 0.10, False),
+], ids=[
+    "stable-slow", "stable-within-tolerance", "noisy-within-z", "noisy-slow",
+    "below-p95", "above-p95", "flat-within-floor", "flat-above-floor",
+    "few-samples", "no-history",
+])
+def test_detect_regression(history, value, tolerance, regression):
+    result = detect_regression(value, history, tolerance=tolerance)
+    assert (result is not None) == regression
+    if result:
+        assert result["value"] == value
+        assert result["samples"] == len(history)
+        assert result["slowdown"] == pytest.approx(value / result["median"] - 1)
+        assert result["z_score"] > 3
+
+
+class TestPerfBaseline:
+    """Medições gravadas e comparadas em um SQLite temporário"""
+
+    @pytest.fixture
+    def history(self, tmp_path):
+        history = PerfHistory(str(tmp_path / "perf.db"), window=5, commit="test")
+        yield history
+        history.close()
+
+    def test_regression_after_enough_samples(self, history):
+        baseline = PerfBaseline(history, "test_home")
+        for value in STABLE[:5]:
+            assert baseline.measure("home", "load", value) is None
+        # Outra resolução é outra chave, ainda sem histórico
+        assert baseline.measure("home", "load", 3.0, resolution="1920x1080") is None
+
+        regression = baseline.measure("home", "load", 3.0)
+        assert regression["test"] == "test_home"
+        assert (regression["page"], regression["resolution"], regression["metric"]) == (
+            "home", "default", "load"
+        )
+        assert baseline.regressions == [regression]
+
+    def test_baseline_uses_the_latest_window(self, history):
+        baseline = PerfBaseline(history, "test_home")
+        for value in [10.0] * 5 + [1.0] * 5:
+            baseline.measure("home", "load", value)
+        assert history.baseline("test_home", "home", "default", "load") == [1.0] * 5
+
+    def test_missing_measurement_is_not_recorded(self, history):
+        baseline = PerfBaseline(history, "test_home")
+        assert baseline.measure("home", "load", None) is None
+        assert history.baseline("test_home", "home", "default", "load") == []
@@ -0,0 +1,24 @@
+"""Pré-carregamento dos processos do pool do dashboard (dashboard/pool.py)"""
+
+import json
+import subprocess
+import sys
+
+from dashboard.pool import REPO_ROOT
+
+PROBE = """
+import json, sys
+from importlib.metadata import entry_points
+from dashboard.pool import preload
+preload()
+plugins = {ep.value.split(".")[0] for ep in entry_points(group="pytest11")}
+print(json.dumps(sorted(p for p in plugins if p in sys.modules)))
+"""
+
+
+def test_preload_does_not_import_pytest_plugins():
+    """Plugin já importado não teria os asserts reescritos pelo pytest na execução"""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    assert json.loads(output.splitlines()[-1]) == []
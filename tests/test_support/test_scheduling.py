@@ -0,0 +1,90 @@
+"""Histórico de duração e escalonamento do xdist (tests/support/scheduling.py)"""
+
+import json
+from types import SimpleNamespace
+
+from tests.support.result_cache import CACHED_PROPERTY
+from tests.support.scheduling import DurationHistory, DurationRecorder, HistoryScheduling
+
+
+def make_report(nodeid, duration, cached=False):
+    properties = [("page", "home")]
+    if cached:
+        properties.append((CACHED_PROPERTY, "0123456789ab"))
+    return SimpleNamespace(nodeid=nodeid, duration=duration, user_properties=properties)
+
+
+class FakeNode:
+    """Worker do xdist reduzido ao que o escalonador usa"""
+
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+class TestDurationRecorder:
+    """Só execuções reais atualizam a duração média"""
+
+    def record(self, path, *reports):
+        recorder = DurationRecorder(path)
+        for report in reports:
+            recorder.pytest_runtest_logreport(report)
+        recorder.pytest_sessionfinish(session=None)
+        return DurationHistory(path)
+
+    def test_cached_report_keeps_stored_duration(self, tmp_path):
+        """Resultado vindo do cache não puxa a média para zero"""
+        path = str(tmp_path / "durations.json")
+        self.record(path, make_report("test_home.py::test_a", 5.0))
+
+        history = self.record(path, *(make_report("test_home.py::test_a", 0.001, cached=True)
+                                      for _ in range(3)))
+        assert history.duration("test_home.py::test_a") == 5.0
+
+    def test_executed_report_updates_duration(self, tmp_path):
+        """Execução real entra na média móvel com a página do teste"""
+        path = str(tmp_path / "durations.json")
+        self.record(path, make_report("test_home.py::test_a", 5.0))
+
+        history = self.record(path, make_report("test_home.py::test_a", 1.0))
+        assert history.duration("test_home.py::test_a") == 3.8
+        assert history.page("test_home.py::test_a") == "home"
+
+
+class TestHistoryScheduling:
+    """Distribuição inicial com menos páginas que workers"""
+
+    def test_large_pages_are_split_across_all_workers(self, tmp_path):
+        """Grupos grandes viram blocos antes de a classe base encerrar workers ociosos"""
+        collection = [f"test_{page}.py::test_{i}" for page in ("home", "contato") for i in range(8)]
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({
+            nodeid: {"duration": 1.0, "page": nodeid.split("_")[1].split(".")[0]}
+            for nodeid in collection
+        }))
+        config = SimpleNamespace(
+            getvalue=lambda name: ["8*popen"], option=SimpleNamespace(loadscopereorder=True)
+        )
+        scheduler = HistoryScheduling(
+            config, log=SimpleNamespace(loadscopesched=lambda *args: None),
+            history=DurationHistory(str(path))
+        )
+        nodes = [FakeNode(f"gw{i}") for i in range(8)]
+        for node in nodes:
+            scheduler.add_node(node)
+        for node in nodes:
+            scheduler.add_node_collection(node, collection)
+
+        scheduler.schedule()
+
+        # Sem a divisão prévia seriam 2 unidades e 6 workers encerrados sem trabalho
+        assert len(scheduler.nodes) == 8
+        assert all(len(node.sent) == 2 for node in nodes)
+        assert sorted(i for node in nodes for i in node.sent) == list(range(len(collection)))
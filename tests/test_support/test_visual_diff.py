@@ -0,0 +1,108 @@
+"""Comparação vetorizada de quadros (tests/support/visual_diff.py)"""
+
+import numpy as np
+
+from tests.support.visual_diff import build_mask, compare_images, render_diff
+
+WHITE = 255
+
+
+def blank(height=64, width=64):
+    return np.full((height, width, 3), WHITE, dtype=np.uint8)
+
+
+class TestBuildMask:
+    """Regiões dinâmicas excluídas da comparação"""
+
+    def test_regions_are_clipped_to_the_image(self):
+        mask = build_mask((10, 10, 3), [(-5, -5, 8, 8), (8, 8, 10, 10)])
+        assert not mask[:3, :3].any()
+        assert mask[3:8, 3:8].all()
+        assert not mask[8:, 8:].any()
+
+    def test_fractional_regions_round_to_cover_the_element(self):
+        mask = build_mask((10, 10, 3), [(2.4, 2.4, 2.2, 2.2)])
+        assert np.count_nonzero(~mask) == 9
+        assert not mask[2:5, 2:5].any()
+
+    def test_empty_region_masks_nothing(self):
+        assert build_mask((4, 4, 3), [(1, 1, 0, 0)]).all()
+
+
+class TestCompareImages:
+    """Tolerâncias por pixel, por anti-aliasing e por bloco"""
+
+    def test_identical_frames_pass(self):
+        result = compare_images(blank(), blank())
+        assert result.passed
+        assert result.diff_pixels == 0
+
+    def test_size_mismatch_fails_without_comparing(self):
+        result = compare_images(blank(64, 64), blank(64, 48))
+        assert result.size_mismatch
+        assert not result.passed
+        assert result.diff_mask is None
+        assert "tamanhos diferentes" in result.summary()
+
+    def test_changes_below_threshold_are_ignored(self):
+        current = blank()
+        current[10:20, 10:20] = WHITE - 24
+        assert compare_images(blank(), current, threshold=24).diff_pixels == 0
+
+    def test_changed_block_fails_its_tile(self):
+        current = blank()
+        current[40:48, 40:48] = 0
+        result = compare_images(blank(), current)
+        assert not result.passed
+        assert result.diff_pixels == 64
+        assert result.failed_tiles == [(32, 32, 32, 32)]
+
+    def test_one_pixel_shift_is_antialiasing(self):
+        baseline, current = blank(), blank()
+        baseline[:, 10] = 0
+        current[:, 11] = 0
+        result = compare_images(baseline, current)
+        assert result.passed
+        assert result.diff_pixels == 0
+        assert result.antialiased_pixels == 2 * 64
+
+    def test_isolated_pixels_stay_within_tile_tolerance(self):
+        current = blank()
+        current[5, 5] = 0
+        result = compare_images(blank(), current, tile=32, tile_tolerance=0.005)
+        assert result.diff_pixels == 1
+        assert result.passed
+
+    def test_partial_tiles_at_the_edges_are_checked(self):
+        current = blank(40, 70)
+        current[36:40, 66:70] = 0
+        result = compare_images(blank(40, 70), current, tile=32)
+        assert result.failed_tiles == [(64, 32, 32, 32)]
+
+    def test_masked_regions_are_not_compared(self):
+        current = blank()
+        current[0:16, 0:16] = 0
+        mask = build_mask(current.shape, [(0, 0, 16, 16)])
+        result = compare_images(blank(), current, mask=mask)
+        assert result.passed
+        assert result.masked_pixels == 256
+        assert result.diff_ratio == 0.0
+
+
+class TestRenderDiff:
+    """Imagem de diff gravada quando a comparação falha"""
+
+    def test_marks_differences_masks_and_failed_tiles(self):
+        current = blank(40, 70)
+        current[36:40, 66:70] = 0
+        mask = build_mask(current.shape, [(0, 0, 4, 4)])
+        result = compare_images(blank(40, 70), current, mask=mask, tile=32)
+
+        image = render_diff(current, result)
+        assert image.shape == current.shape
+        assert tuple(image[38, 68]) == (230, 0, 0)
+        assert tuple(image[1, 1]) == (200, 215, 255)
+        # Contorno do bloco da borda recortado nos limites da imagem
+        assert tuple(image[32, 64]) == (255, 0, 255)
+        assert tuple(image[39, 64]) == (255, 0, 255)
+        assert tuple(image[32, 69]) == (255, 0, 255)